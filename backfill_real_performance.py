@@ -19,6 +19,11 @@ load_dotenv()
 # API Configuration
 API_BASE_URL = os.getenv('API_BASE_URL', 'https://wavetrend-216f065b8ba6.herokuapp.com/')
 
+# One keep-alive session for all ticker/timeframe fetches in the backfill loop
+api_session = requests.Session()
+# Fail fast on connect, but keep the 30s read allowance for slow backfill responses
+API_TIMEOUT = (float(os.getenv('API_CONNECT_TIMEOUT', '3.05')), 30)
+
 async def backfill_real_performance():
     """Backfill performance data using real historical price data"""
     
@@ -189,7 +194,7 @@ async def fetch_real_pricing_data(ticker: str, timeframe: str):
         
         print(f"   📡 API call: {ticker} {timeframe} period={period}")
         
-        response = requests.get(f"{API_BASE_URL}/api/analyzer-b", params=params, timeout=30)
+        response = api_session.get(f"{API_BASE_URL}/api/analyzer-b", params=params, timeout=API_TIMEOUT)
         
         if response.status_code == 200:
             api_data = response.json()
@@ -7,6 +7,7 @@ Ensures data quality and integrity for ML commands
 import asyncio
 import asyncpg
 import os
+import sys
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 import pandas as pd
@@ -36,16 +37,15 @@ class DataValidator:
                 "overall_score": 0.0
             }
             
-            # 1. Database Schema Validation
-            schema_results = await self.validate_database_schema()
+            # 1-3. Schema validation, data quality checks and ML readiness assessment
+            # are independent (each opens its own connection), so run them concurrently
+            schema_results, quality_results, ml_readiness = await asyncio.gather(
+                self.validate_database_schema(),
+                self.validate_data_quality(days),
+                self.assess_ml_readiness(days)
+            )
             validation_report["schema_validation"] = schema_results
-            
-            # 2. Data Quality Checks
-            quality_results = await self.validate_data_quality(days)
             validation_report["data_quality"] = quality_results
-            
-            # 3. ML Readiness Assessment
-            ml_readiness = await self.assess_ml_readiness(days)
             validation_report["ml_readiness"] = ml_readiness
             
             # 4. Generate Recommendations
@@ -80,9 +80,21 @@ class DataValidator:
                 'signal_analytics', 'signals_detected'
             ]
             
+            # Check essential indexes
+            essential_indexes = [
+                ('signal_performance', 'idx_performance_ticker_date'),
+                ('signal_notifications', 'idx_signal_date'),
+                ('signal_notifications', 'idx_ticker_timeframe')
+            ]
+            
+            # Tables, columns and indexes come back from one round-trip
+            existing_tables, table_columns, existing_indexes = await self.fetch_schema_snapshot(
+                conn, required_tables, [index for _, index in essential_indexes]
+            )
+            await conn.close()
+            
             for table in required_tables:
-                exists = await self.check_table_exists(conn, table)
-                schema_results["tables_exist"][table] = exists
+                schema_results["tables_exist"][table] = table in existing_tables
             
             # Check signal_performance table structure
             if schema_results["tables_exist"].get("signal_performance", False):
@@ -104,21 +116,11 @@ class DataValidator:
                     'success_3d': 'boolean'
                 }
                 
-                column_validation = await self.validate_table_columns(conn, 'signal_performance', required_columns)
+                column_validation = self.validate_table_columns(table_columns, 'signal_performance', required_columns)
                 schema_results["required_columns"]["signal_performance"] = column_validation
             
-            # Check essential indexes
-            essential_indexes = [
-                ('signal_performance', 'idx_performance_ticker_date'),
-                ('signal_notifications', 'idx_signal_date'),
-                ('signal_notifications', 'idx_ticker_timeframe')
-            ]
-            
             for table, index in essential_indexes:
-                index_exists = await self.check_index_exists(conn, index)
-                schema_results["indexes_exist"][f"{table}.{index}"] = index_exists
-            
-            await conn.close()
+                schema_results["indexes_exist"][f"{table}.{index}"] = index in existing_indexes
             
             # Calculate schema score
             all_tables_exist = all(schema_results["tables_exist"].values())
@@ -232,27 +234,41 @@ class DataValidator:
         except Exception as e:
             return {"error": f"ML readiness assessment failed: {e}"}
     
-    async def check_table_exists(self, conn, table_name: str) -> bool:
-        """Check if a table exists"""
-        result = await conn.fetchval('''
-            SELECT EXISTS (
-                SELECT 1 FROM information_schema.tables 
-                WHERE table_schema = 'public' 
-                AND table_name = $1
-            )
-        ''', table_name)
-        return result
+    async def fetch_schema_snapshot(self, conn, tables: List[str], indexes: List[str]) -> Tuple[set, Dict, set]:
+        """Fetch table existence, column info and index existence in a single query"""
+        rows = await conn.fetch('''
+            SELECT 't'::text AS kind, table_name::text AS table_name, NULL::text AS name,
+                   NULL::text AS data_type, NULL::text AS is_nullable
+            FROM information_schema.tables
+            WHERE table_schema = 'public' AND table_name = ANY($1::text[])
+            UNION ALL
+            SELECT 'c', table_name::text, column_name::text, data_type::text, is_nullable::text
+            FROM information_schema.columns
+            WHERE table_name = ANY($1::text[])
+            UNION ALL
+            SELECT 'i', tablename::text, indexname::text, NULL, NULL
+            FROM pg_indexes
+            WHERE indexname = ANY($2::text[])
+        ''', tables, indexes)
+        
+        existing_tables = set()
+        table_columns = {}
+        existing_indexes = set()
+        for row in rows:
+            if row['kind'] == 't':
+                existing_tables.add(row['table_name'])
+            elif row['kind'] == 'c':
+                table_columns[(row['table_name'], row['name'])] = row
+            else:
+                existing_indexes.add(row['name'])
+        return existing_tables, table_columns, existing_indexes
     
-    async def validate_table_columns(self, conn, table_name: str, required_columns: Dict) -> Dict:
+    def validate_table_columns(self, table_columns: Dict, table_name: str, required_columns: Dict) -> Dict:
         """Validate table columns against requirements"""
         column_info = {}
         
         for column_name, expected_type in required_columns.items():
-            result = await conn.fetchrow('''
-                SELECT column_name, data_type, is_nullable
-                FROM information_schema.columns
-                WHERE table_name = $1 AND column_name = $2
-            ''', table_name, column_name)
+            result = table_columns.get((table_name, column_name))
             
             if result:
                 column_info[column_name] = {
@@ -271,16 +287,6 @@ class DataValidator:
         
         return column_info
     
-    async def check_index_exists(self, conn, index_name: str) -> bool:
-        """Check if an index exists"""
-        result = await conn.fetchval('''
-            SELECT EXISTS (
-                SELECT 1 FROM pg_indexes 
-                WHERE indexname = $1
-            )
-        ''', index_name)
-        return result
-    
     async def check_data_completeness(self, conn, since_date: datetime) -> Dict:
         """Check data completeness"""
         try:
@@ -731,6 +737,9 @@ if __name__ == "__main__":
             for rec in results['recommendations']:
                 print(f"  • {rec}")
         
-        print(f"\n📋 Full Report: {json.dumps(results, indent=2, default=str)}")
+        print("\n📋 Full Report: ", end="")
+        # Stream the report instead of building the whole indented string first
+        json.dump(results, sys.stdout, indent=2, default=str)
+        print()
     
     asyncio.run(main()) 
\ No newline at end of file
@@ -2,10 +2,16 @@ import asyncio
 import asyncpg
 import os
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 import logging
 import json
 
+@lru_cache(maxsize=2048)
+def parse_signal_date(signal_date: str) -> datetime:
+    """Parse 'YYYY-MM-DD' / 'YYYY-MM-DD HH:MM:SS' signal dates (memoized; shared by the bot modules)"""
+    return datetime.fromisoformat(signal_date)
+
 class DatabaseManager:
     def __init__(self):
         self.pool = None
@@ -19,14 +25,26 @@ class DatabaseManager:
                 self.logger.error("DATABASE_URL environment variable not found")
                 return False
             
-            # Create connection pool
+            # Create connection pool sized for notification bursts while staying well under
+            # the connection limit of small hosted Postgres plans (DB_POOL_MAX_SIZE overrides).
+            # asyncpg has no pre-ping or age-based recycling: idle connections are closed after
+            # DB_POOL_MAX_INACTIVE_LIFETIME, and dead peers are detected by TCP keepalives
+            max_size = int(os.getenv('DB_POOL_MAX_SIZE', '10'))
             self.pool = await asyncpg.create_pool(
                 database_url,
-                min_size=1,
-                max_size=5,
+                min_size=min(int(os.getenv('DB_POOL_MIN_SIZE', '1')), max_size),
+                max_size=max_size,
+                max_inactive_connection_lifetime=float(os.getenv('DB_POOL_MAX_INACTIVE_LIFETIME', '1800')),
+                command_timeout=float(os.getenv('DB_COMMAND_TIMEOUT', '60')),
+                # Per-connection prepared statement cache: repeated queries with identical
+                # SQL text (duplicate checks, notification inserts) skip parse/plan
+                statement_cache_size=int(os.getenv('DB_STATEMENT_CACHE_SIZE', '100')),
                 server_settings={
                     'application_name': 'discord-signal-bot',
-                    'timezone': 'EST'
+                    'timezone': 'EST',
+                    'tcp_keepalives_idle': '30',
+                    'tcp_keepalives_interval': '10',
+                    'tcp_keepalives_count': '5'
                 }
             )
             
@@ -236,10 +254,7 @@ class DatabaseManager:
         try:
             async with self.pool.acquire() as conn:
                 # Parse signal date
-                if ' ' in signal_date:
-                    parsed_date = datetime.strptime(signal_date, '%Y-%m-%d %H:%M:%S')
-                else:
-                    parsed_date = datetime.strptime(signal_date, '%Y-%m-%d')
+                parsed_date = parse_signal_date(signal_date)
                 
                 # Insert detected signal record
                 await conn.execute('''
@@ -268,29 +283,26 @@ class DatabaseManager:
                                          signal_type: str, signal_date: str) -> bool:
         """Check if we've already sent this notification OR if the signal is too old"""
         try:
+            # Parse signal date
+            parsed_date = parse_signal_date(signal_date)
+            
+            # 🛡️ SIMPLE FIX: Block signals older than 24 hours to prevent old signals
+            # when new timeframes are added (no connection needed for this)
+            signal_age_hours = (datetime.now() - parsed_date).total_seconds() / 3600
+            if signal_age_hours > 24:
+                self.logger.info(f"🚫 Blocking old signal: {ticker} {timeframe} {signal_type} from {signal_age_hours:.1f}h ago")
+                return True  # Treat as duplicate to prevent sending
+            
             async with self.pool.acquire() as conn:
-                # Parse signal date
-                if ' ' in signal_date:
-                    parsed_date = datetime.strptime(signal_date, '%Y-%m-%d %H:%M:%S')
-                else:
-                    parsed_date = datetime.strptime(signal_date, '%Y-%m-%d')
-                
-                # 🛡️ SIMPLE FIX: Block signals older than 24 hours to prevent old signals
-                # when new timeframes are added
-                signal_age_hours = (datetime.now() - parsed_date).total_seconds() / 3600
-                if signal_age_hours > 24:
-                    self.logger.info(f"🚫 Blocking old signal: {ticker} {timeframe} {signal_type} from {signal_age_hours:.1f}h ago")
-                    return True  # Treat as duplicate to prevent sending
-                
-                # Check if notification exists
-                result = await conn.fetchval('''
-                    SELECT COUNT(*) FROM signal_notifications 
-                    WHERE ticker = $1 AND timeframe = $2 
-                    AND signal_type = $3 AND signal_date = $4
+                # Check if notification exists; EXISTS stops at the first match
+                return await conn.fetchval('''
+                    SELECT EXISTS (
+                        SELECT 1 FROM signal_notifications 
+                        WHERE ticker = $1 AND timeframe = $2 
+                        AND signal_type = $3 AND signal_date = $4
+                    )
                 ''', ticker, timeframe, signal_type, parsed_date)
                 
-                return result > 0
-                
         except Exception as e:
             self.logger.error(f"❌ Error checking duplicate: {e}")
             return False
@@ -650,7 +662,7 @@ class DatabaseManager:
                     'last_7d': last_7d,
                     'detected_24h': detected_24h,
                     'utilization_rate_24h': round((last_24h / max(detected_24h, 1)) * 100, 1),
-                    'priority_distribution': json.dumps(priority_distribution) if priority_distribution else {},
+                    'priority_distribution': priority_distribution,
                     'most_active_ticker': dict(most_active) if most_active else None,
                     'most_common_signal': dict(most_common) if most_common else None
                 }
@@ -693,6 +705,25 @@ class DatabaseManager:
             self.logger.error(f"❌ Error removing ticker from database: {e}")
             return False
 
+    async def set_active_tickers(self, tickers: List[str]) -> bool:
+        """Make exactly these tickers active in two statements (one transaction)"""
+        try:
+            async with self.pool.acquire() as conn:
+                async with conn.transaction():
+                    await conn.execute('''
+                        INSERT INTO tickers (symbol, active)
+                        SELECT unnest($1::text[]), true
+                        ON CONFLICT (symbol) DO UPDATE SET active = true
+                    ''', tickers)
+                    await conn.execute('''
+                        UPDATE tickers SET active = false
+                        WHERE active = true AND symbol <> ALL($1::text[])
+                    ''', tickers)
+                return True
+        except Exception as e:
+            self.logger.error(f"❌ Error setting active tickers: {e}")
+            return False
+
     async def get_active_tickers(self) -> List[str]:
         """Get list of active tickers from database"""
         try:
@@ -1059,10 +1090,7 @@ class DatabaseManager:
         try:
             async with self.pool.acquire() as conn:
                 # Parse signal date
-                if ' ' in signal_date:
-                    signal_dt = datetime.strptime(signal_date, '%Y-%m-%d %H:%M:%S')
-                else:
-                    signal_dt = datetime.strptime(signal_date, '%Y-%m-%d')
+                signal_dt = parse_signal_date(signal_date)
                 
                 # Calculate success for each timeframe (assuming bullish signals for now)
                 # For buy signals: success = price went up
@@ -1187,6 +1215,10 @@ async def init_database():
     """Initialize database connection"""
     return await db_manager.initialize()
 
+async def close_database():
+    """Close the database connection pool"""
+    await db_manager.close()
+
 async def check_duplicate(ticker: str, timeframe: str, signal_type: str, signal_date: str) -> bool:
     """Check if notification is duplicate"""
     return await db_manager.check_duplicate_notification(ticker, timeframe, signal_type, signal_date)
@@ -1235,6 +1267,10 @@ async def remove_ticker_from_database(ticker: str) -> bool:
     """Remove ticker from PostgreSQL database"""
     return await db_manager.remove_ticker_from_db(ticker)
 
+async def set_database_tickers(tickers: List[str]) -> bool:
+    """Replace the active ticker set in PostgreSQL database"""
+    return await db_manager.set_active_tickers(tickers)
+
 async def get_database_tickers() -> List[str]:
     """Get active tickers from PostgreSQL database"""
     return await db_manager.get_active_tickers()
@@ -9,6 +9,7 @@ import os
 import requests
 import json
 from datetime import datetime
+from itertools import islice
 from signal_notifier import SignalNotifier
 from database import db_manager, record_signal_performance
 import asyncpg
@@ -94,7 +95,7 @@ async def debug_performance_automation():
             api_data = response.json()
             print(f"✅ Got API response: {response.status_code}")
             print(f"📦 Response size: {len(response.content)} bytes")
-            print(f"🗝️ Main keys: {list(api_data.keys())[:10]}")  # First 10 keys
+            print(f"🗝️ Main keys: {list(islice(api_data, 10))}")  # First 10 keys
             
             # Test pricing data extraction
             pricing_data = notifier.extract_pricing_data_from_api(api_data)
@@ -125,7 +126,7 @@ async def debug_performance_automation():
                     if isinstance(value, list):
                         print(f"  {key}: list[{len(value)}] - {type(value[0]) if value else 'empty'}")
                     elif isinstance(value, dict):
-                        print(f"  {key}: dict with keys {list(value.keys())[:5]}")
+                        print(f"  {key}: dict with keys {list(islice(value, 5))}")
                     else:
                         print(f"  {key}: {type(value)}")
         else:
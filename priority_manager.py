@@ -10,6 +10,7 @@ from enum import Enum
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Dict, List, Set, Tuple
+from database import parse_signal_date
 
 # ✅ NEW: Database-first priority configuration
 class DatabasePriorityConfig:
@@ -25,6 +26,14 @@ class DatabasePriorityConfig:
         self.low_threshold = 30
         self.vip_tickers = set(['SPY', 'QQQ', 'AAPL', 'TSLA', 'NVDA'])
         self.vip_timeframes = set(['1d', '1h'])
+        self._vip_tickers_display = None  # Cached sorted join, reset whenever vip_tickers changes
+    
+    @property
+    def vip_tickers_display(self) -> str:
+        """Sorted, comma-separated VIP tickers; rebuilt only after the set changes"""
+        if self._vip_tickers_display is None:
+            self._vip_tickers_display = ", ".join(sorted(self.vip_tickers))
+        return self._vip_tickers_display
         
     async def load_from_database(self, config_name: str = 'default') -> bool:
         """Load priority configuration from PostgreSQL database"""
@@ -50,6 +59,7 @@ class DatabasePriorityConfig:
                     
                     # Convert database arrays to sets
                     self.vip_tickers = set(config_row['vip_tickers'] or [])
+                    self._vip_tickers_display = None
                     self.vip_timeframes = set(config_row['vip_timeframes'] or [])
                     
                     print(f"✅ Loaded priority config from database:")
@@ -84,6 +94,7 @@ class DatabasePriorityConfig:
         # Load VIP tickers from environment
         env_vip_tickers = os.getenv('VIP_TICKERS', 'SPY,QQQ,AAPL,TSLA,NVDA').split(',')
         self.vip_tickers = set(ticker.strip().upper() for ticker in env_vip_tickers if ticker.strip())
+        self._vip_tickers_display = None
         
         # Load VIP timeframes from environment
         env_vip_timeframes = os.getenv('VIP_TIMEFRAMES', '1d,1h').split(',')
@@ -143,6 +154,7 @@ class DatabasePriorityConfig:
             
         if ticker not in self.vip_tickers:
             self.vip_tickers.add(ticker)
+            self._vip_tickers_display = None
             return await self.save_to_database()
         return True
     
@@ -151,6 +163,7 @@ class DatabasePriorityConfig:
         ticker = ticker.upper().strip()
         if ticker in self.vip_tickers:
             self.vip_tickers.discard(ticker)
+            self._vip_tickers_display = None
             return await self.save_to_database()
         return True
     
@@ -191,6 +204,7 @@ class DatabasePriorityConfig:
             for invalid_ticker in validation['invalid_vips']:
                 self.vip_tickers.discard(invalid_ticker)
                 print(f"   Removed {invalid_ticker} from VIP list")
+            self._vip_tickers_display = None
             
             # Save updated configuration
             save_success = await self.save_to_database()
@@ -247,6 +261,7 @@ class SignalPriorityManager:
     def __init__(self):
         # ✅ NEW: Use database-backed configuration
         self.db_config = DatabasePriorityConfig()
+        self.config_version = 0  # Bumped whenever level/thresholds may have changed
         
         # System priority weights
         self.SYSTEM_WEIGHTS = {
@@ -277,10 +292,14 @@ class SignalPriorityManager:
             r'reversal': 12,          # Reversal patterns
             r'cross': 8               # Simple crosses
         }
+        # Compiled once; scoring runs these against every detected signal
+        self._signal_pattern_res = [(re.compile(pattern, re.IGNORECASE), bonus)
+                                    for pattern, bonus in self.SIGNAL_PATTERNS.items()]
     
     async def initialize(self):
         """Initialize priority manager with database configuration"""
         success = await self.db_config.load_from_database()
+        self.config_version += 1
         if success:
             print("✅ Priority manager initialized with database configuration")
         else:
@@ -316,6 +335,10 @@ class SignalPriorityManager:
     def VIP_TIMEFRAMES(self) -> Set[str]:
         return self.db_config.vip_timeframes
     
+    @property
+    def vip_tickers_display(self) -> str:
+        return self.db_config.vip_tickers_display
+    
     # ✅ SIMPLIFIED: Database management methods
     async def add_vip_ticker(self, ticker: str) -> bool:
         """Add VIP ticker"""
@@ -327,11 +350,15 @@ class SignalPriorityManager:
     
     async def set_min_priority_level(self, level: str) -> bool:
         """Set minimum priority level"""
-        return await self.db_config.set_min_priority_level(level)
+        success = await self.db_config.set_min_priority_level(level)
+        self.config_version += 1
+        return success
     
     async def reload_from_database(self) -> bool:
         """Reload configuration from database"""
-        return await self.db_config.load_from_database()
+        success = await self.db_config.load_from_database()
+        self.config_version += 1
+        return success
     
     def calculate_urgency(self, signal_date: str) -> Urgency:
         """Calculate urgency based on signal date"""
@@ -339,10 +366,7 @@ class SignalPriorityManager:
             return Urgency.ANCIENT
         
         try:
-            if ' ' in signal_date:
-                signal_time = datetime.strptime(signal_date, '%Y-%m-%d %H:%M:%S')
-            else:
-                signal_time = datetime.strptime(signal_date, '%Y-%m-%d')
+            signal_time = parse_signal_date(signal_date)
             
             time_diff = datetime.now() - signal_time
             hours_ago = time_diff.total_seconds() / 3600
@@ -374,8 +398,9 @@ class SignalPriorityManager:
         # System bonus
         system = signal.get('system', 'Unknown')
         system_bonus = 0
+        system_lower = system.lower()
         for system_name, weight in self.SYSTEM_WEIGHTS.items():
-            if system_name.lower() in system.lower():
+            if system_name.lower() in system_lower:
                 system_bonus = weight
                 break
         if system_bonus == 0:
@@ -394,8 +419,8 @@ class SignalPriorityManager:
         # Pattern bonus (based on signal type)
         signal_type = signal.get('type', '')
         pattern_bonus = 0
-        for pattern, bonus in self.SIGNAL_PATTERNS.items():
-            if re.search(pattern, signal_type, re.IGNORECASE):
+        for pattern_re, bonus in self._signal_pattern_res:
+            if pattern_re.search(signal_type):
                 pattern_bonus = max(pattern_bonus, bonus)
         
         # Calculate total score
@@ -5,29 +5,41 @@ Fetches signal timeline data from your local web API and sends Discord notificat
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import time
 import os
+import re
 from datetime import datetime, timedelta, timezone
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+from functools import lru_cache, partial
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, astuple
+from collections import Counter, OrderedDict, defaultdict
+from itertools import islice
 import discord
 from discord.ext import commands, tasks
 from dotenv import load_dotenv
 import pytz
 import threading
 import asyncio
+import heapq
 import aiohttp
 import sys
 import traceback
 import atexit
 from dateutil import parser
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 import asyncpg
 import numpy as np
+from aiolimiter import AsyncLimiter
 
 # Import database functionality
-from database import init_database, check_duplicate, record_notification, get_stats, cleanup_old, record_detected_signal, get_priority_analytics, get_signal_utilization, add_ticker_to_database, remove_ticker_from_database, get_database_tickers, save_vip_tickers_to_database, get_vip_tickers_from_database, save_priority_settings_to_database, update_daily_analytics, get_best_performing_signals, get_signal_performance_summary, cleanup_old_analytics, record_signal_performance
-from priority_manager import should_send_notification, get_priority_display, calculate_signal_priority, rank_signals_by_priority, priority_manager
+from database import init_database, close_database, check_duplicate, record_notification, get_stats, cleanup_old, record_detected_signal, get_priority_analytics, get_signal_utilization, add_ticker_to_database, remove_ticker_from_database, get_database_tickers, set_database_tickers, save_vip_tickers_to_database, get_vip_tickers_from_database, save_priority_settings_to_database, update_daily_analytics, get_best_performing_signals, get_signal_performance_summary, cleanup_old_analytics, record_signal_performance, parse_signal_date
+from priority_manager import should_send_notification, get_priority_display, calculate_signal_priority, rank_signals_by_priority, priority_manager, PriorityLevel
 
 # Import smart scheduler
 from smart_scheduler import SmartScheduler, create_smart_scheduler
@@ -42,12 +54,50 @@ USE_SMART_SCHEDULER = os.getenv('USE_SMART_SCHEDULER', 'true').lower() == 'true'
 DISCORD_TOKEN = os.getenv('DISCORD_TOKEN')
 CHANNEL_ID = int(os.getenv('DISCORD_CHANNEL_ID', '0'))
 
+# Railway deployment metadata (fixed for the life of the process)
+RAILWAY_ENVIRONMENT = os.getenv('RAILWAY_ENVIRONMENT')
+RAILWAY_SERVICE_NAME = os.getenv('RAILWAY_SERVICE_NAME', 'discord-bot')
+RAILWAY_REGION = os.getenv('RAILWAY_REGION', 'Unknown')
+DISCORD_WEBHOOK_URL = os.getenv('DISCORD_WEBHOOK_URL')  # Optional pre-provisioned notification webhook
+WEBHOOK_NAME = 'signals'
+
 # ✅ REMOVED: JSON file paths and configuration loading functions
 # Now using PostgreSQL database as single source of truth
 
 # Timezone setup
 EST = pytz.timezone('US/Eastern')
 
+# Logging: records are queued on the event loop and written by a background
+# listener thread, so stdout I/O never stalls a check cycle
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
+logger = logging.getLogger(__name__)
+logger.setLevel(LOG_LEVEL)
+logger.propagate = False
+_log_queue = queue.Queue(-1)
+_log_handler = logging.StreamHandler(sys.stdout)
+_log_handler.setFormatter(logging.Formatter('%(message)s'))
+_log_listener = QueueListener(_log_queue, _log_handler)
+logger.addHandler(QueueHandler(_log_queue))
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+# Discord allows 5 messages per 2 seconds per channel; bursts fill the bucket
+# and discord.py handles any 429 on its own
+notification_limiter = AsyncLimiter(5, 2)
+
+# Shared HTTP session for the analyzer API: keep-alive connections plus quick retries on blips
+api_session = requests.Session()
+_api_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=Retry(total=2, backoff_factor=0.3))
+api_session.mount('https://', _api_adapter)
+api_session.mount('http://', _api_adapter)
+
+# (connect, read) timeouts: a dead analyzer fails fast instead of stalling a ticker for 30s
+API_TIMEOUT = (float(os.getenv('API_CONNECT_TIMEOUT', '3.05')), float(os.getenv('API_READ_TIMEOUT', '10')))
+
+# Worker threads for concurrent API fetches; sized within the session's connection pool
+API_FETCH_WORKERS = int(os.getenv('API_FETCH_WORKERS', '8'))
+api_executor = ThreadPoolExecutor(max_workers=API_FETCH_WORKERS, thread_name_prefix='api-fetch')
+
 def convert_to_est(dt: datetime) -> datetime:
     """Convert datetime to EST timezone"""
     if dt.tzinfo is None:
@@ -55,26 +105,37 @@ def convert_to_est(dt: datetime) -> datetime:
         dt = pytz.UTC.localize(dt)
     return dt.astimezone(EST)
 
+def unique_signals(signals: List[Dict]) -> List[Dict]:
+    """Drop repeats of the same (type, date) signal, keeping the first; matches the notification dedupe key"""
+    seen = set()
+    unique = []
+    for signal in signals:
+        key = (signal.get('type'), signal.get('date'))
+        if key not in seen:
+            seen.add(key)
+            unique.append(signal)
+    return unique
+
+@lru_cache(maxsize=2048)
+def _signal_date_est(timestamp_str: str) -> datetime:
+    """Parse an API signal date and convert it to EST (cached; formatting and time-ago share it)"""
+    dt = parse_signal_date(timestamp_str)
+    if len(timestamp_str) <= 10:
+        # Date only (e.g., "2025-01-27")
+        # Assume market open time (9:30 AM EST) for date-only signals
+        dt = dt.replace(hour=9, minute=30)
+    return convert_to_est(dt)
+
 def format_est_timestamp(timestamp_str: str, show_time: bool = True) -> str:
     """Format timestamp string to EST with readable format"""
     if not timestamp_str:
         return "N/A"
     
     try:
-        # Parse the timestamp
-        if ' ' in timestamp_str:
-            # Full timestamp (e.g., "2025-01-27 09:30:00")
-            dt = datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S')
-        else:
-            # Date only (e.g., "2025-01-27")
-            dt = datetime.strptime(timestamp_str, '%Y-%m-%d')
-            # Assume market open time (9:30 AM EST) for date-only signals
-            dt = dt.replace(hour=9, minute=30)
-        
-        # Convert to EST
-        dt_est = convert_to_est(dt)
+        # Parse and convert to EST; the two API formats differ only in length
+        dt_est = _signal_date_est(timestamp_str)
         
-        if show_time and ' ' in timestamp_str:
+        if show_time and len(timestamp_str) > 10:
             # Show full timestamp with timezone
             return dt_est.strftime('%Y-%m-%d %I:%M:%S %p EST')
         else:
@@ -91,15 +152,8 @@ def calculate_time_ago_est(timestamp_str: str) -> str:
         return "Unknown"
     
     try:
-        # Parse the timestamp
-        if ' ' in timestamp_str:
-            dt = datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S')
-        else:
-            dt = datetime.strptime(timestamp_str, '%Y-%m-%d')
-            dt = dt.replace(hour=9, minute=30)  # Assume market open
-        
-        # Convert both to EST for comparison
-        dt_est = convert_to_est(dt)
+        # Parse and convert to EST (date-only signals assume market open)
+        dt_est = _signal_date_est(timestamp_str)
         now_est = datetime.now(EST)
         
         # Calculate difference
@@ -122,6 +176,11 @@ def calculate_time_ago_est(timestamp_str: str) -> str:
         print(f"⚠️ Error calculating time ago for '{timestamp_str}': {e}")
         return "Unknown"
 
+@lru_cache(maxsize=8)
+def _build_combos(tickers: tuple, timeframes: tuple) -> tuple:
+    """All ticker-timeframe pairs, memoized so unchanged config skips the rebuild"""
+    return tuple((ticker, timeframe) for ticker in tickers for timeframe in timeframes)
+
 # ✅ NEW: Database-based configuration management
 class DatabaseConfig:
     """Manage configuration using PostgreSQL database as single source of truth"""
@@ -136,15 +195,17 @@ class DatabaseConfig:
         """Load configuration from PostgreSQL database"""
         try:
             print("🔄 Loading configuration from PostgreSQL database...")
-            self.tickers = await get_database_tickers()
             from database import get_active_timeframes, add_active_timeframe
-            self.timeframes = await get_active_timeframes()
+            # Independent queries - run them on two pooled connections at once
+            self.tickers, self.timeframes = await asyncio.gather(
+                get_database_tickers(),
+                get_active_timeframes()
+            )
             if not self.tickers:
                 default_tickers = ['SPY', 'QQQ', 'AAPL', 'TSLA', 'NVDA']
                 print(f"📊 Initializing database with default tickers: {default_tickers}")
-                for ticker in default_tickers:
-                    await add_ticker_to_database(ticker)
-                self.tickers = default_tickers
+                if not await self.set_tickers(default_tickers):
+                    self.tickers = default_tickers  # Keep monitoring even if the write failed
             if not self.timeframes:
                 default_timeframes = ['1d', '3h', '6h']
                 print(f"⏱️ Initializing database with default timeframes: {default_timeframes}")
@@ -217,13 +278,25 @@ class DatabaseConfig:
             print(f"❌ Error removing ticker {ticker}: {e}")
             return False
     
+    async def set_tickers(self, tickers: List[str]) -> bool:
+        """Replace the monitored ticker set in one database transaction"""
+        try:
+            tickers = sorted({ticker.upper().strip() for ticker in tickers if ticker.strip()})[:self.max_tickers]
+            if not tickers:
+                return False  # Cannot remove every ticker
+            
+            success = await set_database_tickers(tickers)
+            if success:
+                self.tickers = tickers
+            return success
+            
+        except Exception as e:
+            print(f"❌ Error setting tickers: {e}")
+            return False
+    
     def get_ticker_combinations(self) -> List[tuple]:
         """Get all ticker-timeframe combinations"""
-        combinations = []
-        for ticker in self.tickers:
-            for timeframe in self.timeframes:
-                combinations.append((ticker, timeframe))
-        return combinations
+        return list(_build_combos(tuple(self.tickers), tuple(self.timeframes)))
 
     async def add_timeframe(self, timeframe: str) -> bool:
         try:
@@ -263,6 +336,16 @@ config = DatabaseConfig()
 TICKERS = []
 TIMEFRAMES = ['1d', '1h']
 TICKER_TF_COMBINATIONS = []
+TF_TO_TICKERS = {}  # timeframe -> tickers checked on it, grouped from TICKER_TF_COMBINATIONS
+TICKER_TF_DISPLAY_SHORT = ""  # First 10 combinations formatted for !config
+
+# Read-only view of the active configuration for commands; refreshed by
+# build_ticker_combinations() after every load or mutation, never by readers
+_config_snapshot = {"tickers": (), "timeframes": (), "combinations": ()}
+_config_version = 0
+
+# Built embeds for config-listing commands, keyed by (command, _config_version)
+_embed_cache = {}
 
 # Advanced per-ticker timeframes (overrides TIMEFRAMES if set)
 TICKER_TIMEFRAMES_STR = os.getenv('TICKER_TIMEFRAMES', '')
@@ -278,7 +361,7 @@ if TICKER_TIMEFRAMES_STR:
 # Build the final ticker-timeframe combinations
 def build_ticker_combinations():
     """Build ticker-timeframe combinations from current config"""
-    global TICKER_TF_COMBINATIONS, TICKERS, TIMEFRAMES
+    global TICKER_TF_COMBINATIONS, TICKERS, TIMEFRAMES, TF_TO_TICKERS, TICKER_TF_DISPLAY_SHORT, _config_version
     
     # Update global variables from config
     TICKERS = config.tickers.copy()
@@ -295,6 +378,24 @@ def build_ticker_combinations():
         # Use simple multi-timeframe (all tickers on all timeframes)
         TICKER_TF_COMBINATIONS = config.get_ticker_combinations()
         print(f"📊 Using multi-timeframe: {len(TICKERS)} tickers × {len(TIMEFRAMES)} timeframes = {len(TICKER_TF_COMBINATIONS)} combinations")
+    
+    # Group by timeframe once so the check loops don't re-derive it every cycle
+    grouped = {}
+    for ticker, timeframe in TICKER_TF_COMBINATIONS:
+        grouped.setdefault(timeframe, []).append(ticker)
+    TF_TO_TICKERS = {timeframe: tuple(tickers) for timeframe, tickers in grouped.items()}
+    
+    TICKER_TF_DISPLAY_SHORT = ", ".join(f"{ticker}({timeframe})" for ticker, timeframe in TICKER_TF_COMBINATIONS[:10])
+    if len(TICKER_TF_COMBINATIONS) > 10:
+        TICKER_TF_DISPLAY_SHORT += "..."
+    
+    _config_snapshot.update(
+        tickers=tuple(TICKERS),
+        timeframes=tuple(TIMEFRAMES),
+        combinations=tuple(TICKER_TF_COMBINATIONS)
+    )
+    _config_version += 1
+    _embed_cache.clear()
 
 # Will be built after database initialization
 MAX_SIGNAL_AGE_DAYS = int(os.getenv('MAX_SIGNAL_AGE_DAYS', '1'))
@@ -306,14 +407,161 @@ checks_completed = 0
 bot_start_time = None
 last_successful_check = None
 smart_scheduler = None  # Smart scheduler instance
-health_stats = {
-    'total_signals_found': 0,
-    'total_notifications_sent': 0,
-    'failed_checks': 0,
-    'api_errors': 0,
-    'discord_errors': 0
+
+
+@dataclass(slots=True)
+class HealthStats:
+    """Running counters for the check loops, reported by !health"""
+    total_signals_found: int = 0
+    total_notifications_sent: int = 0
+    failed_checks: int = 0
+    api_errors: int = 0
+    discord_errors: int = 0
+
+
+health_stats = HealthStats()
+
+# Notification webhook, resolved on first send (False = permanently unavailable, use the bot;
+# None = not resolved yet or the last attempt failed, retried on the next send)
+notification_webhook = None
+
+async def get_notification_webhook(channel) -> Optional[discord.Webhook]:
+    """Return the webhook used for signal notifications, creating it on first use"""
+    global notification_webhook
+    if notification_webhook is not None:
+        return notification_webhook or None
+    
+    try:
+        if DISCORD_WEBHOOK_URL:
+            notification_webhook = discord.Webhook.from_url(DISCORD_WEBHOOK_URL, session=bot.http_session)
+        elif isinstance(channel, discord.TextChannel):
+            existing = await channel.webhooks()
+            notification_webhook = next(
+                (hook for hook in existing if hook.name == WEBHOOK_NAME and hook.token),
+                None
+            ) or await channel.create_webhook(name=WEBHOOK_NAME)
+        else:
+            notification_webhook = False
+    except discord.Forbidden:
+        logger.warning("⚠️ Missing Manage Webhooks permission - sending notifications as the bot")
+        notification_webhook = False
+    except Exception as e:
+        # Transient failure (rate limit, network) - send as the bot and retry on the next send
+        logger.warning("⚠️ Could not set up notification webhook, sending as the bot: %s", e)
+        notification_webhook = None
+    
+    if notification_webhook:
+        logger.info("🪝 Sending notifications via webhook '%s'", notification_webhook.name or WEBHOOK_NAME)
+    return notification_webhook or None
+
+def reset_notification_webhook():
+    """Forget the cached webhook so the next send resolves it again"""
+    global notification_webhook
+    notification_webhook = None
+
+# Short-lived cache of processed API timelines keyed by (ticker, timeframe, minute bucket)
+SIGNAL_CACHE_TTL = 60  # seconds
+SIGNAL_CACHE_MAXSIZE = 1024
+_signal_cache = OrderedDict()
+
+def clear_signal_cache():
+    """Drop all cached signal timelines (called at the start of each check cycle)"""
+    _signal_cache.clear()
+
+# Emoji lookups shared by notification and command embeds
+SIGNAL_TYPE_EMOJIS = {
+    # Wave Trend Signals
+    'WT Buy Signal': '📈',
+    'WT Gold Buy Signal': '⭐',
+    'WT Sell Signal': '📉',
+    'WT Bullish Cross': '🟢',
+    'WT Bearish Cross': '🔴',
+    
+    # RSI3M3+ Signals (FIXED MAPPING)
+    'RSI3M3 Bullish Entry': '🟢',
+    'RSI3M3 Bearish Entry': '🔴',
+    
+    # Divergence Signals
+    'Bullish Divergence': '📈',
+    'Bearish Divergence': '📉',
+    'Hidden Bullish Divergence': '🔼',
+    'Hidden Bearish Divergence': '🔽',
+    'Bullish MF Divergence': '💚',
+    'Bearish MF Divergence': '❤️',
+    
+    # Pattern Signals
+    'Fast Money Buy': '💰',
+    'Fast Money Sell': '💸',
+    'RSI Trend Break Buy': '⬆️',
+    'RSI Trend Break Sell': '⬇️',
+    'Zero Line Reject Buy': '🚀',
+    'Zero Line Reject Sell': '📉',
+    
+    # Trend Exhaustion Signals
+    'Bear Cross Signal': '🐻',
+    'Bull Cross Signal': '🐂',
+    'Oversold Reversal': '🔄',
+    'Overbought Reversal': '🔄',
+    'Extreme Oversold': '💚',
+    'Extreme Overbought': '❤️',
+    
+    # Legacy mappings (for backward compatibility)
+    'RSI3M3 Bull': '🟢',
+    'RSI3M3 Bear': '🔴',
+    'Exhaustion Oversold': '💚',
+    'Exhaustion Overbought': '❤️',
+    'Price Breakout': '⬆️',
+    'Price Breakdown': '⬇️'
+}
+
+STRENGTH_INDICATORS = {
+    'Very Strong': '🔥🔥🔥',
+    'Strong': '🔥🔥',
+    'Moderate': '🔥',
+    'Weak': '💧'
+}
+
+# `!signals` strength badges; Gold signals always get the top badge
+SIGNAL_STRENGTH_EMOJIS = {
+    'Very Strong': '🔥🔥🔥',
+    'Strong': '🔥🔥',
+    'Moderate': '🔥'
 }
 
+@lru_cache(maxsize=512)
+def classify_signal_direction(signal_type: str) -> str:
+    """Return the bullish/bearish/neutral emoji for a signal type (cached per type)"""
+    lowered = signal_type.lower()
+    if 'buy' in lowered or 'bullish' in lowered:
+        return '🟢'
+    if 'sell' in lowered or 'bearish' in lowered:
+        return '🔴'
+    return '🟡'
+
+# Embed skeletons per priority level; only the per-signal fields are added on send
+PRIORITY_COLORS = {
+    'CRITICAL': 0xFF0000,  # Red
+    'HIGH': 0xFF6600,      # Orange  
+    'MEDIUM': 0x0099FF,    # Blue
+    'LOW': 0x00FF00,       # Green
+    'MINIMAL': 0x808080    # Gray
+}
+
+ML_PLACEHOLDER_FIELDS = (
+    {'name': " ML Success Rate", 'value': "Checking...", 'inline': True},
+    {'name': " ML Confidence", 'value': "Checking...", 'inline': True},
+    {'name': " Risk Level", 'value': "Checking...", 'inline': True}
+)
+
+# Key names that mark a list of dicts as OHLC/pricing data in !debugapi
+PRICE_KEY_INDICATORS = ('price', 'close', 'open', 'high', 'low', 'volume', 'timestamp', 'date', 'time')
+
+EMBED_TEMPLATES = {
+    level: {'type': 'rich', 'color': color}
+    for level, color in PRIORITY_COLORS.items()
+}
+DEFAULT_EMBED_TEMPLATE = {'type': 'rich', 'color': 0x0099ff}
+
 class SignalNotifier:
     def __init__(self, bot):
         self.bot = bot
@@ -323,57 +571,106 @@ class SignalNotifier:
             'api_calls': 0,
             'errors': 0
         }
+        # Database writes queued by send_signal_notification, reaped once per cycle
+        self._pending_writes = []
+        # API responses fetched ahead of the per-ticker loop, consumed by fetch_signal_timeline
+        self._prefetched = {}
+    
+    @staticmethod
+    def timeline_request_params(ticker: str, timeframe: str) -> Dict:
+        """Query parameters for the analyzer API, with the period sized to the timeframe"""
+        # Set period based on timeframe for optimal data coverage
+        if timeframe == '1d':
+            period = '1y'  # 1 year for daily data
+        elif timeframe == '1h':
+            period = '1mo'  # 1 month for hourly data
+        elif timeframe in ['15m', '30m']:
+            period = '1wk'  # 1 week for intraday timeframes (faster + more relevant)
+        elif timeframe in ['3h', '6h']:
+            period = '3mo'  # 3 months for medium hourly timeframes
+        elif timeframe in ['2d', '3d']:
+            period = '1y'  # 1 year for multi-day timeframes
+        elif timeframe == '1wk':
+            period = '5y'  # 5 years for weekly data
+        else:
+            period = '1mo'  # Default fallback (1 month)
+        
+        # Call your existing API endpoint with interval parameter (not timeframe)
+        # Also add period parameter for better data retrieval
+        return {
+            'ticker': ticker,
+            'interval': timeframe,  # Fixed: API expects 'interval', not 'timeframe'
+            'period': period  # Dynamic period based on timeframe
+        }
+    
+    async def prefetch_signal_timelines(self, pairs: List[tuple]):
+        """Fetch the API responses for many ticker/timeframe pairs concurrently on worker threads"""
+        loop = asyncio.get_running_loop()
+        self._prefetched.clear()
+        
+        async def prefetch(ticker: str, timeframe: str):
+            request = partial(api_session.get, f"{API_BASE_URL}/api/analyzer-b",
+                              params=self.timeline_request_params(ticker, timeframe), timeout=API_TIMEOUT)
+            try:
+                self._prefetched[(ticker, timeframe)] = await loop.run_in_executor(api_executor, request)
+            except Exception as e:
+                # Best-effort: fetch_signal_timeline refetches any pair missing here on its own,
+                # so no single failure (including a shut-down executor) may abort the cycle
+                logger.warning("⚠️ Prefetch failed for %s (%s): %s", ticker, timeframe, e)
+        
+        # Each distinct pair is requested once
+        pending = list(dict.fromkeys(pairs))
+        await asyncio.gather(*(prefetch(ticker, timeframe) for ticker, timeframe in pending))
+        logger.info("📡 Prefetched %s of %s API responses", len(self._prefetched), len(pending))
+    
+    def clear_prefetched(self):
+        """Drop prefetched responses that a cut-short cycle never consumed"""
+        self._prefetched.clear()
     
     def fetch_signal_timeline(self, ticker: str, timeframe: str = '1d') -> Optional[List[Dict]]:
         """Fetch signal timeline data from your web API"""
+        cache_key = (ticker, timeframe, int(time.time() // SIGNAL_CACHE_TTL))
+        cached = _signal_cache.get(cache_key)
+        if cached is not None:
+            _signal_cache.move_to_end(cache_key)
+            logger.info("♻️ Using cached signals for %s (%s)", ticker, timeframe)
+            # Callers annotate signals in place (age_hours), so hand out copies of the cached dicts
+            return [dict(signal) for signal in cached]
+        
+        prefetched = self._prefetched.pop((ticker, timeframe), None)
         try:
-            print(f"🔍 Fetching signals for {ticker} ({timeframe})...")
-            
-            # Set period based on timeframe for optimal data coverage
-            if timeframe == '1d':
-                period = '1y'  # 1 year for daily data
-            elif timeframe == '1h':
-                period = '1mo'  # 1 month for hourly data
-            elif timeframe in ['15m', '30m']:
-                period = '1wk'  # 1 week for intraday timeframes (faster + more relevant)
-            elif timeframe in ['3h', '6h']:
-                period = '3mo'  # 3 months for medium hourly timeframes
-            elif timeframe in ['2d', '3d']:
-                period = '1y'  # 1 year for multi-day timeframes
-            elif timeframe == '1wk':
-                period = '5y'  # 5 years for weekly data
+            params = self.timeline_request_params(ticker, timeframe)
+            period = params['period']
+            if prefetched is not None:
+                response = prefetched
             else:
-                period = '1mo'  # Default fallback (1 month)
-            
-            # Call your existing API endpoint with interval parameter (not timeframe)
-            # Also add period parameter for better data retrieval
-            params = {
-                'ticker': ticker,
-                'interval': timeframe,  # Fixed: API expects 'interval', not 'timeframe'
-                'period': period  # Dynamic period based on timeframe
-            }
-            response = requests.get(f"{API_BASE_URL}/api/analyzer-b", params=params, timeout=30)
+                logger.info("🔍 Fetching signals for %s (%s)...", ticker, timeframe)
+                response = api_session.get(f"{API_BASE_URL}/api/analyzer-b", params=params, timeout=API_TIMEOUT)
             
             if response.status_code == 200:
                 data = response.json()
-                print(f"✅ Received data for {ticker} ({timeframe}) with {period} period")
+                logger.info("✅ Received data for %s (%s) with %s period", ticker, timeframe, period)
                 
                 # 🆕 NEW: Auto-update performance for previous signals using API data
                 asyncio.create_task(self.auto_update_signal_performance(ticker, timeframe, data))
                 
                 # Process the data the same way your dashboard does
                 signals = self.create_signal_timeline_from_data(data, timeframe)
-                print(f"✅ Found {len(signals)} signals for {ticker} ({timeframe})")
-                return signals
+                logger.info("✅ Found %s signals for %s (%s)", len(signals), ticker, timeframe)
+                
+                _signal_cache[cache_key] = signals
+                if len(_signal_cache) > SIGNAL_CACHE_MAXSIZE:
+                    _signal_cache.popitem(last=False)
+                return [dict(signal) for signal in signals]
                 
             else:
-                print(f"❌ API returned status {response.status_code} for {ticker} ({timeframe})")
+                logger.error("❌ API returned status %s for %s (%s)", response.status_code, ticker, timeframe)
                 return []
                 
         except requests.exceptions.RequestException as e:
-            print(f"❌ Error fetching data for {ticker} ({timeframe}): {e}")
+            logger.error("❌ Error fetching data for %s (%s): %s", ticker, timeframe, e)
         except json.JSONDecodeError as e:
-            print(f"❌ Error parsing JSON response for {ticker} ({timeframe}): {e}")
+            logger.error("❌ Error parsing JSON response for %s (%s): %s", ticker, timeframe, e)
         
         return None
     
@@ -425,6 +722,8 @@ class SignalNotifier:
                     print(f"⚠️ No pricing data available in API response for {ticker}")
                     return
                 
+                price_series = self.build_price_series(pricing_data)
+                
                 # Update performance for each pending signal
                 for signal in pending_signals:
                     try:
@@ -433,7 +732,7 @@ class SignalNotifier:
                         
                         # Calculate performance using API pricing data
                         performance = self.calculate_performance_from_pricing(
-                            signal_datetime, pricing_data, timeframe
+                            signal_datetime, pricing_data, timeframe, price_series
                         )
                         
                         if performance and performance.get('price_at_signal'):
@@ -539,14 +838,19 @@ class SignalNotifier:
             print(f"⚠️ Error extracting pricing data: {e}")
             return None
     
-    def calculate_performance_from_pricing(self, signal_datetime: datetime, pricing_data: List[Dict], timeframe: str) -> Optional[Dict]:
+    def calculate_performance_from_pricing(self, signal_datetime: datetime, pricing_data: List[Dict], timeframe: str,
+                                           price_series: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None) -> Optional[Dict]:
         """Calculate signal performance using pricing data"""
         try:
             if not pricing_data:
                 return None
             
+            # Parse the timestamps once for all five lookups below
+            if price_series is None:
+                price_series = self.build_price_series(pricing_data)
+            
             # Find the price closest to signal time
-            signal_price = self.find_closest_price(signal_datetime, pricing_data)
+            signal_price = self.find_closest_price(signal_datetime, pricing_data, price_series)
             if not signal_price:
                 return None
             
@@ -560,10 +864,10 @@ class SignalNotifier:
             # Find prices at target times
             performance = {
                 'price_at_signal': signal_price,
-                'price_after_1h': self.find_closest_price(target_1h, pricing_data),
-                'price_after_3h': self.find_closest_price(target_3h, pricing_data),
-                'price_after_6h': self.find_closest_price(target_6h, pricing_data),
-                'price_after_1d': self.find_closest_price(target_1d, pricing_data)
+                'price_after_1h': self.find_closest_price(target_1h, pricing_data, price_series),
+                'price_after_3h': self.find_closest_price(target_3h, pricing_data, price_series),
+                'price_after_6h': self.find_closest_price(target_6h, pricing_data, price_series),
+                'price_after_1d': self.find_closest_price(target_1d, pricing_data, price_series)
             }
             
             return performance
@@ -572,72 +876,106 @@ class SignalNotifier:
             print(f"⚠️ Error calculating performance: {e}")
             return None
     
-    def find_closest_price(self, target_datetime: datetime, pricing_data: List[Dict]) -> Optional[float]:
+    @staticmethod
+    def _parse_price_point(data_point: Dict) -> Optional[Tuple[datetime, float]]:
+        """Pull a (timestamp, close price) pair out of one pricing data point"""
+        # Handle different timestamp formats in API data
+        timestamp = None
+        price = None
+        
+        # 🎯 PRIMARY: OHLC format from API (confirmed structure)
+        if 't' in data_point and 'c' in data_point:
+            timestamp = data_point['t']  # Date in format "2025-05-28"
+            price = data_point['c']      # Close price
+        
+        # 🎯 SECONDARY: Alternative OHLC formats
+        elif 'date' in data_point and 'close' in data_point:
+            timestamp = data_point['date']
+            price = data_point['close']
+        elif 'timestamp' in data_point and 'price' in data_point:
+            timestamp = data_point['timestamp']
+            price = data_point['price']
+        elif 'time' in data_point and 'value' in data_point:
+            timestamp = data_point['time']
+            price = data_point['value']
+        elif 'datetime' in data_point and 'close' in data_point:
+            timestamp = data_point['datetime']
+            price = data_point['close']
+        
+        if not timestamp or price is None:
+            return None
+        
+        try:
+            # Parse timestamp from API format
+            if isinstance(timestamp, str):
+                if 'T' in timestamp:
+                    # ISO format: "2025-05-28T09:30:00Z"
+                    dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+                elif ' ' in timestamp:
+                    # Full datetime: "2025-05-28 09:30:00"
+                    dt = datetime.fromisoformat(timestamp)
+                else:
+                    # Date only: "2025-05-28" (common in API response)
+                    dt = datetime.fromisoformat(timestamp)
+                    # For daily data, assume market close time (4 PM EST)
+                    dt = dt.replace(hour=16, minute=0, second=0)
+            elif isinstance(timestamp, (int, float)):
+                # Unix timestamp
+                dt = datetime.fromtimestamp(timestamp)
+            else:
+                return None
+            return dt, float(price)
+        except (ValueError, TypeError):
+            return None
+    
+    def build_price_series(self, pricing_data: List[Dict]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Parse pricing data once into parallel datetime64/price/is-aware arrays for closest-price lookups"""
+        times = []
+        prices = []
+        aware = []
+        for data_point in pricing_data or ():
+            if not isinstance(data_point, dict):
+                continue
+            parsed = self._parse_price_point(data_point)
+            if parsed is None:
+                continue
+            dt, price = parsed
+            # Aware timestamps are stored as naive UTC and flagged, since naive and
+            # aware datetimes can't be compared with each other
+            is_aware = dt.tzinfo is not None
+            if is_aware:
+                dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+            times.append(dt)
+            prices.append(price)
+            aware.append(is_aware)
+        return (np.array(times, dtype='datetime64[us]'), np.array(prices, dtype=float),
+                np.array(aware, dtype=bool))
+    
+    def find_closest_price(self, target_datetime: datetime, pricing_data: List[Dict],
+                           price_series: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None) -> Optional[float]:
         """Find the price closest to target datetime"""
         try:
             if not pricing_data:
                 return None
             
+            times, prices, aware = price_series if price_series is not None else self.build_price_series(pricing_data)
+            
+            # Only points of the same kind (naive/aware) as the target are comparable
+            if target_datetime.tzinfo is not None:
+                target_datetime = target_datetime.astimezone(timezone.utc).replace(tzinfo=None)
+                times, prices = times[aware], prices[aware]
+            else:
+                times, prices = times[~aware], prices[~aware]
+            
             closest_price = None
             closest_diff = float('inf')
             
-            for data_point in pricing_data:
-                if not isinstance(data_point, dict):
-                    continue
-                    
-                # Handle different timestamp formats in API data
-                timestamp = None
-                price = None
-                
-                # 🎯 PRIMARY: OHLC format from API (confirmed structure)
-                if 't' in data_point and 'c' in data_point:
-                    timestamp = data_point['t']  # Date in format "2025-05-28"
-                    price = data_point['c']      # Close price
-                
-                # 🎯 SECONDARY: Alternative OHLC formats
-                elif 'date' in data_point and 'close' in data_point:
-                    timestamp = data_point['date']
-                    price = data_point['close']
-                elif 'timestamp' in data_point and 'price' in data_point:
-                    timestamp = data_point['timestamp']
-                    price = data_point['price']
-                elif 'time' in data_point and 'value' in data_point:
-                    timestamp = data_point['time']
-                    price = data_point['value']
-                elif 'datetime' in data_point and 'close' in data_point:
-                    timestamp = data_point['datetime']
-                    price = data_point['close']
-                
-                if timestamp and price is not None:
-                    try:
-                        # Parse timestamp from API format
-                        if isinstance(timestamp, str):
-                            if 'T' in timestamp:
-                                # ISO format: "2025-05-28T09:30:00Z"
-                                dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                            elif ' ' in timestamp:
-                                # Full datetime: "2025-05-28 09:30:00"
-                                dt = datetime.strptime(timestamp, '%Y-%m-%d %H:%M:%S')
-                            else:
-                                # Date only: "2025-05-28" (common in API response)
-                                dt = datetime.strptime(timestamp, '%Y-%m-%d')
-                                # For daily data, assume market close time (4 PM EST)
-                                dt = dt.replace(hour=16, minute=0, second=0)
-                        elif isinstance(timestamp, (int, float)):
-                            # Unix timestamp
-                            dt = datetime.fromtimestamp(timestamp)
-                        else:
-                            continue
-                        
-                        # Calculate time difference
-                        diff = abs((target_datetime - dt).total_seconds())
-                        
-                        if diff < closest_diff:
-                            closest_diff = diff
-                            closest_price = float(price)
-                            
-                    except (ValueError, TypeError) as e:
-                        continue
+            if len(times):
+                # Vectorized distance to every data point; argmin keeps the first of equal matches
+                diffs = np.abs((times - np.datetime64(target_datetime, 'us')) / np.timedelta64(1, 's'))
+                idx = int(np.argmin(diffs))
+                closest_diff = float(diffs[idx])
+                closest_price = float(prices[idx])
             
             # 🎯 ENHANCED: More generous time tolerance for daily data
             # Daily data: 24 hours tolerance (signals can be from any time of day)
@@ -669,12 +1007,8 @@ class SignalNotifier:
             if not signal_date:
                 return 999
             try:
-                # Handle both date formats
-                if ' ' in signal_date:
-                    parsed_date = datetime.strptime(signal_date, '%Y-%m-%d %H:%M:%S')
-                else:
-                    parsed_date = datetime.strptime(signal_date, '%Y-%m-%d')
-                return (current_date - parsed_date).days
+                # Handles both date formats
+                return (current_date - parse_signal_date(signal_date)).days
             except (ValueError, TypeError) as e:
                 print(f"⚠️ Date parsing error for '{signal_date}': {e}")
                 return 999
@@ -1066,10 +1400,10 @@ class SignalNotifier:
                 
                 if ' ' in date_str:
                     # Full timestamp (e.g., "2025-01-27 14:30:00")
-                    return datetime.strptime(date_str, '%Y-%m-%d %H:%M:%S')
+                    return datetime.fromisoformat(date_str)
                 else:
                     # Date only (e.g., "2025-01-27") - assume end of day for better sorting
-                    base_date = datetime.strptime(date_str, '%Y-%m-%d')
+                    base_date = datetime.fromisoformat(date_str)
                     return base_date.replace(hour=23, minute=59, second=59)
             except (ValueError, TypeError):
                 return datetime.min
@@ -1077,82 +1411,84 @@ class SignalNotifier:
         all_signals.sort(key=get_signal_datetime, reverse=True)
         
         # Create summary by system
-        system_counts = {}
-        for signal in all_signals:
-            system = signal['system']
-            system_counts[system] = system_counts.get(system, 0) + 1
+        system_counts = Counter(signal['system'] for signal in all_signals)
         
-        print(f"🎯 Total API-provided signals found: {len(all_signals)}")
-        if system_counts:
-            print(f"Signal breakdown by system:")
-            for system, count in system_counts.items():
-                print(f"  - {system}: {count}")
+        if logger.isEnabledFor(logging.INFO):
+            summary = [f"🎯 Total API-provided signals found: {len(all_signals)}"]
+            if system_counts:
+                summary.append("Signal breakdown by system:")
+                summary.extend(f"  - {system}: {count}" for system, count in system_counts.items())
+            logger.info("\n".join(summary))
         
         return all_signals
     
     def check_for_new_signals(self, ticker: str, timeframe: str = '1d') -> List[Dict]:
         """Check for new signals using comprehensive detection with timeframe-specific filtering"""
         try:
-            print(f"🔍 Checking for new signals: {ticker} ({timeframe})")
+            logger.info("🔍 Checking for new signals: %s (%s)", ticker, timeframe)
             
             # Fetch signal timeline data
             signals = self.fetch_signal_timeline(ticker, timeframe)
             if not signals:
-                print(f"⚠️ No signals found for {ticker} ({timeframe})")
+                logger.info("⚠️ No signals found for %s (%s)", ticker, timeframe)
                 return []
             
             # Filter for recent signals based on timeframe
             recent_signals = []
             current_datetime = datetime.now()
+            # Per-ticker report lines, built only when INFO is enabled and logged as one record
+            verbose = logger.isEnabledFor(logging.INFO)
+            report = []
             
             # Set time window based on timeframe
             if timeframe == '1h':
                 max_hours_ago = 0.83  # 50 minutes - balance between timeliness and API delay tolerance
-                print(f" Filtering for signals within last {max_hours_ago * 60:.0f} minutes")
+                if verbose:
+                    report.append(f" Filtering for signals within last {max_hours_ago * 60:.0f} minutes")
             else:
                 max_hours_ago = 2.83
-                print(f" Filtering for signals within last {max_hours_ago * 60:.0f} minutes")
-                print(f"📅 Filtering for signals within last {max_hours_ago} hours")
+                if verbose:
+                    report.append(f" Filtering for signals within last {max_hours_ago * 60:.0f} minutes")
+                    report.append(f"📅 Filtering for signals within last {max_hours_ago} hours")
+            max_age = timedelta(hours=max_hours_ago)
+            # ISO dates sort as strings: anything dated before the cutoff day is too old to parse
+            cutoff_day = (current_datetime - max_age).strftime('%Y-%m-%d')
             
             for signal in signals:
                 signal_date_str = signal.get('date', '')
-                if not signal_date_str:
+                if not signal_date_str or signal_date_str[:10] < cutoff_day:
                     continue
                 
                 try:
-                    # Handle different date formats
-                    if ' ' in signal_date_str:
-                        signal_datetime = datetime.strptime(signal_date_str, '%Y-%m-%d %H:%M:%S')
-                    else:
-                        signal_datetime = datetime.strptime(signal_date_str, '%Y-%m-%d')
+                    # Handle different date formats ('YYYY-MM-DD HH:MM:SS' or 'YYYY-MM-DD')
+                    signal_datetime = parse_signal_date(signal_date_str)
+                    if ' ' not in signal_date_str:
                         # For daily signals, set time to market close (4 PM EST)
                         signal_datetime = signal_datetime.replace(hour=16)
                     
                     # Calculate age of signal
                     time_diff = current_datetime - signal_datetime
                     
-                    if timeframe == '1h':
-                        is_recent = time_diff.total_seconds() <= (max_hours_ago * 3600)
-                    else:
-                        is_recent = time_diff.total_seconds() <= (max_hours_ago * 3600)
-                    
-                    if is_recent:
+                    if time_diff <= max_age:
                         signal['age_hours'] = time_diff.total_seconds() / 3600
                         recent_signals.append(signal)
                         
                         # Enhanced debug info
-                        age_str = f"{time_diff.total_seconds()/3600:.1f}h"
-                        print(f"   ✅ {signal.get('type', 'Unknown')} ({signal.get('strength', 'Unknown')}) - {age_str} ago")
+                        if verbose:
+                            report.append(f"   ✅ {signal.get('type', 'Unknown')} ({signal.get('strength', 'Unknown')}) - {signal['age_hours']:.1f}h ago")
                     
                 except Exception as e:
-                    print(f"⚠️ Error parsing signal date '{signal_date_str}': {e}")
+                    if verbose:
+                        report.append(f"⚠️ Error parsing signal date '{signal_date_str}': {e}")
                     continue
             
-            print(f"📊 Found {len(recent_signals)} recent signals out of {len(signals)} total")
+            if verbose:
+                report.append(f"📊 Found {len(recent_signals)} recent signals out of {len(signals)} total")
+                logger.info("\n".join(report))
             return recent_signals
             
         except Exception as e:
-            print(f"❌ Error checking for new signals: {e}")
+            logger.warning("❌ Error checking for new signals: %s", e)
             return []
 
     async def should_notify(self, signal: Dict, ticker: str, timeframe: str) -> bool:
@@ -1202,15 +1538,17 @@ class SignalNotifier:
                 # Don't send high-risk signals with low success probability
                 if risk_level == 'high' and success_prob < 0.4:
                     # ml_should_send = False  # COMMENTED OUT FOR TESTING
-                    print(f"🤖 ML Filter: Blocking high-risk signal {ticker} {signal_type} - {success_prob*100:.1f}% success, {risk_level} risk")
+                    logger.info("🤖 ML Filter: Blocking high-risk signal %s %s - %.1f%% success, %s risk",
+                                ticker, signal_type, success_prob * 100, risk_level)
                 
                 # Boost high-confidence, high-success signals
                 elif success_prob >= 0.7 and confidence == 'high':
                     ml_should_send = True
-                    print(f"🤖 ML Boost: Promoting high-confidence signal {ticker} {signal_type} - {success_prob*100:.1f}% success")
+                    logger.info("🤖 ML Boost: Promoting high-confidence signal %s %s - %.1f%% success",
+                                ticker, signal_type, success_prob * 100)
                 
         except Exception as e:
-            print(f"⚠️ ML filtering failed for {ticker}: {e}")
+            logger.warning("⚠️ ML filtering failed for %s: %s", ticker, e)
             # Continue with regular filtering if ML fails
         
         # Check for duplicate in database
@@ -1259,70 +1597,26 @@ class SignalNotifier:
             }
         )
         
-        if will_send:
+        if logger.isEnabledFor(logging.INFO):
             ml_info = f" | ML: {ml_prediction['success_probability']*100:.1f}%" if ml_prediction else ""
-            print(f"🎯 Priority notification: {ticker} {signal_type} - Priority: {priority_score.priority_level.name} (Score: {priority_score.total_score}){ml_info}")
-        else:
-            ml_info = f" | ML: {ml_prediction['success_probability']*100:.1f}%" if ml_prediction else ""
-            print(f"⏸️ Skipped signal: {ticker} {signal_type} - Priority: {priority_score.priority_level.name} (Score: {priority_score.total_score}){ml_info} - Reason: {skip_reason}")
+            if will_send:
+                logger.info("🎯 Priority notification: %s %s - Priority: %s (Score: %s)%s",
+                            ticker, signal_type, priority_score.priority_level.name,
+                            priority_score.total_score, ml_info)
+            else:
+                logger.info("⏸️ Skipped signal: %s %s - Priority: %s (Score: %s)%s - Reason: %s",
+                            ticker, signal_type, priority_score.priority_level.name,
+                            priority_score.total_score, ml_info, skip_reason)
         
         return will_send
     
     def format_signal_for_discord(self, signal: Dict, ticker: str, timeframe: str = '1d') -> str:
         """Format a signal for Discord notification with EST timestamps"""
         # Get emoji based on signal type
-        emoji = {
-            # Wave Trend Signals
-            'WT Buy Signal': '📈',
-            'WT Gold Buy Signal': '⭐',
-            'WT Sell Signal': '📉',
-            'WT Bullish Cross': '🟢',
-            'WT Bearish Cross': '🔴',
-            
-            # RSI3M3+ Signals (FIXED MAPPING)
-            'RSI3M3 Bullish Entry': '🟢',
-            'RSI3M3 Bearish Entry': '🔴',
-            
-            # Divergence Signals
-            'Bullish Divergence': '📈',
-            'Bearish Divergence': '📉',
-            'Hidden Bullish Divergence': '🔼',
-            'Hidden Bearish Divergence': '🔽',
-            'Bullish MF Divergence': '💚',
-            'Bearish MF Divergence': '❤️',
-            
-            # Pattern Signals
-            'Fast Money Buy': '💰',
-            'Fast Money Sell': '💸',
-            'RSI Trend Break Buy': '⬆️',
-            'RSI Trend Break Sell': '⬇️',
-            'Zero Line Reject Buy': '🚀',
-            'Zero Line Reject Sell': '📉',
-            
-            # Trend Exhaustion Signals
-            'Bear Cross Signal': '🐻',
-            'Bull Cross Signal': '🐂',
-            'Oversold Reversal': '🔄',
-            'Overbought Reversal': '🔄',
-            'Extreme Oversold': '💚',
-            'Extreme Overbought': '❤️',
-            
-            # Legacy mappings (for backward compatibility)
-            'RSI3M3 Bull': '🟢',
-            'RSI3M3 Bear': '🔴',
-            'Exhaustion Oversold': '💚',
-            'Exhaustion Overbought': '❤️',
-            'Price Breakout': '⬆️',
-            'Price Breakdown': '⬇️'
-        }.get(signal.get('type', ''), '🔔')
+        emoji = SIGNAL_TYPE_EMOJIS.get(signal.get('type', ''), '🔔')
         
         # Get strength indicator
-        strength_indicator = {
-            'Very Strong': '🔥🔥🔥',
-            'Strong': '🔥🔥',
-            'Moderate': '🔥',
-            'Weak': '💧'
-        }.get(signal.get('strength', ''), '')
+        strength_indicator = STRENGTH_INDICATORS.get(signal.get('strength', ''), '')
         
         # Get signal date and format timing in EST
         signal_date = signal.get('date', '')
@@ -1354,12 +1648,15 @@ class SignalNotifier:
 {time_info}{timestamp_display}
         """.strip()
 
-    async def send_signal_notification(self, signal: Dict, ticker: str, timeframe: str):
-        """Send a signal notification to Discord with priority information"""
+    async def send_signal_notification(self, signal: Dict, ticker: str, timeframe: str, now: Optional[datetime] = None):
+        """Send a signal notification to Discord with priority information
+
+        `now` lets the scheduler pass its cycle timestamp instead of re-reading the clock.
+        """
         try:
             channel = self.bot.get_channel(CHANNEL_ID)
             if not channel:
-                print(f"❌ Channel {CHANNEL_ID} not found")
+                logger.error("❌ Channel %s not found", CHANNEL_ID)
                 return
             
             # Calculate priority score for display
@@ -1376,13 +1673,13 @@ class SignalNotifier:
                     recent_data = signal_timeline[-1] if signal_timeline else None
                     if recent_data and 'price' in recent_data:
                         current_price = float(recent_data['price'])
-                        print(f"📊 Captured current price for {ticker}: ${current_price:.4f}")
+                        logger.info("📊 Captured current price for %s: $%.4f", ticker, current_price)
                     else:
-                        print(f"⚠️ Could not extract current price from API data for {ticker}")
+                        logger.warning("⚠️ Could not extract current price from API data for %s", ticker)
                 else:
-                    print(f"⚠️ No signal timeline data available for {ticker}")
+                    logger.warning("⚠️ No signal timeline data available for %s", ticker)
             except Exception as e:
-                print(f"⚠️ Error capturing current price for {ticker}: {e}")
+                logger.warning("⚠️ Error capturing current price for %s: %s", ticker, e)
                 # Continue without price - we'll backfill later
             
             # Format the signal message
@@ -1391,74 +1688,48 @@ class SignalNotifier:
             # Add priority information to message
             message += f"\n{priority_display}"
             
-            # Determine embed color based on priority level
-            priority_colors = {
-                'CRITICAL': 0xFF0000,  # Red
-                'HIGH': 0xFF6600,      # Orange  
-                'MEDIUM': 0x0099FF,    # Blue
-                'LOW': 0x00FF00,       # Green
-                'MINIMAL': 0x808080    # Gray
-            }
-            
-            color = priority_colors.get(priority_score.priority_level.name, 0x0099ff)
-            
-            # Create Discord embed
-            embed = discord.Embed(
-                title=f"🚨 Signal Alert: {ticker} ({timeframe})",
-                description=message,
-                color=color,
-                timestamp=datetime.now(EST)
-            )
-            
-            # Add system and strength as fields
-            embed.add_field(
-                name="System", 
-                value=signal.get('system', 'Unknown'), 
-                inline=True
-            )
-            embed.add_field(
-                name="Strength", 
-                value=signal.get('strength', 'Unknown'), 
-                inline=True
-            )
-            embed.add_field(
-                name="Priority Score",
-                value=f"{priority_score.total_score} ({priority_score.priority_level.name})",
-                inline=True
-            )
+            # Build the embed from the cached per-priority skeleton
+            fields = [
+                {'name': "System", 'value': signal.get('system', 'Unknown'), 'inline': True},
+                {'name': "Strength", 'value': signal.get('strength', 'Unknown'), 'inline': True},
+                {'name': "Priority Score", 'value': f"{priority_score.total_score} ({priority_score.priority_level.name})", 'inline': True}
+            ]
             
             # Add current price if captured
             if current_price:
-                embed.add_field(
-                    name="Price at Signal",
-                    value=f"${current_price:.4f}",
-                    inline=True
-                )
+                fields.append({'name': "Price at Signal", 'value': f"${current_price:.4f}", 'inline': True})
             
-            # Send message and get the message object
-            
-            #  NEW: Add ML Prediction scores 
             # TODO: Get actual ML prediction
-            embed.add_field(
-                name=" ML Success Rate",
-                value="Checking...",
-                inline=True
-            )
-            embed.add_field(
-                name=" ML Confidence",
-                value="Checking...",
-                inline=True
-            )
-            embed.add_field(
-                name=" Risk Level",
-                value="Checking...",
-                inline=True
-            )
-            discord_message = await channel.send(embed=embed)
-            print(f"📤 Sent priority notification: {ticker} ({timeframe}) - {signal.get('type', 'Unknown')} [Priority: {priority_score.priority_level.name}]")
-            
-            # Record this notification in the database with enhanced priority tracking and current price
-            success = await record_notification(
+            fields.extend(dict(field) for field in ML_PLACEHOLDER_FIELDS)
+            
+            template = EMBED_TEMPLATES.get(priority_score.priority_level.name, DEFAULT_EMBED_TEMPLATE)
+            embed = discord.Embed.from_dict({
+                **template,
+                'title': f"🚨 Signal Alert: {ticker} ({timeframe})",
+                'description': message,
+                'fields': fields
+            })
+            embed.timestamp = now or datetime.now(EST)
+            
+            # Webhooks have their own rate-limit bucket, separate from the bot's sends
+            webhook = await get_notification_webhook(channel)
+            discord_message = None
+            if webhook:
+                try:
+                    discord_message = await webhook.send(embed=embed, wait=True)
+                except (discord.NotFound, discord.Unauthorized) as e:
+                    # Webhook was deleted or its token revoked - drop the cached one so the
+                    # next send resolves it again, and deliver this alert as the bot
+                    reset_notification_webhook()
+                    logger.warning("⚠️ Notification webhook no longer valid, sending as the bot: %s", e)
+            if discord_message is None:
+                discord_message = await channel.send(embed=embed)
+            logger.info("📤 Sent priority notification: %s (%s) - %s [Priority: %s]",
+                        ticker, timeframe, signal.get('type', 'Unknown'), priority_score.priority_level.name)
+            
+            # Record this notification in the background so the DB round-trip
+            # overlaps with the next send; results are reaped by flush_pending_writes()
+            write = asyncio.create_task(record_notification(
                 ticker=ticker,
                 timeframe=timeframe,
                 signal_type=signal.get('type', ''),
@@ -1473,18 +1744,34 @@ class SignalNotifier:
                 urgency_bonus=priority_score.urgency_bonus,
                 pattern_bonus=priority_score.pattern_bonus,
                 price_at_signal=current_price
-            )
-            
-            if success:
-                self.stats['signals_sent'] += 1
-                print(f"💾 Recorded notification in database with price: ${current_price:.4f}" if current_price else "💾 Recorded notification in database (price capture failed)")
-            else:
-                print(f"⚠️ Failed to record notification in database")
+            ))
+            # Only count notifications that were also recorded, as before the write moved off-path
+            write.add_done_callback(self._count_recorded_notification)
+            self._pending_writes.append(write)
             
         except Exception as e:
-            print(f"❌ Error sending notification: {e}")
+            logger.error("❌ Error sending notification: %s", e)
             self.stats['errors'] += 1
 
+    def _count_recorded_notification(self, write: asyncio.Task):
+        """Done-callback for a background record_notification task"""
+        if not write.cancelled() and write.exception() is None and write.result():
+            self.stats['signals_sent'] += 1
+
+    async def flush_pending_writes(self):
+        """Wait for queued notification records and report any database failures"""
+        if not self._pending_writes:
+            return
+        
+        pending, self._pending_writes = self._pending_writes, []
+        results = await asyncio.gather(*pending, return_exceptions=True)
+        failed = sum(1 for result in results if result is not True)
+        
+        if failed:
+            logger.warning("⚠️ Failed to record %s of %s notifications in database", failed, len(results))
+        else:
+            logger.info("💾 Recorded %s notifications in database", len(results))
+
     async def cleanup_old_notifications(self, days: int = 30) -> int:
         """Clean up old notifications using database cleanup function"""
         try:
@@ -1503,96 +1790,164 @@ def start_health_server():
 # Discord Bot Setup
 intents = discord.Intents.default()
 intents.message_content = True
-bot = commands.Bot(command_prefix='!', intents=intents)
+class SignalBot(commands.Bot):
+    """Bot with a shared aiohttp session for async HTTP calls from commands"""
+    
+    http_session: Optional[aiohttp.ClientSession] = None
+    
+    async def setup_hook(self):
+        self.http_session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10))
+    
+    async def close(self):
+        if self.http_session and not self.http_session.closed:
+            await self.http_session.close()
+        await close_database()
+        await super().close()
+
+bot = SignalBot(command_prefix='!', intents=intents)
+
+# One notifier shared by the check loops and commands; its pending writes are flushed every cycle
+_notifier_singleton: Optional[SignalNotifier] = None
+
+def _get_notifier(bot) -> SignalNotifier:
+    """Return the shared SignalNotifier, creating it on first use"""
+    global _notifier_singleton
+    if _notifier_singleton is None or _notifier_singleton.bot is not bot:
+        _notifier_singleton = SignalNotifier(bot)
+    return _notifier_singleton
+
+# Presence updates are a rate-limited gateway op; only send real changes, and hold a
+# change that arrives too soon as pending so the latest text still gets applied
+PRESENCE_MIN_INTERVAL = 15  # seconds
+_last_status_text = None
+_last_presence_update = 0.0
+_pending_status_text = None
+_presence_task = None
+
+async def _apply_presence(status_text: str):
+    global _last_status_text, _last_presence_update
+    await bot.change_presence(
+        activity=discord.Activity(
+            type=discord.ActivityType.watching,
+            name=status_text
+        )
+    )
+    _last_status_text = status_text
+    _last_presence_update = time.monotonic()
+
+async def _flush_pending_presence(delay: float):
+    """Apply the most recent pending status once the interval has passed"""
+    global _pending_status_text
+    await asyncio.sleep(delay)
+    status_text, _pending_status_text = _pending_status_text, None
+    if status_text is None or status_text == _last_status_text:
+        return
+    try:
+        await _apply_presence(status_text)
+    except Exception as e:
+        logger.warning("⚠️ Could not update presence: %s", e)
+
+async def update_presence(status_text: str):
+    """Set the bot's watching status, skipping unchanged text and deferring too-frequent updates"""
+    global _pending_status_text, _presence_task
+    if status_text == _last_status_text:
+        _pending_status_text = None
+        return
+    
+    delay = PRESENCE_MIN_INTERVAL - (time.monotonic() - _last_presence_update)
+    if delay <= 0:
+        _pending_status_text = None
+        await _apply_presence(status_text)
+        return
+    
+    # Too soon after the last update - keep only the newest text, one delayed task applies it
+    _pending_status_text = status_text
+    if _presence_task is None or _presence_task.done():
+        _presence_task = asyncio.create_task(_flush_pending_presence(delay))
 
 @bot.event
 async def on_ready():
     global loop_start_time, bot_start_time, smart_scheduler, config
     bot_start_time = datetime.now(EST)
-    print(f'🤖 {bot.user} has connected to Discord!')
-    print(f"🚀 Bot started at: {bot_start_time.strftime('%Y-%m-%d %I:%M:%S %p EST')}")
+    logger.info("🤖 %s has connected to Discord!", bot.user)
+    logger.info("🚀 Bot started at: %s", bot_start_time.strftime('%Y-%m-%d %I:%M:%S %p EST'))
     
     # Initialize database connection
-    print("🗄️ Initializing database connection...")
+    logger.info("🗄️ Initializing database connection...")
     db_success = await init_database()
     if db_success:
-        print("✅ Database connection established successfully")
+        logger.info("✅ Database connection established successfully")
         
         # ✅ NEW: Load configuration from database
-        print("🔄 Loading configuration from database...")
+        logger.info("🔄 Loading configuration from database...")
         config_success = await config.load_from_database()
         if config_success:
-            print("✅ Configuration loaded from PostgreSQL database")
+            logger.info("✅ Configuration loaded from PostgreSQL database")
         else:
-            print("⚠️ Using fallback configuration from environment variables")
+            logger.warning("⚠️ Using fallback configuration from environment variables")
         
         # Build ticker combinations after loading config
         build_ticker_combinations()
         
         # Display loaded configuration
-        print(f"📊 Loaded configuration:")
-        print(f"   Ticker-Timeframe Combinations: {len(TICKER_TF_COMBINATIONS)}")
-        for ticker, tf in TICKER_TF_COMBINATIONS[:10]:  # Show first 10
-            print(f"   • {ticker} ({tf})")
-        if len(TICKER_TF_COMBINATIONS) > 10:
-            print(f"   ... and {len(TICKER_TF_COMBINATIONS) - 10} more")
-        print(f"   Max signal age: {MAX_SIGNAL_AGE_DAYS} days")
-        print(f"   Strong signals only: {ONLY_STRONG_SIGNALS}")
+        logger.info("📊 Loaded configuration:")
+        logger.info("   Max signal age: %s days", MAX_SIGNAL_AGE_DAYS)
+        logger.info("   Strong signals only: %s", ONLY_STRONG_SIGNALS)
         
         # ✅ NEW: Initialize database-backed priority manager
-        print("🎯 Initializing priority manager with database...")
+        logger.info("🎯 Initializing priority manager with database...")
         priority_success = await priority_manager.initialize()
         if priority_success:
-            print("✅ Priority manager initialized with database configuration")
+            logger.info("✅ Priority manager initialized with database configuration")
         else:
-            print("⚠️ Priority manager using environment fallback configuration")
+            logger.warning("⚠️ Priority manager using environment fallback configuration")
     else:
-        print("❌ Failed to initialize database - notifications will not work properly")
+        logger.error("❌ Failed to initialize database - notifications will not work properly")
         # Still load fallback config
         config.load_from_environment()
         priority_manager.db_config.load_from_environment()
         build_ticker_combinations()
     
-    print(f"📊 Monitoring {len(TICKER_TF_COMBINATIONS)} ticker-timeframe combinations")
+    logger.info("📊 Monitoring %s ticker-timeframe combinations", len(TICKER_TF_COMBINATIONS))
     for ticker, tf in TICKER_TF_COMBINATIONS[:10]:
-        print(f"   • {ticker} ({tf})")
+        logger.info("   • %s (%s)", ticker, tf)
     if len(TICKER_TF_COMBINATIONS) > 10:
-        print(f"   ... and {len(TICKER_TF_COMBINATIONS) - 10} more")
+        logger.info("   ... and %s more", len(TICKER_TF_COMBINATIONS) - 10)
     
-    print(f"🌐 API endpoint: {API_BASE_URL}")
-    print(f"📡 Discord channel: {CHANNEL_ID}")
+    logger.info("🌐 API endpoint: %s", API_BASE_URL)
+    logger.info("📡 Discord channel: %s", CHANNEL_ID)
     
     # Railway deployment detection
-    if os.getenv('RAILWAY_ENVIRONMENT'):
-        print(f"🚂 Running on Railway deployment: {os.getenv('RAILWAY_ENVIRONMENT')}")
-        print(f"🔧 Railway service: {os.getenv('RAILWAY_SERVICE_NAME', 'discord-bot')}")
+    if RAILWAY_ENVIRONMENT:
+        logger.info("🚂 Running on Railway deployment: %s", RAILWAY_ENVIRONMENT)
+        logger.info("🔧 Railway service: %s", RAILWAY_SERVICE_NAME)
     
     # Initialize scheduler based on configuration
     if USE_SMART_SCHEDULER:
-        print("🎯 Initializing Smart Scheduler...")
-        print("📅 Smart scheduling aligns signal checks with hourly candle closes")
+        logger.info("🎯 Initializing Smart Scheduler...")
+        logger.info("📅 Smart scheduling aligns signal checks with hourly candle closes")
         
         # Create smart scheduler with custom configuration
         smart_scheduler = create_smart_scheduler(
             signal_check_function=smart_signal_check,
-            logger=logging.getLogger(__name__)
+            logger=logger
         )
         
         # Start the smart scheduler
         smart_scheduler.start()
         loop_start_time = datetime.now(EST)
-        print(f"✅ Smart Scheduler started at: {loop_start_time.strftime('%Y-%m-%d %I:%M:%S %p EST')}")
+        logger.info("✅ Smart Scheduler started at: %s", loop_start_time.strftime('%Y-%m-%d %I:%M:%S %p EST'))
         
     else:
-        print("⏰ Using legacy fixed-interval scheduler...")
-        print(f"⏰ Signal check interval: {CHECK_INTERVAL} seconds ({CHECK_INTERVAL/60:.1f} minutes)")
+        logger.info("⏰ Using legacy fixed-interval scheduler...")
+        logger.info("⏰ Signal check interval: %s seconds (%.1f minutes)", CHECK_INTERVAL, CHECK_INTERVAL/60)
         
         if not signal_check_loop.is_running():
             loop_start_time = datetime.now(EST)
             signal_check_loop.start()
-            print(f"✅ Signal monitoring loop started at: {loop_start_time.strftime('%Y-%m-%d %I:%M:%S %p EST')}")
+            logger.info("✅ Signal monitoring loop started at: %s", loop_start_time.strftime('%Y-%m-%d %I:%M:%S %p EST'))
         else:
-            print("⚠️ Signal monitoring loop was already running")
+            logger.warning("⚠️ Signal monitoring loop was already running")
 
 @tasks.loop(seconds=CHECK_INTERVAL)
 async def signal_check_loop():
@@ -1609,15 +1964,27 @@ async def signal_check_loop():
         total_signals = 0
         notified_signals = 0
         
-        print(f"\n🔄 Starting signal check cycle #{checks_completed}")
-        print(f"🕐 Cycle start time: {cycle_start.strftime('%Y-%m-%d %I:%M:%S %p EST')}")
+        logger.info("🔄 Starting signal check cycle #%s", checks_completed)
+        logger.info("🕐 Cycle start time: %s", cycle_start.strftime('%Y-%m-%d %I:%M:%S %p EST'))
         
         # Railway health logging
-        if os.getenv('RAILWAY_ENVIRONMENT'):
-            print(f"🚂 Railway check #{checks_completed} - Memory usage available")
+        if RAILWAY_ENVIRONMENT:
+            logger.info("🚂 Railway check #%s - Memory usage available", checks_completed)
+        
+        # Work out this cycle's ticker/timeframe pairs up front so idle cycles cost nothing
+        eligible = [(ticker, timeframe) for timeframe, tickers in TF_TO_TICKERS.items() for ticker in tickers]
+        if not eligible:
+            logger.info("💤 No ticker-timeframe combinations configured - nothing to check this cycle")
+            return
         
-        # Create notifier instance
-        notifier = SignalNotifier(bot)
+        # Start each cycle with fresh API data
+        clear_signal_cache()
+        
+        # Reuse the shared notifier instance
+        notifier = _get_notifier(bot)
+        
+        # Fetch every pair's API data concurrently; the loop below then reads it back in order
+        await notifier.prefetch_signal_timelines(eligible)
         
         # Periodic cleanup of old notifications (every 10 cycles) - DISABLED
         # if checks_completed % 10 == 0:
@@ -1630,70 +1997,76 @@ async def signal_check_loop():
             try:
                 analytics_success = await update_daily_analytics()
                 if analytics_success:
-                    print(f"📊 Updated daily analytics for today")
+                    logger.info("📊 Updated daily analytics for today")
                 else:
-                    print(f"⚠️ Failed to update daily analytics")
+                    logger.warning("⚠️ Failed to update daily analytics")
             except Exception as e:
-                print(f"❌ Error updating analytics (non-critical): {e}")
+                logger.error("❌ Error updating analytics (non-critical): %s", e)
                 # Don't let analytics errors break the main signal checking loop
         
         # Check each ticker across all timeframes
         api_errors = 0
         discord_errors = 0
         
-        current_hour = cycle_start.hour
-        
-        for ticker in TICKERS:
-                try:
-                    print(f"\n📊 Checking {ticker} ({timeframe})...")
+        for ticker, timeframe in eligible:
+            if bot.is_closed():
+                logger.info("🛑 Bot connection closed - aborting check cycle")
+                notifier.clear_prefetched()
+                return
+            
+            try:
+                logger.info("📊 Checking %s (%s)...", ticker, timeframe)
+                
+                # Get recent signals using comprehensive detection
+                recent_signals = notifier.check_for_new_signals(ticker, timeframe)
+                total_signals += len(recent_signals)
+                
+                if recent_signals:
+                    logger.info("✅ Found %s recent signals for %s (%s)", len(recent_signals), ticker, timeframe)
                     
-                    # Get recent signals using comprehensive detection
-                    recent_signals = notifier.check_for_new_signals(ticker, timeframe)
-                    total_signals += len(recent_signals)
+                    # Filter signals that should trigger notifications
+                    notify_signals = []
+                    for signal in unique_signals(recent_signals):
+                        should_notify_result = await notifier.should_notify(signal, ticker, timeframe)
+                        if should_notify_result:
+                            notify_signals.append(signal)
                     
-                    if recent_signals:
-                        print(f"✅ Found {len(recent_signals)} recent signals for {ticker} ({timeframe})")
-                        
-                        # Filter signals that should trigger notifications
-                        notify_signals = []
-                        for signal in recent_signals:
-                            should_notify_result = await notifier.should_notify(signal, ticker, timeframe)
-                            if should_notify_result:
-                                notify_signals.append(signal)
+                    if notify_signals:
+                        logger.info("🚨 %s signals meet notification criteria", len(notify_signals))
+                        notified_signals += len(notify_signals)
                         
-                        if notify_signals:
-                            print(f"🚨 {len(notify_signals)} signals meet notification criteria")
-                            notified_signals += len(notify_signals)
-                            
-                            # Send notifications for qualifying signals
-                            for signal in notify_signals:
-                                try:
-                                    await notifier.send_signal_notification(signal, ticker, timeframe)
-                                    await asyncio.sleep(1)  # Rate limiting
-                                    health_stats['total_notifications_sent'] += 1
-                                except Exception as e:
-                                    print(f"❌ Discord error sending notification: {e}")
-                                    discord_errors += 1
-                                    health_stats['discord_errors'] += 1
-                        else:
-                            print(f"🔕 No signals meet notification criteria for {ticker} ({timeframe})")
+                        # Send notifications for qualifying signals
+                        for signal in notify_signals:
+                            try:
+                                async with notification_limiter:
+                                    await notifier.send_signal_notification(signal, ticker, timeframe, now=cycle_start)
+                                health_stats.total_notifications_sent += 1
+                            except Exception as e:
+                                logger.error("❌ Discord error sending notification: %s", e)
+                                discord_errors += 1
+                                health_stats.discord_errors += 1
                     else:
-                        print(f"ℹ️ No recent signals for {ticker} ({timeframe})")
-                    
-                    # Brief pause between tickers
-                    await asyncio.sleep(0.5)
-                    
-                except requests.exceptions.RequestException as e:
-                    print(f"❌ API error checking {ticker} ({timeframe}): {e}")
-                    api_errors += 1
-                    health_stats['api_errors'] += 1
-                    continue
-                except Exception as e:
-                    print(f"❌ Unexpected error checking {ticker} ({timeframe}): {e}")
-                    continue
+                        logger.info("🔕 No signals meet notification criteria for %s (%s)", ticker, timeframe)
+                else:
+                    logger.info("ℹ️ No recent signals for %s (%s)", ticker, timeframe)
+                
+                # Brief pause between tickers
+                await asyncio.sleep(0.5)
+                
+            except requests.exceptions.RequestException as e:
+                logger.error("❌ API error checking %s (%s): %s", ticker, timeframe, e)
+                api_errors += 1
+                health_stats.api_errors += 1
+                continue
+            except Exception as e:
+                logger.error("❌ Unexpected error checking %s (%s): %s", ticker, timeframe, e)
+                continue
+        
+        # Reap this cycle's background notification writes
+        await notifier.flush_pending_writes()
         
         # Update health stats
-        health_stats['total_signals_found'] += total_signals
+        health_stats.total_signals_found += total_signals
         last_successful_check = cycle_start
         
         # Calculate next check time and update bot activity
@@ -1715,31 +2088,31 @@ async def signal_check_loop():
             else:
                 status_text = f"Next check in {seconds}s"
             
-            await bot.change_presence(
-                activity=discord.Activity(
-                    type=discord.ActivityType.watching,
-                    name=status_text
-                )
-            )
-        
-        # Enhanced summary logging
-        print(f"\n📋 Cycle #{checks_completed} completed successfully!")
-        print(f"⏱️ Duration: {cycle_duration:.1f} seconds")
-        print(f"📊 Total signals found: {total_signals}")
-        print(f"🚨 Notifications sent: {notified_signals}")
-        print(f"❌ API errors: {api_errors}")
-        print(f"❌ Discord errors: {discord_errors}")
-        print(f"⏰ Next check: {next_check.strftime('%I:%M:%S %p EST')}")
-        
-        # Railway-specific logging
-        if os.getenv('RAILWAY_ENVIRONMENT'):
-            uptime = cycle_end - bot_start_time if bot_start_time else timedelta(0)
-            print(f"🚂 Railway uptime: {uptime}")
-            print(f"🔧 Railway health: ✅ Loop running normally")
+            await update_presence(status_text)
+        
+        # Enhanced summary logging - built only when INFO is enabled, written as one record
+        if logger.isEnabledFor(logging.INFO):
+            summary = [
+                f"📋 Cycle #{checks_completed} completed successfully!",
+                f"⏱️ Duration: {cycle_duration:.1f} seconds",
+                f"📊 Total signals found: {total_signals}",
+                f"🚨 Notifications sent: {notified_signals}",
+                f"❌ API errors: {api_errors}",
+                f"❌ Discord errors: {discord_errors}",
+                f"⏰ Next check: {next_check.strftime('%I:%M:%S %p EST')}"
+            ]
+            
+            # Railway-specific logging
+            if RAILWAY_ENVIRONMENT:
+                uptime = cycle_end - bot_start_time if bot_start_time else timedelta(0)
+                summary.append(f"🚂 Railway uptime: {uptime}")
+                summary.append(f"🔧 Railway health: ✅ Loop running normally")
+            
+            logger.info("\n".join(summary))
                 
     except Exception as e:
-        print(f"❌ Critical error in signal check loop: {e}")
-        health_stats['failed_checks'] += 1
+        logger.error("❌ Critical error in signal check loop: %s", e)
+        health_stats.failed_checks += 1
         
         # Try to notify about the error
         try:
@@ -1778,36 +2151,32 @@ async def get_signals(ctx, ticker: str = "AAPL", timeframe: str = "1d"):
     
     # Send typing indicator for longer operations
     async with ctx.typing():
-        notifier = SignalNotifier(bot)
+        notifier = _get_notifier(bot)
         signals = notifier.fetch_signal_timeline(ticker.upper(), timeframe)
         
         if not signals:
             await ctx.send(f"❌ No signals found for {ticker.upper()} ({timeframe})")
             return
         
-        # Enhanced sorting to ensure most recent signals first
+        # Parse every signal date once; the result drives both sorting and recency counts
         def get_signal_datetime(signal):
-            """Enhanced sorting function to handle both date-only and full timestamps"""
+            """Return (sort key, parsed datetime or None) for date-only and full timestamps"""
             try:
                 date_str = signal.get('date', '')
-                if not date_str:
-                    return datetime.min
-                
                 if ' ' in date_str:
                     # Full timestamp (e.g., "2025-01-27 14:30:00")
-                    return datetime.strptime(date_str, '%Y-%m-%d %H:%M:%S')
-                else:
-                    # Date only (e.g., "2025-01-27") - assume end of day for better sorting
-                    base_date = datetime.strptime(date_str, '%Y-%m-%d')
-                    return base_date.replace(hour=23, minute=59, second=59)
+                    parsed_date = datetime.fromisoformat(date_str)
+                    return parsed_date, parsed_date
+                # Date only (e.g., "2025-01-27") - assume end of day for better sorting
+                parsed_date = datetime.fromisoformat(date_str)
+                return parsed_date.replace(hour=23, minute=59, second=59), parsed_date
             except (ValueError, TypeError):
-                return datetime.min
+                return datetime.min, None
         
-        # Sort signals by datetime (most recent first)
-        signals.sort(key=get_signal_datetime, reverse=True)
+        parsed = [(get_signal_datetime(signal), signal) for signal in signals]
         
-        # Show most recent 5 signals
-        recent_signals = signals[:5]
+        # Show most recent 5 signals (most recent first); only those need ordering
+        recent_signals = [signal for _, signal in heapq.nlargest(5, parsed, key=lambda item: item[0][0])]
         
         embed = discord.Embed(
             title=f"🚨 Latest Signals for {ticker.upper()} ({timeframe})",
@@ -1820,28 +2189,16 @@ async def get_signals(ctx, ticker: str = "AAPL", timeframe: str = "1d"):
         total_signals = len(signals)
         showing_count = len(recent_signals)
         
-        # Count signals by recency
+        # Count signals by recency from the already-parsed dates
         now = datetime.now()
-        today_signals = 0
-        week_signals = 0
-        
-        for signal in signals:
-            try:
-                signal_date = signal.get('date', '')
-                if ' ' in signal_date:
-                    parsed_date = datetime.strptime(signal_date, '%Y-%m-%d %H:%M:%S')
-                else:
-                    parsed_date = datetime.strptime(signal_date, '%Y-%m-%d')
-                
-                days_diff = (now - parsed_date).days
-                if days_diff == 0:
-                    today_signals += 1
-                if days_diff <= 7:
-                    week_signals += 1
-            except:
-                continue
+        days_diffs = np.fromiter(
+            ((now - parsed_date).days for (_, parsed_date), _ in parsed if parsed_date is not None),
+            dtype=np.int64
+        )
+        today_signals = int(np.count_nonzero(days_diffs == 0))
+        week_signals = int(np.count_nonzero(days_diffs <= 7))
         
-                embed.add_field(
+        embed.add_field(
             name="📊 Signal Summary", 
             value=f"**Total Found:** {total_signals} signals\n"
                   f"**Today:** {today_signals} signals\n"
@@ -1886,17 +2243,11 @@ async def get_signals(ctx, ticker: str = "AAPL", timeframe: str = "1d"):
             
             if 'Gold' in signal_type:
                 strength_emoji = '⭐🔥🔥🔥'
-            elif strength == 'Very Strong':
-                strength_emoji = '🔥🔥🔥'
-            elif strength == 'Strong':
-                strength_emoji = '🔥🔥'
-            elif strength == 'Moderate':
-                strength_emoji = '🔥'
             else:
-                strength_emoji = '💧'
+                strength_emoji = SIGNAL_STRENGTH_EMOJIS.get(strength, '💧')
             
             # Enhanced signal type emoji
-            type_emoji = '🟢' if any(word in signal_type.lower() for word in ['buy', 'bullish']) else '🔴' if any(word in signal_type.lower() for word in ['sell', 'bearish']) else '🟡'
+            type_emoji = classify_signal_direction(signal_type)
             
             embed.add_field(
                 name=f"{type_emoji} #{i} {signal_type} {strength_emoji}",
@@ -1923,6 +2274,7 @@ async def add_ticker(ctx, ticker: str):
 @bot.command(name='timer')
 async def show_timer(ctx):
     """Show time until next signal check"""
+    now = datetime.now(EST)
     if USE_SMART_SCHEDULER and smart_scheduler:
         # Smart scheduler timing
         if not smart_scheduler.is_running():
@@ -1934,7 +2286,7 @@ async def show_timer(ctx):
         embed = discord.Embed(
             title="⏰ Smart Scheduler Timer",
             color=0x00ff88,
-            timestamp=datetime.now(EST)
+            timestamp=now
         )
         
         embed.add_field(
@@ -1975,11 +2327,10 @@ async def show_timer(ctx):
         
         # Show upcoming runs
         if status_info['upcoming_runs']:
-            upcoming_text = ""
-            for i, run in enumerate(status_info['upcoming_runs'][:3], 1):
-                priority_icon = "⭐" if run['is_priority'] else "📊"
-                market_icon = "📈" if run['is_market_hours'] else "🌙"
-                upcoming_text += f"{i}. {run['time']} {priority_icon} {market_icon}\n"
+            upcoming_text = "".join(
+                f"{i}. {run['time']} {'⭐' if run['is_priority'] else '📊'} {'📈' if run['is_market_hours'] else '🌙'}\n"
+                for i, run in enumerate(status_info['upcoming_runs'][:3], 1)
+            )
             
             embed.add_field(
                 name="📅 Upcoming Checks",
@@ -1994,8 +2345,6 @@ async def show_timer(ctx):
         if not signal_check_loop.is_running():
             await ctx.send("❌ Signal monitoring is not running")
             return
-
-        now = datetime.now(EST)
         
         if loop_start_time:
             elapsed = (now - loop_start_time).total_seconds()
@@ -2013,7 +2362,7 @@ async def show_timer(ctx):
             embed = discord.Embed(
                 title="⏰ Legacy Scheduler Timer",
                 color=0x00ff88,
-                timestamp=datetime.now(EST)
+                timestamp=now
             )
             
             if hours > 0:
@@ -2069,8 +2418,8 @@ async def show_schedule(ctx):
     embed.add_field(
         name="⏰ Schedule Configuration",
         value=f"""
-**Market Hours:** {smart_scheduler.run_at_minutes} minutes past each hour
-**After Hours:** {smart_scheduler.priority_run_minutes} minutes past each hour
+**Market Hours:** {list(smart_scheduler.run_at_minutes)} minutes past each hour
+**After Hours:** {list(smart_scheduler.after_hours_run_minutes)} minutes past each hour
 **Market Open:** 9:30 AM EST
 **Market Close:** 4:00 PM EST
         """,
@@ -2079,11 +2428,10 @@ async def show_schedule(ctx):
     
     # Next runs
     if status_info['upcoming_runs']:
-        upcoming_text = ""
-        for i, run in enumerate(status_info['upcoming_runs'], 1):
-            priority_icon = "⭐" if run['is_priority'] else "📊"
-            market_icon = "📈" if run['is_market_hours'] else "🌙"
-            upcoming_text += f"{i}. **{run['time']}** {priority_icon} {market_icon}\n   _{run['reason']}_\n"
+        upcoming_text = "".join(
+            f"{i}. **{run['time']}** {'⭐' if run['is_priority'] else '📊'} {'📈' if run['is_market_hours'] else '🌙'}\n   _{run['reason']}_\n"
+            for i, run in enumerate(status_info['upcoming_runs'], 1)
+        )
         
         embed.add_field(
             name="📅 Next 3 Scheduled Runs",
@@ -2179,7 +2527,10 @@ async def scheduler_control(ctx, action: str = None):
     elif action == "restart":
         if USE_SMART_SCHEDULER and smart_scheduler:
             smart_scheduler.stop()
-            await asyncio.sleep(2)
+            if not await smart_scheduler.wait_stopped(timeout=10):
+                # Starting now would run a second loop alongside the one still shutting down
+                await ctx.send("⚠️ Smart Scheduler is still stopping - run `!scheduler restart` again in a moment")
+                return
             smart_scheduler.start()
             await ctx.send("🔄 Smart Scheduler restarted")
         elif not USE_SMART_SCHEDULER:
@@ -2197,18 +2548,21 @@ async def scheduler_control(ctx, action: str = None):
 @bot.command(name='status')
 async def bot_status(ctx):
     """Check bot status"""
+    now = datetime.now(EST)
+    # Same source of truth as !health; bound once for the whole embed
+    loop_running = signal_check_loop.is_running()
     embed = discord.Embed(
         title="🤖 Signal Bot Status",
-        color=0x00ff00 if signal_check_loop.is_running() else 0xff0000
+        color=0x00ff00 if loop_running else 0xff0000,
+        timestamp=now
     )
     
-    embed.add_field(name="Loop Status", value="✅ Running" if signal_check_loop.is_running() else "❌ Stopped", inline=True)
+    embed.add_field(name="Loop Status", value="✅ Running" if loop_running else "❌ Stopped", inline=True)
     embed.add_field(name="Check Interval", value=f"`{CHECK_INTERVAL} seconds`", inline=True)
     embed.add_field(name="API URL", value=f"`{API_BASE_URL}`", inline=True)
     
     # Add timing information
-    if signal_check_loop.is_running() and loop_start_time:
-        now = datetime.now(EST)  # Use timezone-aware datetime
+    if loop_running and loop_start_time:
         elapsed = (now - loop_start_time).total_seconds()
         cycles_completed = int(elapsed // CHECK_INTERVAL)
         next_cycle_time = loop_start_time + timedelta(seconds=(cycles_completed + 1) * CHECK_INTERVAL)
@@ -2231,37 +2585,44 @@ async def bot_status(ctx):
 async def test_connection(ctx):
     """Test API connection"""
     try:
-        response = requests.get(f"{API_BASE_URL}/", timeout=10)
-        if response.status_code == 200:
+        async with bot.http_session.get(f"{API_BASE_URL}/") as response:
+            status = response.status
+        if status == 200:
             await ctx.send("✅ API connection successful!")
         else:
-            await ctx.send(f"❌ API returned status {response.status_code}")
+            await ctx.send(f"❌ API returned status {status}")
     except Exception as e:
         await ctx.send(f"❌ API connection failed: {str(e)}")
 
 @bot.command(name='config')
 async def show_config(ctx):
     """Show current bot configuration"""
+    now = datetime.now(EST)
+    cached = _embed_cache.get(('config', _config_version))
+    if cached:
+        embed = discord.Embed.from_dict(cached)
+        embed.timestamp = now
+        await ctx.send(embed=embed)
+        return
+    
     embed = discord.Embed(
         title="⚙️ Bot Configuration",
         color=0x00ff88,
-        timestamp=datetime.now(EST)
+        timestamp=now
     )
     
-    # Show ticker-timeframe combinations
-    tf_summary = []
-    for ticker, timeframe in TICKER_TF_COMBINATIONS:
-        tf_summary.append(f"{ticker}({timeframe})")
+    snapshot = _config_snapshot
     
+    # Show ticker-timeframe combinations (preformatted by build_ticker_combinations)
     embed.add_field(
         name="📊 Ticker-Timeframe Combinations", 
-        value=f"```{', '.join(tf_summary[:10])}{'...' if len(tf_summary) > 10 else ''}```", 
+        value=f"```{TICKER_TF_DISPLAY_SHORT}```", 
         inline=False
     )
     
-    embed.add_field(name="🔢 Total Combinations", value=f"`{len(TICKER_TF_COMBINATIONS)}`", inline=True)
-    embed.add_field(name="📈 Total Tickers", value=f"`{len(config.tickers)}`", inline=True)
-    embed.add_field(name="⏱️ Total Timeframes", value=f"`{len(config.timeframes)}`", inline=True)
+    embed.add_field(name="🔢 Total Combinations", value=f"`{len(snapshot['combinations'])}`", inline=True)
+    embed.add_field(name="📈 Total Tickers", value=f"`{len(snapshot['tickers'])}`", inline=True)
+    embed.add_field(name="⏱️ Total Timeframes", value=f"`{len(snapshot['timeframes'])}`", inline=True)
     embed.add_field(name="🔄 Check Interval", value=f"`{CHECK_INTERVAL} seconds`", inline=True)
     embed.add_field(name="📅 Max Signal Age", value=f"`{MAX_SIGNAL_AGE_DAYS} days`", inline=True)
     embed.add_field(name="💪 Strong Signals Only", value=f"`{ONLY_STRONG_SIGNALS}`", inline=True)
@@ -2276,17 +2637,32 @@ async def show_config(ctx):
     
     embed.set_footer(text="💡 Configuration loaded from PostgreSQL database only")
     
+    _embed_cache[('config', _config_version)] = embed.to_dict()
     await ctx.send(embed=embed)
 
+# Single-flight config reload: concurrent !tickersync calls share one DB load
+_sync_lock = asyncio.Lock()
+_sync_inflight: Optional[asyncio.Task] = None
+
+async def _shared_reload() -> bool:
+    """Reload config from the database, joining a reload already in progress"""
+    global _sync_inflight
+    async with _sync_lock:
+        if _sync_inflight is None or _sync_inflight.done():
+            _sync_inflight = asyncio.create_task(config.load_from_database())
+        task = _sync_inflight
+    return await asyncio.shield(task)
+
 @bot.command(name='tickersync')
 async def ticker_sync_command(ctx):
     """Sync bot with database tickers (loads from PostgreSQL)"""
+    now = datetime.now(EST)
     try:
         embed = discord.Embed(
             title="🔄 Ticker Database Sync",
             description="Reloading ticker configuration from PostgreSQL database",
             color=0xff6600,
-            timestamp=datetime.now(EST)
+            timestamp=now
         )
         
         # Show current state
@@ -2297,7 +2673,7 @@ async def ticker_sync_command(ctx):
         )
         
         # Reload from database
-        config_success = await config.load_from_database()
+        config_success = await _shared_reload()
         
         if config_success:
             # Rebuild combinations
@@ -2330,17 +2706,56 @@ async def ticker_sync_command(ctx):
     except Exception as e:
         await ctx.send(f"❌ Error syncing tickers: {e}")
 
+# Reporting queries change slowly; bursts of commands share one query per key
+DB_CACHE_TTL = 60  # seconds
+_db_cache = {}        # key -> (expires, value)
+_db_cache_locks = {}  # key -> asyncio.Lock
+
+async def cached_db_call(key: tuple, fetch, *args):
+    """Return fetch(*args), querying the database at most once per DB_CACHE_TTL for each key"""
+    entry = _db_cache.get(key)
+    if entry and time.monotonic() < entry[0]:
+        return entry[1]
+    
+    lock = _db_cache_locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        # Another caller may have refreshed the entry while we waited
+        entry = _db_cache.get(key)
+        if entry and time.monotonic() < entry[0]:
+            return entry[1]
+        
+        value = await fetch(*args)
+        _db_cache[key] = (time.monotonic() + DB_CACHE_TTL, value)
+        return value
+
+def invalidate_db_cache():
+    """Drop cached reporting results after a command changes the underlying data"""
+    _db_cache.clear()
+
+async def get_cached_stats() -> Dict:
+    """Notification stats, cached for DB_CACHE_TTL"""
+    return await cached_db_call(('stats',), get_stats)
+
+async def get_cached_priority_analytics(days: int = 7) -> Dict:
+    """Priority analytics for the last N days, cached for DB_CACHE_TTL"""
+    return await cached_db_call(('priority_analytics', days), get_priority_analytics, days)
+
+async def get_cached_signal_utilization() -> Dict:
+    """Signal utilization report, cached for DB_CACHE_TTL"""
+    return await cached_db_call(('signal_utilization',), get_signal_utilization)
+
 @bot.command(name='notifications')
 async def notification_stats(ctx):
     """Show notification statistics from database"""
+    now = datetime.now(EST)
     try:
         # Get database statistics
-        stats = await get_stats()
+        stats = await get_cached_stats()
         
         embed = discord.Embed(
             title="📊 Notification Statistics",
             color=0x0099ff,
-            timestamp=datetime.now(EST)
+            timestamp=now
         )
         
         embed.add_field(
@@ -2391,14 +2806,16 @@ async def notification_stats(ctx):
 @bot.command(name='cleanup')
 async def manual_cleanup(ctx):
     """Manually trigger cleanup of old notification entries from database"""
+    now = datetime.now(EST)
     try:
         # Perform database cleanup
         cleaned_count = await cleanup_old(days=30)
+        invalidate_db_cache()
         
         embed = discord.Embed(
             title="🧹 Database Cleanup Complete",
             color=0x00ff00,
-            timestamp=datetime.now(EST)
+            timestamp=now
         )
         
         embed.add_field(name="🗑️ Removed", value=f"`{cleaned_count} entries`", inline=True)
@@ -2418,6 +2835,35 @@ async def manual_cleanup(ctx):
     except Exception as e:
         await ctx.send(f"❌ Error during cleanup: {e}")
 
+class ConfirmView(discord.ui.View):
+    """Confirm/Cancel buttons that only the invoking user can press"""
+    
+    def __init__(self, author: discord.abc.User, timeout: float = 30.0):
+        super().__init__(timeout=timeout)
+        self.author = author
+        self.value = None  # True = confirmed, False = cancelled, None = timed out
+    
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        return interaction.user.id == self.author.id
+    
+    @discord.ui.button(label='Confirm', style=discord.ButtonStyle.danger, emoji='✅')
+    async def confirm(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.value = True
+        await interaction.response.defer()
+        self.stop()
+    
+    @discord.ui.button(label='Cancel', style=discord.ButtonStyle.secondary, emoji='❌')
+    async def cancel(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.value = False
+        await interaction.response.defer()
+        self.stop()
+
+# Valid ticker symbols: letters, digits, dots and dashes
+TICKER_PATTERN = re.compile(r'^[A-Z0-9.-]+$')
+
+# Minimum seconds between edits of the !clear all progress message
+CLEAR_STATUS_MIN_INTERVAL = 1.0
+
 @bot.command(name='clear')
 async def clear_channel(ctx, limit = None):
     """Clear messages from the current channel (max 100 at a time due to Discord limits)
@@ -2443,95 +2889,92 @@ async def clear_channel(ctx, limit = None):
     try:
         # Handle special case for "all"
         if limit is not None and str(limit).lower() == 'all':
+            view = ConfirmView(ctx.author, timeout=30.0)
             confirm_msg = await ctx.send(
                 "⚠️ **WARNING**: This will delete ALL messages in this channel!\n"
-                "React with ✅ to confirm or ❌ to cancel\n"
-                "⏰ You have 30 seconds to decide..."
+                "Press ✅ **Confirm** to proceed or ❌ **Cancel** to abort\n"
+                "⏰ You have 30 seconds to decide...",
+                view=view
             )
             
-            await confirm_msg.add_reaction('✅')
-            await confirm_msg.add_reaction('❌')
+            await view.wait()
+            
+            if view.value is None:
+                await confirm_msg.edit(content="⏰ Confirmation timed out - channel clear cancelled", view=None)
+                return
+            elif not view.value:
+                await confirm_msg.edit(content="❌ Channel clear cancelled", view=None)
+                return
+            
+            await confirm_msg.delete()
             
-            def check(reaction, user):
-                return user == ctx.author and str(reaction.emoji) in ['✅', '❌'] and reaction.message.id == confirm_msg.id
+            # Delete messages in batches
+            total_deleted = 0
+            status_msg = await ctx.send("🗑️ Starting bulk deletion...")
             
-            try:
-                reaction, user = await bot.wait_for('reaction_add', timeout=30.0, check=check)
-                
-                if str(reaction.emoji) == '❌':
-                    await confirm_msg.edit(content="❌ Channel clear cancelled")
-                    return
-                elif str(reaction.emoji) == '✅':
-                    await confirm_msg.delete()
+            # purge() fuses history + bulk delete (and deletes >14-day-old
+            # messages singly); discord.py meters the rate limit buckets itself
+            status_edit = None
+            last_edit = time.monotonic()
+            
+            while True:
+                try:
+                    deleted = await ctx.channel.purge(
+                        limit=100,
+                        check=lambda m: m.id != status_msg.id,
+                        bulk=True
+                    )
                     
-                    # Delete messages in batches
-                    total_deleted = 0
-                    status_msg = await ctx.send("🗑️ Starting bulk deletion...")
+                    if not deleted:
+                        break
                     
-                    while True:
+                    total_deleted += len(deleted)
+                    
+                    # Progress edits are throttled and overlap with the next purge
+                    if (time.monotonic() - last_edit >= CLEAR_STATUS_MIN_INTERVAL
+                            and (status_edit is None or status_edit.done())):
+                        last_edit = time.monotonic()
+                        status_edit = asyncio.create_task(
+                            status_msg.edit(content=f"🗑️ Deleted {total_deleted} messages...")
+                        )
+                    
+                except discord.Forbidden:
+                    await status_msg.edit(content="❌ Permission denied - cannot delete messages")
+                    return
+                except discord.HTTPException:
+                    # Fall back to deleting one message at a time
+                    individual_deleted = 0
+                    async for message in ctx.channel.history(limit=100):
+                        if message.id == status_msg.id:
+                            continue
                         try:
-                            # Get messages (Discord limit is 100 per call)
-                            messages = []
-                            async for message in ctx.channel.history(limit=100):
-                                # Skip the status message we just sent
-                                if message.id != status_msg.id:
-                                    messages.append(message)
+                            await message.delete()
+                            individual_deleted += 1
+                            total_deleted += 1
                             
-                            if not messages:
-                                break
+                            # Just yield to the event loop; discord.py sleeps on a 429 itself
+                            await asyncio.sleep(0)
                             
-                            # Bulk delete (only works for messages < 14 days old)
-                            try:
-                                await ctx.channel.delete_messages(messages)
-                                total_deleted += len(messages)
-                                await status_msg.edit(content=f"🗑️ Deleted {total_deleted} messages...")
-                                
-                                # If we got less than 100 messages, we're done
-                                if len(messages) < 100:
-                                    break
-                                    
-                            except discord.HTTPException as e:
-                                # Some messages might be too old for bulk delete
-                                # Try deleting them individually
-                                individual_deleted = 0
-                                for message in messages:
-                                    try:
-                                        await message.delete()
-                                        individual_deleted += 1
-                                        total_deleted += 1
-                                        
-                                        # Rate limiting
-                                        if individual_deleted % 5 == 0:
-                                            await asyncio.sleep(1)
-                                            await status_msg.edit(content=f"🗑️ Deleted {total_deleted} messages (individual deletion mode)...")
-                                            
-                                    except discord.NotFound:
-                                        # Message already deleted
-                                        continue
-                                    except discord.Forbidden:
-                                        # Can't delete this message
-                                        continue
+                            if time.monotonic() - last_edit >= CLEAR_STATUS_MIN_INTERVAL:
+                                last_edit = time.monotonic()
+                                await status_msg.edit(content=f"🗑️ Deleted {total_deleted} messages (individual deletion mode)...")
                                 
-                                # If no messages were deleted individually, we're probably done
-                                if individual_deleted == 0:
-                                    break
-                            
-                            # Small delay between batches
-                            await asyncio.sleep(1)
-                            
-                        except discord.Forbidden:
-                            await status_msg.edit(content="❌ Permission denied - cannot delete messages")
-                            return
-                        except Exception as e:
-                            await status_msg.edit(content=f"❌ Error during deletion: {str(e)}")
-                            return
-                    
-                    # Final status
-                    await status_msg.edit(content=f"✅ **Deletion Complete!**\n📊 Total messages deleted: **{total_deleted}**\n🆕 Channel is now fresh and clean!")
+                        except (discord.NotFound, discord.Forbidden):
+                            # Already deleted or not ours to delete
+                            continue
                     
-            except asyncio.TimeoutError:
-                await confirm_msg.edit(content="⏰ Confirmation timed out - channel clear cancelled")
-                return
+                    # If no messages were deleted individually, we're done
+                    if individual_deleted == 0:
+                        break
+                except Exception as e:
+                    await status_msg.edit(content=f"❌ Error during deletion: {str(e)}")
+                    return
+            
+            if status_edit is not None:
+                await asyncio.gather(status_edit, return_exceptions=True)
+            
+            # Final status
+            await status_msg.edit(content=f"✅ **Deletion Complete!**\n📊 Total messages deleted: **{total_deleted}**\n🆕 Channel is now fresh and clean!")
         
         else:
             # Normal deletion with specified limit
@@ -2555,15 +2998,9 @@ async def clear_channel(ctx, limit = None):
             # Add 1 to include the command message itself
             deleted = await ctx.channel.purge(limit=limit + 1)
             
-            # Send confirmation (this will be the only message left)
-            confirmation = await ctx.send(f"✅ Deleted {len(deleted)} messages")
-            
-            # Auto-delete confirmation after 5 seconds
-            await asyncio.sleep(5)
-            try:
-                await confirmation.delete()
-            except discord.NotFound:
-                pass
+            # Send confirmation (this will be the only message left);
+            # discord.py deletes it after 5 seconds without holding the command open
+            await ctx.send(f"✅ Deleted {len(deleted)} messages", delete_after=5)
                 
     except discord.Forbidden:
         await ctx.send("❌ I don't have permission to delete messages in this channel")
@@ -2593,8 +3030,7 @@ async def add_ticker_command(ctx, ticker: str):
             return
             
         # Basic ticker validation (alphanumeric, dash, dot)
-        import re
-        if not re.match(r'^[A-Z0-9.-]+$', ticker):
+        if not TICKER_PATTERN.match(ticker):
             await ctx.send(f"❌ Invalid ticker format: **{ticker}**\nTickers should contain only letters, numbers, dots, and dashes.")
             return
             
@@ -2691,9 +3127,15 @@ async def remove_ticker_command(ctx, ticker: str):
 async def list_tickers_command(ctx):
     """List all currently monitored tickers"""
     try:
-        # Use global config
-        tickers = config.tickers
-        timeframes = config.timeframes
+        cached = _embed_cache.get(('listtickers', _config_version))
+        if cached:
+            await ctx.send(embed=discord.Embed.from_dict(cached))
+            return
+        
+        # Read from the in-memory config snapshot
+        tickers = _config_snapshot["tickers"]
+        timeframes = _config_snapshot["timeframes"]
+        combinations = _config_snapshot["combinations"]
         max_tickers = config.max_tickers
         
         # Create embed
@@ -2708,16 +3150,17 @@ async def list_tickers_command(ctx):
             # Split long ticker lists
             if len(ticker_text) > 1000:
                 ticker_chunks = []
-                current_chunk = ""
+                chunk_parts = []
+                chunk_len = 0
                 for ticker in tickers:
                     ticker_part = f"`{ticker}`, "
-                    if len(current_chunk + ticker_part) > 1000:
-                        ticker_chunks.append(current_chunk.rstrip(", "))
-                        current_chunk = ticker_part
-                    else:
-                        current_chunk += ticker_part
-                if current_chunk:
-                    ticker_chunks.append(current_chunk.rstrip(", "))
+                    if chunk_parts and chunk_len + len(ticker_part) > 1000:
+                        ticker_chunks.append("".join(chunk_parts).rstrip(", "))
+                        chunk_parts, chunk_len = [], 0
+                    chunk_parts.append(ticker_part)
+                    chunk_len += len(ticker_part)
+                if chunk_parts:
+                    ticker_chunks.append("".join(chunk_parts).rstrip(", "))
                 
                 for i, chunk in enumerate(ticker_chunks):
                     field_name = "📈 Monitored Tickers" if i == 0 else f"📈 Monitored Tickers (continued {i+1})"
@@ -2736,7 +3179,7 @@ async def list_tickers_command(ctx):
             name="📊 Statistics",
             value=f"**Tickers**: {len(tickers)}/{max_tickers}\n"
                   f"**Timeframes**: {len(timeframes)}\n"
-                  f"**Total Combinations**: {len(TICKER_TF_COMBINATIONS)}",
+                  f"**Total Combinations**: {len(combinations)}",
             inline=True
         )
         
@@ -2755,6 +3198,7 @@ async def list_tickers_command(ctx):
             inline=False
         )
         
+        _embed_cache[('listtickers', _config_version)] = embed.to_dict()
         await ctx.send(embed=embed)
         
     except Exception as e:
@@ -2764,8 +3208,8 @@ async def list_tickers_command(ctx):
 async def timeframes_command(ctx, action: str = None, timeframe: str = None):
     global config
     try:
-        await config.load_from_database()  # Always reload from DB for latest
-        current_timeframes = config.timeframes
+        # Serve from the in-memory snapshot; mutations below refresh it
+        current_timeframes = _config_snapshot["timeframes"]
         allowed_timeframes = config.allowed_timeframes
         if not action:
             action = 'list'
@@ -2781,7 +3225,7 @@ async def timeframes_command(ctx, action: str = None, timeframe: str = None):
             embed.add_field(name="✅ Available Timeframes", value=available_text, inline=False)
             embed.add_field(
                 name="📈 Impact",
-                value=f"**Tickers**: {len(config.tickers)}\n**Timeframes**: {len(current_timeframes)}\n**Total Combinations**: {len(TICKER_TF_COMBINATIONS)}",
+                value=f"**Tickers**: {len(_config_snapshot['tickers'])}\n**Timeframes**: {len(current_timeframes)}\n**Total Combinations**: {len(_config_snapshot['combinations'])}",
                 inline=False
             )
             embed.add_field(
@@ -2808,7 +3252,6 @@ async def timeframes_command(ctx, action: str = None, timeframe: str = None):
                 return
             success = await config.add_timeframe(timeframe)
             if success:
-                await config.load_from_database()
                 build_ticker_combinations()
                 embed = discord.Embed(
                     title="✅ Timeframe Added!",
@@ -2835,9 +3278,11 @@ async def timeframes_command(ctx, action: str = None, timeframe: str = None):
                 await ctx.send("❌ Cannot remove the last timeframe. At least one must be active.")
                 return
                 
-            # Remove timeframe
-            current_timeframes.remove(timeframe)
-            config.timeframes = current_timeframes
+            # Remove timeframe from the database and local config
+            success = await config.remove_timeframe(timeframe)
+            if not success:
+                await ctx.send(f"❌ Failed to remove timeframe {timeframe}.")
+                return
             
             # Update globals
             build_ticker_combinations()
@@ -2862,9 +3307,40 @@ async def timeframes_command(ctx, action: str = None, timeframe: str = None):
     except Exception as e:
         await ctx.send(f"❌ Error managing timeframes: {str(e)}")
 
+# Field templates for the !health embed
+HEALTH_BOT_STATUS_TPL = "**Status:** {status}\n**Uptime:** {uptime}\n**Started:** {started}"
+HEALTH_LOOP_TPL = "**Status:** {status}\n**Cycles:** {cycles}\n**Last Check:** {last_check}"
+HEALTH_RAILWAY_TPL = "**Environment:** {environment}\n**Service:** {service}\n**Region:** {region}"
+HEALTH_PERFORMANCE_TPL = "**Success Rate:** {success_rate:.1f}%\n**Signals Found:** {signals}\n**Notifications:** {notifications}"
+HEALTH_ERRORS_TPL = "**Failed Checks:** {failed}\n**API Errors:** {api}\n**Discord Errors:** {discord}"
+HEALTH_CONFIG_TPL = "**Tickers:** {tickers}\n**Timeframes:** {timeframes}\n**Combinations:** {combinations}"
+
+# Last !health embed; rapid re-invocations with unchanged counters resend it
+HEALTH_EMBED_TTL = 60  # seconds
+_last_health_embed = None  # (key, built_at, embed dict, Next Check field index or None)
+
+def _health_next_check_value(now: datetime) -> str:
+    """The !health Next Check countdown; recomputed on every call since it moves by the second"""
+    elapsed = (now - loop_start_time).total_seconds()
+    cycles_completed_since_start = int(elapsed // CHECK_INTERVAL)
+    next_cycle_time = loop_start_time + timedelta(seconds=(cycles_completed_since_start + 1) * CHECK_INTERVAL)
+    time_until_next = next_cycle_time - now
+    
+    if time_until_next.total_seconds() <= 0:
+        time_until_next = timedelta(seconds=CHECK_INTERVAL)
+        next_cycle_time = now + time_until_next
+    
+    minutes, seconds = divmod(int(time_until_next.total_seconds()), 60)
+    time_str = f"{minutes}m {seconds}s" if minutes > 0 else f"{seconds}s"
+    
+    return (f"**In:** {time_str}\n"
+            f"**At:** {next_cycle_time.strftime('%I:%M:%S %p EST')}\n"
+            f"**Interval:** {CHECK_INTERVAL}s")
+
 @bot.command(name='health')
 async def health_check(ctx):
     """Comprehensive bot health check for monitoring Railway deployment"""
+    global _last_health_embed
     try:
         now = datetime.now(EST)  # Use timezone-aware datetime
         
@@ -2875,19 +3351,43 @@ async def health_check(ctx):
         # Calculate time since last check
         time_since_last = now - last_successful_check if last_successful_check else None
         
+        # Bind loop state and formatted times once for the whole report
+        loop_running = signal_check_loop.is_running()
+        start_fmt = bot_start_time.strftime('%m/%d %I:%M %p EST') if bot_start_time else 'Unknown'
+        last_check_fmt = last_successful_check.strftime('%I:%M:%S %p EST') if last_successful_check else "Never"
+        
+        # The stale-check issue depends on the clock, so its inputs are part of the key
+        stale_check = bool(time_since_last and time_since_last.total_seconds() > (CHECK_INTERVAL * 2))
+        stale_minutes = int(time_since_last.total_seconds() // 60) if stale_check else None
+        
+        # Reuse the last embed while nothing it reports has changed; only the
+        # Next Check countdown moves on its own and is recomputed on a hit
+        cache_key = (int(uptime.total_seconds()) // 60, checks_completed, astuple(health_stats),
+                     loop_running, last_check_fmt, stale_minutes, _config_version)
+        if _last_health_embed and _last_health_embed[0] == cache_key \
+                and time.monotonic() - _last_health_embed[1] < HEALTH_EMBED_TTL:
+            embed = discord.Embed.from_dict(_last_health_embed[2])
+            embed.timestamp = now
+            next_check_index = _last_health_embed[3]
+            if next_check_index is not None:
+                embed.set_field_at(next_check_index, name="⏳ Next Check",
+                                   value=_health_next_check_value(now), inline=True)
+            await ctx.send(embed=embed)
+            return
+        
         # Determine health status
         is_healthy = True
         health_issues = []
         
-        if not signal_check_loop.is_running():
+        if not loop_running:
             is_healthy = False
             health_issues.append("Signal loop not running")
             
-        if time_since_last and time_since_last.total_seconds() > (CHECK_INTERVAL * 2):
+        if stale_check:
             is_healthy = False
-            health_issues.append(f"Last check was {time_since_last.total_seconds()//60:.0f}m ago")
+            health_issues.append(f"Last check was {stale_minutes}m ago")
             
-        if health_stats['failed_checks'] > (checks_completed * 0.1):  # More than 10% failure rate
+        if health_stats.failed_checks > (checks_completed * 0.1):  # More than 10% failure rate
             is_healthy = False
             health_issues.append("High failure rate detected")
         
@@ -2902,75 +3402,54 @@ async def health_check(ctx):
         # Basic status
         embed.add_field(
             name="🤖 Bot Status", 
-            value=f"**Status:** {'🟢 Healthy' if is_healthy else '🔴 Issues Detected'}\n"
-                  f"**Uptime:** {uptime_str}\n"
-                  f"**Started:** {bot_start_time.strftime('%m/%d %I:%M %p EST') if bot_start_time else 'Unknown'}",
+            value=HEALTH_BOT_STATUS_TPL.format(
+                status='🟢 Healthy' if is_healthy else '🔴 Issues Detected', uptime=uptime_str, started=start_fmt),
             inline=True
         )
         
         # Loop status
-        loop_status = "🟢 Running" if signal_check_loop.is_running() else "🔴 Stopped"
-        last_check_str = last_successful_check.strftime('%I:%M:%S %p EST') if last_successful_check else "Never"
+        loop_status = "🟢 Running" if loop_running else "🔴 Stopped"
         
         embed.add_field(
             name="⏰ Signal Loop", 
-            value=f"**Status:** {loop_status}\n"
-                  f"**Cycles:** {checks_completed}\n"
-                  f"**Last Check:** {last_check_str}",
+            value=HEALTH_LOOP_TPL.format(status=loop_status, cycles=checks_completed, last_check=last_check_fmt),
             inline=True
         )
         
         # Railway info
-        railway_env = os.getenv('RAILWAY_ENVIRONMENT', 'Local')
-        railway_service = os.getenv('RAILWAY_SERVICE_NAME', 'discord-bot')
-        
         embed.add_field(
             name="🚂 Railway Info", 
-            value=f"**Environment:** {railway_env}\n"
-                  f"**Service:** {railway_service}\n"
-                  f"**Region:** {os.getenv('RAILWAY_REGION', 'Unknown')}",
+            value=HEALTH_RAILWAY_TPL.format(
+                environment=RAILWAY_ENVIRONMENT or 'Local', service=RAILWAY_SERVICE_NAME, region=RAILWAY_REGION),
             inline=True
         )
         
         # Performance stats
-        success_rate = ((checks_completed - health_stats['failed_checks']) / max(checks_completed, 1)) * 100
+        success_rate = ((checks_completed - health_stats.failed_checks) / max(checks_completed, 1)) * 100
         
         embed.add_field(
             name="📊 Performance", 
-            value=f"**Success Rate:** {success_rate:.1f}%\n"
-                  f"**Signals Found:** {health_stats['total_signals_found']}\n"
-                  f"**Notifications:** {health_stats['total_notifications_sent']}",
+            value=HEALTH_PERFORMANCE_TPL.format(
+                success_rate=success_rate, signals=health_stats.total_signals_found,
+                notifications=health_stats.total_notifications_sent),
             inline=True
         )
         
         # Error tracking
         embed.add_field(
             name="❌ Error Count", 
-            value=f"**Failed Checks:** {health_stats['failed_checks']}\n"
-                  f"**API Errors:** {health_stats['api_errors']}\n"
-                  f"**Discord Errors:** {health_stats['discord_errors']}",
+            value=HEALTH_ERRORS_TPL.format(
+                failed=health_stats.failed_checks, api=health_stats.api_errors, discord=health_stats.discord_errors),
             inline=True
         )
         
         # Next check info
-        if signal_check_loop.is_running() and loop_start_time:
-            elapsed = (now - loop_start_time).total_seconds()
-            cycles_completed_since_start = int(elapsed // CHECK_INTERVAL)
-            next_cycle_time = loop_start_time + timedelta(seconds=(cycles_completed_since_start + 1) * CHECK_INTERVAL)
-            time_until_next = next_cycle_time - now
-            
-            if time_until_next.total_seconds() <= 0:
-                time_until_next = timedelta(seconds=CHECK_INTERVAL)
-                next_cycle_time = now + time_until_next
-            
-            minutes, seconds = divmod(int(time_until_next.total_seconds()), 60)
-            time_str = f"{minutes}m {seconds}s" if minutes > 0 else f"{seconds}s"
-            
+        next_check_index = None
+        if loop_running and loop_start_time:
+            next_check_index = len(embed.fields)
             embed.add_field(
                 name="⏳ Next Check", 
-                value=f"**In:** {time_str}\n"
-                      f"**At:** {next_cycle_time.strftime('%I:%M:%S %p EST')}\n"
-                      f"**Interval:** {CHECK_INTERVAL}s",
+                value=_health_next_check_value(now),
                 inline=True
             )
         
@@ -2985,15 +3464,15 @@ async def health_check(ctx):
         # Configuration summary
         embed.add_field(
             name="⚙️ Configuration", 
-            value=f"**Tickers:** {len(TICKERS)}\n"
-                  f"**Timeframes:** {len(TIMEFRAMES)}\n"
-                  f"**Combinations:** {len(TICKER_TF_COMBINATIONS)}",
+            value=HEALTH_CONFIG_TPL.format(
+                tickers=len(TICKERS), timeframes=len(TIMEFRAMES), combinations=len(TICKER_TF_COMBINATIONS)),
             inline=True
         )
         
         # Set footer
         embed.set_footer(text="💡 Use !status for detailed bot information • !timer for next check countdown")
         
+        _last_health_embed = (cache_key, time.monotonic(), embed.to_dict(), next_check_index)
         await ctx.send(embed=embed)
         
     except Exception as e:
@@ -3010,9 +3489,10 @@ async def uptime_command(ctx):
             return
             
         uptime = now - bot_start_time
-        days = uptime.days
-        hours, remainder = divmod(uptime.seconds, 3600)
+        days, remainder = divmod(int(uptime.total_seconds()), 86400)
+        hours, remainder = divmod(remainder, 3600)
         minutes, seconds = divmod(remainder, 60)
+        uptime_str = f"{days}d {hours:02d}h {minutes:02d}m {seconds:02d}s"
         
         embed = discord.Embed(
             title="⏰ Bot Uptime",
@@ -3020,19 +3500,6 @@ async def uptime_command(ctx):
             timestamp=now
         )
         
-        # Uptime display
-        uptime_parts = []
-        if days > 0:
-            uptime_parts.append(f"{days} day{'s' if days != 1 else ''}")
-        if hours > 0:
-            uptime_parts.append(f"{hours} hour{'s' if hours != 1 else ''}")
-        if minutes > 0:
-            uptime_parts.append(f"{minutes} minute{'s' if minutes != 1 else ''}")
-        if seconds > 0 or not uptime_parts:
-            uptime_parts.append(f"{seconds} second{'s' if seconds != 1 else ''}")
-        
-        uptime_str = ", ".join(uptime_parts)
-        
         embed.add_field(
             name="🕐 Current Uptime",
             value=f"`{uptime_str}`",
@@ -3052,11 +3519,11 @@ async def uptime_command(ctx):
         )
         
         # Railway info
-        if os.getenv('RAILWAY_ENVIRONMENT'):
+        if RAILWAY_ENVIRONMENT:
             embed.add_field(
                 name="🚂 Railway Deployment",
-                value=f"**Environment:** {os.getenv('RAILWAY_ENVIRONMENT')}\n"
-                      f"**Service:** {os.getenv('RAILWAY_SERVICE_NAME', 'discord-bot')}\n"
+                value=f"**Environment:** {RAILWAY_ENVIRONMENT}\n"
+                      f"**Service:** {RAILWAY_SERVICE_NAME}\n"
                       f"**Running:** ✅ Active",
                 inline=False
             )
@@ -3076,6 +3543,57 @@ async def uptime_command(ctx):
     except Exception as e:
         await ctx.send(f"❌ Error showing uptime: {str(e)}")
 
+# Static help text for the priority commands
+PRIORITY_COMMANDS_TEXT = """
+`!priority level <LEVEL>` - Set minimum priority
+`!priority vip add <TICKER>` - Add VIP ticker
+`!priority vip remove <TICKER>` - Remove VIP ticker
+`!priority test <TICKER>` - Test priority scoring
+`!priority reload` - Reload from database
+            """
+
+PRIORITY_USAGE_HELP_TEXT = """
+**Usage Examples:**
+`!priority` - Show current settings
+`!priority level HIGH` - Set minimum priority to HIGH
+`!priority vip add MSFT` - Add MSFT to VIP tickers
+`!priority vip remove MSFT` - Remove MSFT from VIP tickers
+`!priority test AAPL` - Test priority scoring for AAPL
+`!priority reload` - Reload from database
+            """
+
+SCORING_SYSTEM_TEXT = """
+**Base Score:** 10 points
+**Strength Bonus:** Up to 25 points
+**System Bonus:** Up to 20 points
+**VIP Ticker Bonus:** 15 points
+**VIP Timeframe Bonus:** 10 points
+**Urgency Bonus:** Up to 20 points
+**Pattern Bonus:** Up to 30 points
+            """
+
+@lru_cache(maxsize=1)
+def priority_settings_text(config_version: int) -> str:
+    """Current level/threshold block, rebuilt only when priority_manager.config_version changes"""
+    return f"""
+**Minimum Priority Level:** {priority_manager.MIN_PRIORITY_LEVEL}
+**Critical Threshold:** {priority_manager.CRITICAL_THRESHOLD}
+**High Threshold:** {priority_manager.HIGH_THRESHOLD}
+**Medium Threshold:** {priority_manager.MEDIUM_THRESHOLD}
+**Low Threshold:** {priority_manager.LOW_THRESHOLD}
+            """
+
+@lru_cache(maxsize=1)
+def priority_thresholds_text(config_version: int) -> str:
+    """Threshold legend, rebuilt only when priority_manager.config_version changes"""
+    return f"""
+🚨 **Critical:** {priority_manager.CRITICAL_THRESHOLD}+ points
+⚠️ **High:** {priority_manager.HIGH_THRESHOLD}+ points  
+📊 **Medium:** {priority_manager.MEDIUM_THRESHOLD}+ points
+📢 **Low:** {priority_manager.LOW_THRESHOLD}+ points
+📝 **Minimal:** Below {priority_manager.LOW_THRESHOLD} points
+            """
+
 @bot.command(name='priority')
 async def priority_settings(ctx, action: str = None, sub_action: str = None, ticker: str = None):
     """Manage priority settings for signal notifications
@@ -3088,8 +3606,6 @@ async def priority_settings(ctx, action: str = None, sub_action: str = None, tic
     !priority test <TICKER> - Test priority scoring for a ticker
     !priority reload - Reload configuration from database
     """
-    from priority_manager import priority_manager
-    
     embed = discord.Embed(
         title="🎯 Priority Management",
         color=0x0099ff,
@@ -3100,19 +3616,13 @@ async def priority_settings(ctx, action: str = None, sub_action: str = None, tic
         # Show current settings
         embed.add_field(
             name="Current Settings",
-            value=f"""
-**Minimum Priority Level:** {priority_manager.MIN_PRIORITY_LEVEL}
-**Critical Threshold:** {priority_manager.CRITICAL_THRESHOLD}
-**High Threshold:** {priority_manager.HIGH_THRESHOLD}
-**Medium Threshold:** {priority_manager.MEDIUM_THRESHOLD}
-**Low Threshold:** {priority_manager.LOW_THRESHOLD}
-            """,
+            value=priority_settings_text(priority_manager.config_version),
             inline=False
         )
         
         embed.add_field(
             name="VIP Tickers",
-            value=", ".join(sorted(priority_manager.VIP_TICKERS)) or "None",
+            value=priority_manager.vip_tickers_display or "None",
             inline=False
         )
         
@@ -3124,13 +3634,7 @@ async def priority_settings(ctx, action: str = None, sub_action: str = None, tic
         
         embed.add_field(
             name="Available Commands",
-            value="""
-`!priority level <LEVEL>` - Set minimum priority
-`!priority vip add <TICKER>` - Add VIP ticker
-`!priority vip remove <TICKER>` - Remove VIP ticker
-`!priority test <TICKER>` - Test priority scoring
-`!priority reload` - Reload from database
-            """,
+            value=PRIORITY_COMMANDS_TEXT,
             inline=False
         )
         
@@ -3174,7 +3678,7 @@ async def priority_settings(ctx, action: str = None, sub_action: str = None, tic
             if success:
                 embed.add_field(
                     name="✅ VIP Ticker Added",
-                    value=f"Added **{ticker}** to VIP tickers list\n**Current VIP Tickers:** {', '.join(sorted(priority_manager.VIP_TICKERS))}",
+                    value=f"Added **{ticker}** to VIP tickers list\n**Current VIP Tickers:** {priority_manager.vip_tickers_display}",
                     inline=False
                 )
                 embed.add_field(
@@ -3198,7 +3702,7 @@ async def priority_settings(ctx, action: str = None, sub_action: str = None, tic
                 if success:
                     embed.add_field(
                         name="✅ VIP Ticker Removed", 
-                        value=f"Removed **{ticker}** from VIP tickers list\n**Current VIP Tickers:** {', '.join(sorted(priority_manager.VIP_TICKERS))}",
+                        value=f"Removed **{ticker}** from VIP tickers list\n**Current VIP Tickers:** {priority_manager.vip_tickers_display}",
                         inline=False
                     )
                     embed.add_field(
@@ -3247,6 +3751,7 @@ async def priority_settings(ctx, action: str = None, sub_action: str = None, tic
     
     elif action == "reload":
         success = await priority_manager.reload_from_database()
+        invalidate_db_cache()
         if success:
             embed.add_field(
                 name="✅ Configuration Reloaded",
@@ -3265,15 +3770,7 @@ async def priority_settings(ctx, action: str = None, sub_action: str = None, tic
     else:
         embed.add_field(
             name="❌ Invalid Command",
-            value="""
-**Usage Examples:**
-`!priority` - Show current settings
-`!priority level HIGH` - Set minimum priority to HIGH
-`!priority vip add MSFT` - Add MSFT to VIP tickers
-`!priority vip remove MSFT` - Remove MSFT from VIP tickers
-`!priority test AAPL` - Test priority scoring for AAPL
-`!priority reload` - Reload from database
-            """,
+            value=PRIORITY_USAGE_HELP_TEXT,
             inline=False
         )
     
@@ -3282,11 +3779,9 @@ async def priority_settings(ctx, action: str = None, sub_action: str = None, tic
 @bot.command(name='prioritystats')
 async def priority_statistics(ctx):
     """Show priority statistics for recent signals"""
-    from priority_manager import priority_manager
-    
     try:
         # Get recent notifications from database
-        recent_notifications = await get_stats()
+        recent_notifications = await get_cached_stats()
         
         embed = discord.Embed(
             title="📊 Priority Statistics",
@@ -3309,54 +3804,29 @@ async def priority_statistics(ctx):
             )
             
             # Priority distribution
-            priority_dist_raw = recent_notifications.get('priority_distribution', {})
-            if priority_dist_raw:
-                # Handle both dict and JSON string formats
-                if isinstance(priority_dist_raw, str):
-                    try:
-                        import json
-                        priority_dist = json.loads(priority_dist_raw)
-                    except json.JSONDecodeError:
-                        priority_dist = {}
-                else:
-                    priority_dist = priority_dist_raw
-                    
-                if priority_dist:
-                    embed.add_field(
-                        name="Priority Distribution (24h)",
-                        value=f"""
+            priority_dist = recent_notifications.get('priority_distribution', {})
+            if priority_dist:
+                embed.add_field(
+                    name="Priority Distribution (24h)",
+                    value=f"""
 🚨 **Critical:** {priority_dist.get('CRITICAL', 0)}
 ⚠️ **High:** {priority_dist.get('HIGH', 0)}
 📊 **Medium:** {priority_dist.get('MEDIUM', 0)}
 📢 **Low:** {priority_dist.get('LOW', 0)}
 📝 **Minimal:** {priority_dist.get('MINIMAL', 0)}
-                        """,
-                        inline=True
-                    )
+                    """,
+                    inline=True
+                )
         
         embed.add_field(
             name="Priority Thresholds",
-            value=f"""
-🚨 **Critical:** {priority_manager.CRITICAL_THRESHOLD}+ points
-⚠️ **High:** {priority_manager.HIGH_THRESHOLD}+ points  
-📊 **Medium:** {priority_manager.MEDIUM_THRESHOLD}+ points
-📢 **Low:** {priority_manager.LOW_THRESHOLD}+ points
-📝 **Minimal:** Below {priority_manager.LOW_THRESHOLD} points
-            """,
+            value=priority_thresholds_text(priority_manager.config_version),
             inline=False
         )
         
         embed.add_field(
             name="Scoring System",
-            value="""
-**Base Score:** 10 points
-**Strength Bonus:** Up to 25 points
-**System Bonus:** Up to 20 points
-**VIP Ticker Bonus:** 15 points
-**VIP Timeframe Bonus:** 10 points
-**Urgency Bonus:** Up to 20 points
-**Pattern Bonus:** Up to 30 points
-            """,
+            value=SCORING_SYSTEM_TEXT,
             inline=False
         )
         
@@ -3379,7 +3849,7 @@ async def signal_analytics(ctx, days: int = 7):
             await ctx.send("❌ Days must be between 1 and 30")
             return
             
-        analytics = await get_priority_analytics(days)
+        analytics = await get_cached_priority_analytics(days)
         
         if not analytics:
             await ctx.send("❌ No analytics data available")
@@ -3427,11 +3897,11 @@ async def signal_analytics(ctx, days: int = 7):
         # Top systems
         system_stats = analytics.get('system_stats', [])
         if system_stats:
-            top_systems = system_stats[:5]
-            systems_text = ""
-            for system in top_systems:
-                sent_rate = (system['sent_signals'] / max(system['total_signals'], 1)) * 100
-                systems_text += f"**{system['system']}:** {system['total_signals']} detected, {system['sent_signals']} sent ({sent_rate:.1f}%)\n"
+            systems_text = "\n".join(
+                f"**{system['system']}:** {system['total_signals']} detected, {system['sent_signals']} sent "
+                f"({(system['sent_signals'] * 100.0 / system['total_signals']) if system['total_signals'] else 0.0:.1f}%)"
+                for system in islice(system_stats, 5)
+            )
             
             embed.add_field(
                 name="🏗️ Top Systems",
@@ -3442,9 +3912,10 @@ async def signal_analytics(ctx, days: int = 7):
         # Top skipped signals (missed opportunities)
         top_skipped = analytics.get('top_skipped', [])
         if top_skipped:
-            skipped_text = ""
-            for signal in top_skipped[:5]:
-                skipped_text += f"**{signal['ticker']} {signal['signal_type']}:** Score {signal['priority_score']} ({signal['count']}x)\n"
+            skipped_text = "\n".join(
+                f"**{signal['ticker']} {signal['signal_type']}:** Score {signal['priority_score']} ({signal['count']}x)"
+                for signal in islice(top_skipped, 5)
+            )
             
             embed.add_field(
                 name="⚠️ Top Missed Opportunities",
@@ -3462,8 +3933,11 @@ async def signal_analytics(ctx, days: int = 7):
 @bot.command(name='utilization')
 async def signal_utilization(ctx):
     """Show detailed signal utilization analysis (last 24 hours)"""
+    def pct(sent, detected):
+        return (sent * 100.0 / detected) if detected else 0.0
+    
     try:
-        utilization = await get_signal_utilization()
+        utilization = await get_cached_signal_utilization()
         
         if not utilization:
             await ctx.send("❌ No utilization data available")
@@ -3479,11 +3953,10 @@ async def signal_utilization(ctx):
         # Signal type utilization
         signal_types = utilization.get('signal_type_stats', [])
         if signal_types:
-            top_signals = signal_types[:8]
-            signal_text = ""
-            for signal in top_signals:
-                utilization_rate = (signal['sent'] / max(signal['detected'], 1)) * 100
-                signal_text += f"**{signal['signal_type'][:20]}:** {signal['detected']} detected, {signal['sent']} sent ({utilization_rate:.1f}%)\n"
+            signal_text = "\n".join(
+                f"**{s['signal_type'][:20]}:** {s['detected']} detected, {s['sent']} sent ({pct(s['sent'], s['detected']):.1f}%)"
+                for s in islice(signal_types, 8)
+            )
             
             embed.add_field(
                 name="📊 Signal Type Utilization",
@@ -3494,10 +3967,10 @@ async def signal_utilization(ctx):
         # Timeframe utilization  
         timeframes = utilization.get('timeframe_stats', [])
         if timeframes:
-            timeframe_text = ""
-            for tf in timeframes:
-                utilization_rate = (tf['sent'] / max(tf['detected'], 1)) * 100
-                timeframe_text += f"**{tf['timeframe']}:** {tf['detected']} detected, {tf['sent']} sent ({utilization_rate:.1f}%)\n"
+            timeframe_text = "\n".join(
+                f"**{tf['timeframe']}:** {tf['detected']} detected, {tf['sent']} sent ({pct(tf['sent'], tf['detected']):.1f}%)"
+                for tf in timeframes
+            )
             
             embed.add_field(
                 name="⏱️ Timeframe Performance",
@@ -3508,10 +3981,10 @@ async def signal_utilization(ctx):
         # System utilization
         systems = utilization.get('system_utilization', [])
         if systems:
-            system_text = ""
-            for system in systems[:6]:
-                utilization_rate = (system['sent'] / max(system['detected'], 1)) * 100
-                system_text += f"**{system['system']}:** {system['detected']} detected, {system['sent']} sent ({utilization_rate:.1f}%)\n"
+            system_text = "\n".join(
+                f"**{system['system']}:** {system['detected']} detected, {system['sent']} sent ({pct(system['sent'], system['detected']):.1f}%)"
+                for system in islice(systems, 6)
+            )
             
             embed.add_field(
                 name="🏗️ System Utilization",
@@ -3522,9 +3995,10 @@ async def signal_utilization(ctx):
         # Missed opportunities
         missed = utilization.get('missed_opportunities', [])
         if missed:
-            missed_text = ""
-            for opp in missed[:5]:
-                missed_text += f"**{opp['ticker']} {opp['signal_type'][:15]}:** Score {opp['priority_score']} - {opp['skip_reason']}\n"
+            missed_text = "\n".join(
+                f"**{opp['ticker']} {opp['signal_type'][:15]}:** Score {opp['priority_score']} - {opp['skip_reason']}"
+                for opp in islice(missed, 5)
+            )
             
             embed.add_field(
                 name="💔 High-Priority Missed Opportunities",
@@ -3539,6 +4013,11 @@ async def signal_utilization(ctx):
     except Exception as e:
         await ctx.send(f"❌ Error getting utilization report: {e}")
 
+# skip_reason values recorded by should_notify for below-threshold signals
+BELOW_THRESHOLD_SKIP_REASONS = frozenset(
+    f"priority_below_threshold_{level.name.lower()}" for level in PriorityLevel
+)
+
 @bot.command(name='missed')
 async def missed_opportunities(ctx, hours: int = 24):
     """Show high-priority signals that were skipped recently
@@ -3554,7 +4033,7 @@ async def missed_opportunities(ctx, hours: int = 24):
             return
             
         # Get utilization data which includes missed opportunities
-        utilization = await get_signal_utilization()
+        utilization = await get_cached_signal_utilization()
         missed = utilization.get('missed_opportunities', [])
         
         if not missed:
@@ -3569,24 +4048,25 @@ async def missed_opportunities(ctx, hours: int = 24):
         )
         
         # Group by skip reason
-        skip_reasons = {}
+        skip_reasons = defaultdict(list)
         for signal in missed:
-            reason = signal.get('skip_reason', 'unknown')
-            if reason not in skip_reasons:
-                skip_reasons[reason] = []
-            skip_reasons[reason].append(signal)
+            skip_reasons[signal.get('skip_reason', 'unknown')].append(signal)
         
         # Show breakdown by reason
         for reason, signals in skip_reasons.items():
             if len(signals) > 5:
-                reason_text = f"**{len(signals)} signals skipped**\n"
-                for signal in signals[:3]:
-                    reason_text += f"• {signal['ticker']} {signal['signal_type'][:20]} (Score: {signal['priority_score']})\n"
-                reason_text += f"• ... and {len(signals)-3} more"
+                reason_lines = [f"**{len(signals)} signals skipped**"]
+                reason_lines.extend(
+                    f"• {signal['ticker']} {signal['signal_type'][:20]} (Score: {signal['priority_score']})"
+                    for signal in signals[:3]
+                )
+                reason_lines.append(f"• ... and {len(signals)-3} more")
+                reason_text = "\n".join(reason_lines)
             else:
-                reason_text = ""
-                for signal in signals:
-                    reason_text += f"• **{signal['ticker']}** {signal['signal_type'][:25]} (Score: {signal['priority_score']})\n"
+                reason_text = "\n".join(
+                    f"• **{signal['ticker']}** {signal['signal_type'][:25]} (Score: {signal['priority_score']})"
+                    for signal in signals
+                )
             
             embed.add_field(
                 name=f"Reason: {reason.replace('_', ' ').title()}",
@@ -3596,7 +4076,7 @@ async def missed_opportunities(ctx, hours: int = 24):
         
         # Add suggestions
         suggestions = ""
-        if any('priority_below_threshold' in reason for reason in skip_reasons.keys()):
+        if not BELOW_THRESHOLD_SKIP_REASONS.isdisjoint(skip_reasons):
             suggestions += "• Consider lowering `MIN_PRIORITY_LEVEL` to capture more signals\n"
         if 'duplicate_notification' in skip_reasons:
             suggestions += "• Many duplicates found - this is normal and prevents spam\n"
@@ -3615,16 +4095,32 @@ async def missed_opportunities(ctx, hours: int = 24):
     except Exception as e:
         await ctx.send(f"❌ Error getting missed opportunities: {e}")
 
+# (threshold, label) rating tables for !signalreport, checked top-down with value > threshold
+_PERF_RATINGS = ((80, "✅ Excellent"), (50, "⚠️ Needs Attention"), (float('-inf'), "❌ Poor"))
+_COVERAGE_RATINGS = ((50, "Comprehensive"), (20, "Moderate"), (float('-inf'), "Limited"))
+_QUALITY_RATINGS = ((60, "High"), (40, "Medium"), (float('-inf'), "Low"))
+
+def _rate(value, table) -> str:
+    """Label for value from a rating table"""
+    return next(label for threshold, label in table if value > threshold)
+
 @bot.command(name='signalreport')
 async def comprehensive_signal_report(ctx):
     """Generate a comprehensive signal detection and utilization report"""
+    # Defaults for the recommendations when stats or analytics are unavailable
+    utilization_rate = 0
+    avg_priority = 0
+    total_detected = 0
+    
     try:
         # Send typing indicator for longer operation
         async with ctx.typing():
-            # Get both analytics and utilization data
-            analytics = await get_priority_analytics(7)
-            utilization = await get_signal_utilization()
-            stats = await get_stats()
+            # Get analytics, utilization and stats data concurrently
+            analytics, utilization, stats = await asyncio.gather(
+                get_cached_priority_analytics(7),
+                get_cached_signal_utilization(),
+                get_cached_stats()
+            )
             
             embed = discord.Embed(
                 title="📋 Comprehensive Signal Report",
@@ -3642,11 +4138,11 @@ async def comprehensive_signal_report(ctx):
                 embed.add_field(
                     name="📈 Executive Summary",
                     value=f"""
-**Overall Performance:** {'✅ Excellent' if utilization_rate > 80 else '⚠️ Needs Attention' if utilization_rate > 50 else '❌ Poor'}
+**Overall Performance:** {_rate(utilization_rate, _PERF_RATINGS)}
 **Detection Rate:** {total_detected} signals/day
 **Notification Rate:** {total_sent} alerts/day  
 **Utilization Efficiency:** {utilization_rate}%
-**Signal Coverage:** {'Comprehensive' if total_detected > 50 else 'Moderate' if total_detected > 20 else 'Limited'}
+**Signal Coverage:** {_rate(total_detected, _COVERAGE_RATINGS)}
                     """,
                     inline=False
                 )
@@ -3664,7 +4160,7 @@ async def comprehensive_signal_report(ctx):
 **Signals Detected:** {total_detected_7d}
 **Notifications Sent:** {total_sent_7d}
 **Average Priority:** {avg_priority:.1f}
-**Signal Quality:** {'High' if avg_priority > 60 else 'Medium' if avg_priority > 40 else 'Low'}
+**Signal Quality:** {_rate(avg_priority, _QUALITY_RATINGS)}
                     """,
                     inline=True
                 )
@@ -3683,17 +4179,14 @@ async def comprehensive_signal_report(ctx):
                     inline=True
                 )
             
-            # Recommendations
-            recommendations = []
-            
-            if utilization_rate < 50:
-                recommendations.append("• Consider lowering priority thresholds to catch more signals")
-            if avg_priority < 40:
-                recommendations.append("• Review VIP ticker and timeframe settings")
-            if total_detected < 20:
-                recommendations.append("• Add more tickers or timeframes for better coverage")
-            if not recommendations:
-                recommendations.append("• System is performing well - continue monitoring")
+            # Recommendations (falls back to the all-clear message when none apply)
+            recommendations = [
+                text for applies, text in (
+                    (utilization_rate < 50, "• Consider lowering priority thresholds to catch more signals"),
+                    (avg_priority < 40, "• Review VIP ticker and timeframe settings"),
+                    (total_detected < 20, "• Add more tickers or timeframes for better coverage"),
+                ) if applies
+            ] or ["• System is performing well - continue monitoring"]
                 
             embed.add_field(
                 name="💡 Recommendations",
@@ -3719,17 +4212,28 @@ async def smart_signal_check(cycle_count: int, is_priority: bool, reason: str):
         total_signals = 0
         notified_signals = 0
         
-        print(f"\n🎯 Smart Signal Check #{cycle_count}")
-        print(f"🕐 Check time: {cycle_start.strftime('%Y-%m-%d %I:%M:%S %p EST')}")
-        print(f"📋 Reason: {reason}")
-        print(f"⭐ Priority run: {'Yes' if is_priority else 'No'}")
+        # One lazily formatted record per cycle header
+        logger.info("🎯 Smart check #%d at %s reason=%s priority=%s",
+                    cycle_count, cycle_start.strftime('%Y-%m-%d %I:%M:%S %p EST'), reason, is_priority)
         
         # Railway health logging
-        if os.getenv('RAILWAY_ENVIRONMENT'):
-            print(f"🚂 Railway check #{cycle_count} - Smart scheduler active")
+        if RAILWAY_ENVIRONMENT and logger.isEnabledFor(logging.INFO):
+            logger.info("🚂 Railway check #%d - Smart scheduler active", cycle_count)
+        
+        # Work out this cycle's ticker/timeframe pairs up front so idle cycles cost nothing
+        eligible = [(ticker, timeframe) for timeframe, tickers in TF_TO_TICKERS.items() for ticker in tickers]
+        if not eligible:
+            logger.info("💤 No ticker-timeframe combinations configured - nothing to check this cycle")
+            return
+        
+        # Start each cycle with fresh API data
+        clear_signal_cache()
+        
+        # Reuse the shared notifier instance
+        notifier = _get_notifier(bot)
         
-        # Create notifier instance
-        notifier = SignalNotifier(bot)
+        # Fetch every pair's API data concurrently; the loop below then reads it back in order
+        await notifier.prefetch_signal_timelines(eligible)
         
         # Periodic cleanup of old notifications (every 10 cycles) - DISABLED
         # if cycle_count % 10 == 0:
@@ -3742,73 +4246,76 @@ async def smart_signal_check(cycle_count: int, is_priority: bool, reason: str):
             try:
                 analytics_success = await update_daily_analytics()
                 if analytics_success:
-                    print(f"📊 Updated daily analytics for today")
+                    logger.info("📊 Updated daily analytics for today")
                 else:
-                    print(f"⚠️ Failed to update daily analytics")
+                    logger.warning("⚠️ Failed to update daily analytics")
             except Exception as e:
-                print(f"❌ Error updating analytics (non-critical): {e}")
+                logger.error("❌ Error updating analytics (non-critical): %s", e)
                 # Don't let analytics errors break the main signal checking loop
         
         # Check each ticker across all timeframes
         api_errors = 0
         discord_errors = 0
         
-        current_hour = cycle_start.hour
-        
-        for ticker in TICKERS:
-            for timeframe in TIMEFRAMES:
-
+        for ticker, timeframe in eligible:
+            if bot.is_closed():
+                logger.info("🛑 Bot connection closed - aborting smart signal check")
+                notifier.clear_prefetched()
+                return
+            
+            try:
+                logger.info("📊 Checking %s (%s)...", ticker, timeframe)
                 
-                try:
-                    print(f"\n📊 Checking {ticker} ({timeframe})...")
+                # Get recent signals using comprehensive detection
+                recent_signals = notifier.check_for_new_signals(ticker, timeframe)
+                total_signals += len(recent_signals)
+                
+                if recent_signals:
+                    logger.info("✅ Found %d recent signals for %s (%s)", len(recent_signals), ticker, timeframe)
                     
-                    # Get recent signals using comprehensive detection
-                    recent_signals = notifier.check_for_new_signals(ticker, timeframe)
-                    total_signals += len(recent_signals)
+                    # Filter signals that should trigger notifications
+                    notify_signals = []
+                    for signal in unique_signals(recent_signals):
+                        should_notify_result = await notifier.should_notify(signal, ticker, timeframe)
+                        if should_notify_result:
+                            notify_signals.append(signal)
                     
-                    if recent_signals:
-                        print(f"✅ Found {len(recent_signals)} recent signals for {ticker} ({timeframe})")
+                    if notify_signals:
+                        logger.info("🚨 %d signals meet notification criteria", len(notify_signals))
+                        notified_signals += len(notify_signals)
                         
-                        # Filter signals that should trigger notifications
-                        notify_signals = []
-                        for signal in recent_signals:
-                            should_notify_result = await notifier.should_notify(signal, ticker, timeframe)
-                            if should_notify_result:
-                                notify_signals.append(signal)
-                        
-                        if notify_signals:
-                            print(f"🚨 {len(notify_signals)} signals meet notification criteria")
-                            notified_signals += len(notify_signals)
-                            
-                            # Send notifications for qualifying signals
-                            for signal in notify_signals:
-                                try:
-                                    await notifier.send_signal_notification(signal, ticker, timeframe)
-                                    await asyncio.sleep(1)  # Rate limiting
-                                    health_stats['total_notifications_sent'] += 1
-                                except Exception as e:
-                                    print(f"❌ Discord error sending notification: {e}")
-                                    discord_errors += 1
-                                    health_stats['discord_errors'] += 1
-                        else:
-                            print(f"🔕 No signals meet notification criteria for {ticker} ({timeframe})")
+                        # Send notifications for qualifying signals
+                        for signal in notify_signals:
+                            try:
+                                async with notification_limiter:
+                                    await notifier.send_signal_notification(signal, ticker, timeframe, now=cycle_start)
+                                health_stats.total_notifications_sent += 1
+                            except Exception as e:
+                                logger.error("❌ Discord error sending notification: %s", e)
+                                discord_errors += 1
+                                health_stats.discord_errors += 1
                     else:
-                        print(f"ℹ️ No recent signals for {ticker} ({timeframe})")
-                    
-                    # Brief pause between tickers
-                    await asyncio.sleep(0.5)
-                    
-                except requests.exceptions.RequestException as e:
-                    print(f"❌ API error checking {ticker} ({timeframe}): {e}")
-                    api_errors += 1
-                    health_stats['api_errors'] += 1
-                    continue
-                except Exception as e:
-                    print(f"❌ Unexpected error checking {ticker} ({timeframe}): {e}")
-                    continue
+                        logger.info("🔕 No signals meet notification criteria for %s (%s)", ticker, timeframe)
+                else:
+                    logger.info("ℹ️ No recent signals for %s (%s)", ticker, timeframe)
+                
+                # Brief pause between tickers
+                await asyncio.sleep(0.5)
+                
+            except requests.exceptions.RequestException as e:
+                logger.error("❌ API error checking %s (%s): %s", ticker, timeframe, e)
+                api_errors += 1
+                health_stats.api_errors += 1
+                continue
+            except Exception as e:
+                logger.error("❌ Unexpected error checking %s (%s): %s", ticker, timeframe, e)
+                continue
+        
+        # Reap this cycle's background notification writes
+        await notifier.flush_pending_writes()
         
         # Update health stats
-        health_stats['total_signals_found'] += total_signals
+        health_stats.total_signals_found += total_signals
         last_successful_check = cycle_start
         
         # Calculate cycle duration and update bot presence
@@ -3826,36 +4333,36 @@ async def smart_signal_check(cycle_count: int, is_priority: bool, reason: str):
             else:
                 status_text = f"Next: {seconds}s"
             
-            await bot.change_presence(
-                activity=discord.Activity(
-                    type=discord.ActivityType.watching,
-                    name=status_text
-                )
-            )
-        
-        # Enhanced summary logging
-        print(f"\n📋 Smart Check #{cycle_count} completed!")
-        print(f"⏱️ Duration: {cycle_duration:.1f} seconds")
-        print(f"📊 Total signals found: {total_signals}")
-        print(f"🚨 Notifications sent: {notified_signals}")
-        print(f"❌ API errors: {api_errors}")
-        print(f"❌ Discord errors: {discord_errors}")
-        
-        if smart_scheduler:
-            next_runs = smart_scheduler.get_next_run_times(1)
-            if next_runs:
-                next_run = next_runs[0]
-                print(f"⏰ Next check: {next_run.strftime('%I:%M:%S %p EST')} ({smart_scheduler.get_run_reason(next_run)})")
-        
-        # Railway-specific logging
-        if os.getenv('RAILWAY_ENVIRONMENT'):
-            uptime = cycle_end - bot_start_time if bot_start_time else timedelta(0)
-            print(f"🚂 Railway uptime: {uptime}")
-            print(f"🔧 Railway health: ✅ Smart scheduler running normally")
+            await update_presence(status_text)
+        
+        # Enhanced summary logging - built only when INFO is enabled, written as one record
+        if logger.isEnabledFor(logging.INFO):
+            summary = [
+                f"📋 Smart Check #{cycle_count} completed!",
+                f"⏱️ Duration: {cycle_duration:.1f} seconds",
+                f"📊 Total signals found: {total_signals}",
+                f"🚨 Notifications sent: {notified_signals}",
+                f"❌ API errors: {api_errors}",
+                f"❌ Discord errors: {discord_errors}"
+            ]
+            
+            if smart_scheduler:
+                next_runs = smart_scheduler.get_next_run_times(1, with_details=True)
+                if next_runs:
+                    next_run, next_reason, _, _ = next_runs[0]
+                    summary.append(f"⏰ Next check: {next_run.strftime('%I:%M:%S %p EST')} ({next_reason})")
+            
+            # Railway-specific logging
+            if RAILWAY_ENVIRONMENT:
+                uptime = cycle_end - bot_start_time if bot_start_time else timedelta(0)
+                summary.append(f"🚂 Railway uptime: {uptime}")
+                summary.append("🔧 Railway health: ✅ Smart scheduler running normally")
+            
+            logger.info("\n".join(summary))
                 
     except Exception as e:
-        print(f"❌ Critical error in smart signal check: {e}")
-        health_stats['failed_checks'] += 1
+        logger.error("❌ Critical error in smart signal check: %s", e)
+        health_stats.failed_checks += 1
         
         # Try to notify about the error
         try:
@@ -3904,7 +4411,6 @@ async def database_sync(ctx):
         
         # Compare with current memory
         global TICKERS
-        from priority_manager import priority_manager
         
         memory_tickers = set(TICKERS)
         memory_vip = set(priority_manager.VIP_TICKERS)
@@ -4205,11 +4711,12 @@ async def manual_analytics_update(ctx, date: str = None):
 async def analytics_health_check(ctx):
     """Check the health and status of the analytics system"""
     try:
+        now = datetime.now(EST)
         embed = discord.Embed(
             title="🔬 Analytics System Health Check",
             description="Comprehensive status of the analytics and database system",
             color=0x00ff88,
-            timestamp=datetime.now(EST)
+            timestamp=now
         )
         
         # Test database connection and table existence
@@ -4268,9 +4775,8 @@ async def analytics_health_check(ctx):
         )
         
         # Data freshness check
-        current_time = datetime.now(EST)
         if last_successful_check:
-            time_since_last = current_time - last_successful_check
+            time_since_last = now - last_successful_check
             if time_since_last.total_seconds() < 3600:  # Less than 1 hour
                 data_freshness = f"✅ Fresh ({time_since_last.total_seconds()//60:.0f}m ago)"
             else:
@@ -4665,7 +5171,7 @@ async def vip_ticker_status(ctx):
         # VIP ticker details
         if validation['valid_vips']:
             vip_details = []
-            for vip in sorted(validation['valid_vips'])[:10]:
+            for vip in heapq.nsmallest(10, validation['valid_vips']):
                 # Check if this ticker is actively monitored
                 monitoring_status = "🟢 Monitored" if vip in db_tickers else "🔴 Not Monitored"
                 vip_details.append(f"• **{vip}** - {monitoring_status}")
@@ -4690,7 +5196,7 @@ async def vip_ticker_status(ctx):
         # Monitoring suggestions
         non_vip_monitored = set(db_tickers) - set(vip_tickers)
         if non_vip_monitored:
-            suggestions = sorted(list(non_vip_monitored))[:5]
+            suggestions = heapq.nsmallest(5, non_vip_monitored)
             embed.add_field(
                 name="💡 Potential VIP Candidates",
                 value=f"Monitored tickers that could be added as VIP:\n`{', '.join(suggestions)}`{'...' if len(non_vip_monitored) > 5 else ''}",
@@ -5519,7 +6025,7 @@ async def debug_api_response(ctx, ticker: str = "AAPL", timeframe: str = "1d"):
     """
     try:
         async with ctx.typing():
-            notifier = SignalNotifier(bot)
+            notifier = _get_notifier(bot)
             
             # Make API call
             params = {
@@ -5527,23 +6033,24 @@ async def debug_api_response(ctx, ticker: str = "AAPL", timeframe: str = "1d"):
                 'interval': timeframe,
                 'period': '1mo'
             }
-            response = requests.get(f"{API_BASE_URL}/api/analyzer-b", params=params, timeout=30)
+            response = api_session.get(f"{API_BASE_URL}/api/analyzer-b", params=params, timeout=API_TIMEOUT)
             
             if response.status_code == 200:
                 data = response.json()
                 
                 embed = discord.Embed(
                     title=f"🔍 API Response Debug: {ticker.upper()} ({timeframe})",
-                    description="Analyzing API response structure for pricing data",
+                    description=("Analyzing API response structure for pricing data\n"
+                                 f"Content-Encoding: `{response.headers.get('Content-Encoding', 'identity')}`"),
                     color=0x9932cc,
                     timestamp=datetime.now(EST)
                 )
                 
                 # Show main keys
-                main_keys = list(data.keys()) if isinstance(data, dict) else []
+                main_keys = data if isinstance(data, dict) else {}
                 embed.add_field(
                     name="🗝️ Main Response Keys",
-                    value=f"```{', '.join(main_keys[:10])}{'...' if len(main_keys) > 10 else ''}```",
+                    value=f"```{', '.join(islice(main_keys, 10))}{'...' if len(main_keys) > 10 else ''}```",
                     inline=False
                 )
                 
@@ -5555,9 +6062,9 @@ async def debug_api_response(ctx, ticker: str = "AAPL", timeframe: str = "1d"):
                             first_item = value[0]
                             if isinstance(first_item, dict):
                                 item_keys = list(first_item.keys())
-                                # Check if it looks like pricing data
-                                price_indicators = ['price', 'close', 'open', 'high', 'low', 'volume', 'timestamp', 'date', 'time']
-                                if any(indicator in ' '.join(item_keys).lower() for indicator in price_indicators):
+                                # Check if it looks like pricing data (substring match, so 'adjClose' counts)
+                                keys_lower = ' '.join(item_keys).lower()
+                                if any(indicator in keys_lower for indicator in PRICE_KEY_INDICATORS):
                                     pricing_candidates.append({
                                         'key': key,
                                         'count': len(value),
@@ -5761,7 +6268,7 @@ async def debug_auto_performance(ctx, ticker: str = "AAPL", timeframe: str = "1d
         )
         
         async with ctx.typing():
-            notifier = SignalNotifier(bot)
+            notifier = _get_notifier(bot)
             debug_info = []
             
             # Step 1: Check DATABASE_URL
@@ -5821,13 +6328,12 @@ async def debug_auto_performance(ctx, ticker: str = "AAPL", timeframe: str = "1d
             
             # Step 4: Test API call and data extraction
             try:
-                import requests
                 params = {
                     'ticker': ticker.upper(),
                     'interval': timeframe,
                     'period': '1mo'
                 }
-                response = requests.get(f"{API_BASE_URL}/api/analyzer-b", params=params, timeout=30)
+                response = api_session.get(f"{API_BASE_URL}/api/analyzer-b", params=params, timeout=API_TIMEOUT)
                 
                 if response.status_code == 200:
                     debug_info.append(f"✅ API call successful (status: {response.status_code})")
@@ -5841,12 +6347,12 @@ async def debug_auto_performance(ctx, ticker: str = "AAPL", timeframe: str = "1d
                         # Show sample of pricing data
                         if len(pricing_data) > 0:
                             sample = pricing_data[0]
-                            sample_keys = list(sample.keys())[:5]
+                            sample_keys = list(islice(sample, 5))
                             debug_info.append(f"📊 Sample data keys: {', '.join(sample_keys)}")
                     else:
                         debug_info.append("❌ Failed to extract pricing data from API response")
                         # Show API response structure
-                        api_keys = list(api_data.keys())[:5] if isinstance(api_data, dict) else []
+                        api_keys = list(islice(api_data, 5)) if isinstance(api_data, dict) else []
                         debug_info.append(f"🔍 API response keys: {', '.join(api_keys)}")
                         
                 else:
@@ -6316,10 +6822,7 @@ async def signal_quality_analysis(ctx, ticker: str = "AAPL", limit: int = 5):
                     )
                     
                     # Quality distribution
-                    grades = [r['quality']['grade'] for r in quality_results]
-                    grade_counts = {}
-                    for grade in grades:
-                        grade_counts[grade] = grade_counts.get(grade, 0) + 1
+                    grade_counts = Counter(r['quality']['grade'] for r in quality_results)
                     
                     distribution_text = ""
                     for grade, count in sorted(grade_counts.items(), reverse=True):
@@ -5,14 +5,41 @@ Runs signal checks at optimal times aligned with market candle closes.
 """
 
 import asyncio
-import pytz
-from datetime import datetime, timedelta
-from typing import Callable, List, Optional
+import bisect
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+from functools import lru_cache
+from itertools import islice
+from types import MappingProxyType
+from typing import Callable, Iterator, List, Mapping, Optional, Tuple
 import logging
 
 # Timezone setup
-EST = pytz.timezone('US/Eastern')
-UTC = pytz.UTC
+EST = ZoneInfo('US/Eastern')
+UTC = timezone.utc
+
+# (weekday, hour, minute) EST triples when the market is open: Mon-Fri 9:30 AM - 4:00 PM
+MARKET_OPEN_MINUTES = frozenset(
+    (weekday, hour, minute)
+    for weekday in range(5)
+    for hour in range(9, 16)
+    for minute in range(60)
+    if not (hour == 9 and minute < 30)
+)
+
+# Upcoming run with its metadata: (run_time, reason, is_priority, is_market_hours)
+RunSlot = Tuple[datetime, str, bool, bool]
+
+# Longest single sleep while waiting for a run; the wall clock is rechecked after each
+WAIT_CHUNK_SECONDS = 30
+
+# How far ahead the run walk looks; a week covers any configured schedule
+LOOKAHEAD_HOURS = 168
+
+# Upper bound for the retry delay after consecutive scheduler errors
+MAX_BACKOFF_SECONDS = 300.0
 
 class SmartScheduler:
     """Smart scheduler that runs signal checks at optimal market times"""
@@ -22,144 +49,213 @@ class SmartScheduler:
         self.logger = logger or logging.getLogger(__name__)
         self.running = False
         self.task = None
+        self._stopped = asyncio.Event()
+        self._stopped.set()  # Not running yet
         
         # Configuration
-        self.run_at_minutes = [2, 17, 32, 47]  # Run 2 minutes after each quarter-hour
-        self.priority_run_minutes = [2, 32]     # Priority runs at 2 and 32 minutes (near hourly closes)
+        self.run_at_minutes = SchedulerConfig.MARKET_HOURS_SCHEDULE          # Run 2 minutes after each quarter-hour
+        self.after_hours_run_minutes = SchedulerConfig.AFTER_HOURS_SCHEDULE  # Only the two candle closes outside market hours
+        self.priority_run_minutes = frozenset(SchedulerConfig.PRIORITY_MINUTES)  # Priority runs at 2 and 32 minutes (near hourly closes)
+        self._reason_map = {
+            2: "Hourly candle close (priority)",
+            17: "Mid-hour update",
+            32: "Half-hour candle close (priority)",
+            47: "Quarter-hour update",
+        }
         self.market_hours_start = 9  # 9:30 AM EST (market open)
         self.market_hours_end = 16   # 4:00 PM EST (market close)
         self.after_hours_frequency = 2  # Only run twice per hour after market close
         
-    def get_next_run_times(self, count: int = 5) -> List[datetime]:
-        """Get the next N scheduled run times"""
+        # Delay before retrying after a failed cycle; doubles per failure, reset on success
+        self._backoff = 1.0
+        
+        # (first run, upcoming run details) from the last lookup; valid until the first run passes
+        self._cached_next: Optional[Tuple[datetime, List[RunSlot]]] = None
+        self.build_schedule()
+        
+    def build_schedule(self):
+        """Precompute the day's run slots; call again after changing the minute lists"""
+        # Hours whose top-of-hour falls in market hours run every configured minute,
+        # all other hours run the after-hours minutes
+        def day_slots(weekday: int) -> list:
+            slots = []
+            for hour in range(24):
+                minutes = self.run_at_minutes if (weekday, hour, 0) in MARKET_OPEN_MINUTES else self.after_hours_run_minutes
+                for minute in sorted(minutes):
+                    slots.append((hour, minute, minute in self.priority_run_minutes,
+                                  self._reason_map.get(minute, "Scheduled check")))
+            return slots
+        
+        # Each table is (hour, minute, is_priority, reason), sorted by time of day
+        self._weekday_slots = day_slots(0)
+        self._weekend_slots = day_slots(5)
+        self._weekday_keys = [hour * 60 + minute for hour, minute, _, _ in self._weekday_slots]
+        self._weekend_keys = [hour * 60 + minute for hour, minute, _, _ in self._weekend_slots]
+        self._cached_next = None
+        
+    def get_next_run_times(self, count: int = 5, with_details: bool = False) -> list:
+        """Get the next N scheduled run times
+        
+        With with_details=True each entry is a (run_time, reason, is_priority, is_market_hours)
+        tuple, so callers don't have to look those up per run.
+        """
         now = datetime.now(EST)
-        run_times = []
         
-        # Start from current hour
-        current_hour = now.replace(minute=0, second=0, microsecond=0)
+        cached = self._cached_next
+        if cached and cached[0].timestamp() > now.timestamp() and len(cached[1]) >= count:
+            runs = cached[1][:count]
+        else:
+            runs = self._compute_next_run_times(now, max(count, 5))
+            if runs:
+                self._cached_next = (runs[0][0], runs)
+            runs = runs[:count]
         
-        for hour_offset in range(24):  # Check next 24 hours
-            check_time = current_hour + timedelta(hours=hour_offset)
-            
-            # Determine which minutes to run based on market hours
-            if self.is_market_hours(check_time):
-                # Market hours: run at all configured minutes
-                minutes_to_run = self.run_at_minutes
+        return runs if with_details else [run[0] for run in runs]
+    
+    def _compute_next_run_times(self, now: datetime, count: int) -> List[RunSlot]:
+        """Take the first count runs from the slot walk"""
+        return list(islice(self._iter_run_times(now), count))
+    
+    def _iter_run_times(self, now: datetime) -> Iterator[RunSlot]:
+        """Yield upcoming runs in order, stopping LOOKAHEAD_HOURS after now"""
+        # Compare timestamps: datetimes sharing the EST tzinfo compare by wall clock and ignore fold
+        now_ts = now.timestamp()
+        horizon_ts = now_ts + LOOKAHEAD_HOURS * 3600
+        
+        # Slots strictly after the current minute are still ahead of us today, unless
+        # we're in the repeated fall-back hour where the wall minute doesn't say which pass
+        day = now.replace(hour=0, minute=0, second=0, microsecond=0, fold=0)
+        minute_of_day = now.hour * 60 + now.minute
+        now_ambiguous = now.replace(fold=1 - now.fold).utcoffset() != now.utcoffset()
+        
+        for day_offset in range(LOOKAHEAD_HOURS // 24 + 1):
+            weekday = day.weekday()
+            if weekday < 5:
+                slots, keys = self._weekday_slots, self._weekday_keys
             else:
-                # After hours: only run at priority times
-                minutes_to_run = self.priority_run_minutes
+                slots, keys = self._weekend_slots, self._weekend_keys
             
-            for minute in minutes_to_run:
-                run_time = check_time.replace(minute=minute, second=0, microsecond=0)
-                
-                # Only add future times
-                if run_time > now:
-                    run_times.append(run_time)
-                    
-                # Stop when we have enough
-                if len(run_times) >= count:
-                    return run_times[:count]
+            start = bisect.bisect_right(keys, minute_of_day) if day_offset == 0 and not now_ambiguous else 0
+            for run in self._day_runs(day, weekday, slots[start:]):
+                run_ts = run[0].timestamp()
+                if run_ts > horizon_ts:
+                    return
+                if run_ts > now_ts:
+                    yield run
+            
+            day += timedelta(days=1)
+    
+    @staticmethod
+    def _day_runs(day: datetime, weekday: int, slots: list) -> Iterator[RunSlot]:
+        """Turn one day's slots into runs, matching the real clock on DST change days
         
-        return run_times[:count]
+        Slots in the spring-forward gap are dropped (that hour's runs happen at the
+        shifted wall times), and slots in the fall-back hour run on both passes.
+        """
+        repeated = []
+        for hour, minute, is_priority, reason in slots:
+            run_time = day.replace(hour=hour, minute=minute)
+            run = (run_time, reason, is_priority, (weekday, hour, minute) in MARKET_OPEN_MINUTES)
+            second_pass = run_time.replace(fold=1)
+            if second_pass.utcoffset() != run_time.utcoffset():
+                if run_time.astimezone(UTC).astimezone(EST).hour != hour:
+                    continue
+                repeated.append((second_pass, *run[1:]))
+            elif repeated:
+                yield from repeated
+                repeated = []
+            yield run
+        yield from repeated
     
     def is_market_hours(self, dt: datetime) -> bool:
         """Check if datetime is during market hours (9:30 AM - 4:00 PM EST, Mon-Fri)"""
-        # Convert to EST if needed
-        if dt.tzinfo != EST:
+        # Convert only when the wall clock isn't already Eastern time
+        if dt.tzinfo is not EST and (dt.tzinfo is None or dt.utcoffset() != EST.utcoffset(dt)):
             dt = dt.astimezone(EST)
         
-        # Check if it's a weekday
-        if dt.weekday() >= 5:  # Saturday = 5, Sunday = 6
-            return False
-        
-        # Check if it's within market hours
-        hour = dt.hour
-        minute = dt.minute
-        
-        # Market opens at 9:30 AM
-        if hour < 9 or (hour == 9 and minute < 30):
-            return False
-        
-        # Market closes at 4:00 PM
-        if hour >= 16:
-            return False
-            
-        return True
+        return self._is_market_hours_est(dt)
+    
+    @staticmethod
+    def _is_market_hours_est(dt: datetime) -> bool:
+        """is_market_hours for datetimes already in EST (everything the scheduler builds itself)"""
+        return (dt.weekday(), dt.hour, dt.minute) in MARKET_OPEN_MINUTES
     
     def get_time_until_next_run(self) -> timedelta:
         """Get time until next scheduled run"""
         next_runs = self.get_next_run_times(1)
         if next_runs:
             now = datetime.now(EST)
-            return next_runs[0] - now
+            return timedelta(seconds=next_runs[0].timestamp() - now.timestamp())
         return timedelta(seconds=300)  # Fallback to 5 minutes
     
     def get_run_reason(self, run_time: datetime) -> str:
         """Get the reason for this scheduled run"""
-        minute = run_time.minute
-        
-        if minute == 2:
-            return "Hourly candle close (priority)"
-        elif minute == 17:
-            return "Mid-hour update"
-        elif minute == 32:
-            return "Half-hour candle close (priority)"
-        elif minute == 47:
-            return "Quarter-hour update"
-        else:
-            return "Scheduled check"
+        return self._reason_map.get(run_time.minute, "Scheduled check")
     
     async def wait_until_next_run(self) -> datetime:
         """Wait until the next optimal run time"""
         next_run_time = self.get_next_run_times(1)[0]
         now = datetime.now(EST)
-        wait_time = (next_run_time - now).total_seconds()
+        # Timestamps, not datetime subtraction: same-tzinfo differences ignore DST offset changes
+        wait_time = next_run_time.timestamp() - now.timestamp()
         
         if wait_time > 0:
             self.logger.info(f"⏰ Next run scheduled for {next_run_time.strftime('%I:%M:%S %p EST')} ({self.get_run_reason(next_run_time)})")
             self.logger.info(f"⏳ Waiting {int(wait_time // 60)}m {int(wait_time % 60)}s...")
-            await asyncio.sleep(wait_time)
+            
+            # Sleep in short chunks against the wall clock so suspend/resume, clock
+            # adjustments and DST changes correct themselves on the next chunk
+            loop = asyncio.get_running_loop()
+            while (remaining := next_run_time.timestamp() - time.time()) > 0:
+                await asyncio.sleep(min(remaining + loop.clock_resolution, WAIT_CHUNK_SECONDS))
         
         return next_run_time
     
     async def run_scheduler(self):
         """Main scheduler loop"""
         self.logger.info("🎯 Smart Scheduler started")
-        self.logger.info(f"📅 Market hours schedule: {self.run_at_minutes} minutes past each hour")
-        self.logger.info(f"🌙 After hours schedule: {self.priority_run_minutes} minutes past each hour")
+        self.logger.info(f"📅 Market hours schedule: {list(self.run_at_minutes)} minutes past each hour")
+        self.logger.info(f"🌙 After hours schedule: {list(self.after_hours_run_minutes)} minutes past each hour")
         
         cycle_count = 0
         
-        while self.running:
-            try:
-                # Wait until next optimal time
-                run_time = await self.wait_until_next_run()
-                
-                if not self.running:
+        try:
+            while self.running:
+                try:
+                    # Wait until next optimal time
+                    run_time = await self.wait_until_next_run()
+                    
+                    if not self.running:
+                        break
+                    
+                    cycle_count += 1
+                    reason = self.get_run_reason(run_time)
+                    is_priority = run_time.minute in self.priority_run_minutes
+                    
+                    self.logger.info(f"\n🚀 Starting signal check #{cycle_count}")
+                    self.logger.info(f"🕐 Run time: {run_time.strftime('%Y-%m-%d %I:%M:%S %p EST')}")
+                    self.logger.info(f"📋 Reason: {reason}")
+                    self.logger.info(f"⭐ Priority run: {'Yes' if is_priority else 'No'}")
+                    self.logger.info(f"📈 Market hours: {'Yes' if self._is_market_hours_est(run_time) else 'No'}")
+                    
+                    # Run the signal check
+                    await self.signal_check_function(cycle_count, is_priority, reason)
+                    self._cached_next = None
+                    self._backoff = 1.0
+                    
+                    self.logger.info(f"✅ Signal check #{cycle_count} completed")
+                    
+                except asyncio.CancelledError:
+                    self.logger.info("⏹️ Scheduler cancelled")
                     break
-                
-                cycle_count += 1
-                reason = self.get_run_reason(run_time)
-                is_priority = run_time.minute in self.priority_run_minutes
-                
-                self.logger.info(f"\n🚀 Starting signal check #{cycle_count}")
-                self.logger.info(f"🕐 Run time: {run_time.strftime('%Y-%m-%d %I:%M:%S %p EST')}")
-                self.logger.info(f"📋 Reason: {reason}")
-                self.logger.info(f"⭐ Priority run: {'Yes' if is_priority else 'No'}")
-                self.logger.info(f"📈 Market hours: {'Yes' if self.is_market_hours(run_time) else 'No'}")
-                
-                # Run the signal check
-                await self.signal_check_function(cycle_count, is_priority, reason)
-                
-                self.logger.info(f"✅ Signal check #{cycle_count} completed")
-                
-            except asyncio.CancelledError:
-                self.logger.info("⏹️ Scheduler cancelled")
-                break
-            except Exception as e:
-                self.logger.error(f"❌ Error in scheduler: {e}")
-                # Wait a bit before retrying to avoid rapid failures
-                await asyncio.sleep(60)
+                except Exception as e:
+                    self.logger.error(f"❌ Error in scheduler: {e}")
+                    # Back off exponentially (capped) with jitter before retrying
+                    wait = min(self._backoff, MAX_BACKOFF_SECONDS)
+                    self._backoff = min(self._backoff * 2, MAX_BACKOFF_SECONDS)
+                    await asyncio.sleep(wait + random.uniform(0, wait * 0.1))
+        finally:
+            self._stopped.set()
     
     def start(self):
         """Start the scheduler"""
@@ -168,15 +264,17 @@ class SmartScheduler:
             return
         
         self.running = True
+        self._stopped.clear()
         self.task = asyncio.create_task(self.run_scheduler())
+        # Also covers a task cancelled before its first step, which skips the finally
+        self.task.add_done_callback(lambda _: self._stopped.set())
         self.logger.info("✅ Smart Scheduler started")
         
         # Show next few run times
-        next_runs = self.get_next_run_times(5)
+        next_runs = self.get_next_run_times(5, with_details=True)
         self.logger.info("📅 Next 5 scheduled runs:")
-        for i, run_time in enumerate(next_runs, 1):
-            reason = self.get_run_reason(run_time)
-            market_status = "📈 Market" if self.is_market_hours(run_time) else "🌙 After"
+        for i, (run_time, reason, _, is_market) in enumerate(next_runs, 1):
+            market_status = "📈 Market" if is_market else "🌙 After"
             self.logger.info(f"   {i}. {run_time.strftime('%I:%M %p EST')} - {reason} ({market_status})")
     
     def stop(self):
@@ -190,6 +288,15 @@ class SmartScheduler:
             self.task.cancel()
         self.logger.info("⏹️ Smart Scheduler stopped")
     
+    async def wait_stopped(self, timeout: float = 10) -> bool:
+        """Wait until the run loop has exited; returns False if it didn't within timeout"""
+        try:
+            await asyncio.wait_for(self._stopped.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            self.logger.warning(f"⚠️ Scheduler did not stop within {timeout}s")
+            return False
+    
     def is_running(self) -> bool:
         """Check if scheduler is running"""
         return self.running and self.task and not self.task.done()
@@ -197,34 +304,47 @@ class SmartScheduler:
     def get_status_info(self) -> dict:
         """Get detailed status information"""
         now = datetime.now(EST)
-        next_runs = self.get_next_run_times(3)
+        next_runs = self.get_next_run_times(3, with_details=True)
+        time_until_next = (timedelta(seconds=next_runs[0][0].timestamp() - now.timestamp())
+                           if next_runs else timedelta(seconds=300))
         
         return {
             'running': self.is_running(),
             'current_time': now.strftime('%Y-%m-%d %I:%M:%S %p EST'),
-            'is_market_hours': self.is_market_hours(now),
-            'next_run_time': next_runs[0].strftime('%I:%M:%S %p EST') if next_runs else 'Unknown',
-            'next_run_reason': self.get_run_reason(next_runs[0]) if next_runs else 'Unknown',
-            'time_until_next': str(self.get_time_until_next_run()).split('.')[0],  # Remove microseconds
+            'is_market_hours': self._is_market_hours_est(now),
+            'next_run_time': next_runs[0][0].strftime('%I:%M:%S %p EST') if next_runs else 'Unknown',
+            'next_run_reason': next_runs[0][1] if next_runs else 'Unknown',
+            'time_until_next': str(time_until_next).split('.')[0],  # Remove microseconds
             'upcoming_runs': [
                 {
                     'time': run_time.strftime('%I:%M %p EST'),
-                    'reason': self.get_run_reason(run_time),
-                    'is_market_hours': self.is_market_hours(run_time),
-                    'is_priority': run_time.minute in self.priority_run_minutes
+                    'reason': reason,
+                    'is_market_hours': is_market,
+                    'is_priority': is_priority
                 }
-                for run_time in next_runs
+                for run_time, reason, is_priority, is_market in next_runs
             ]
         }
 
+@lru_cache(maxsize=32)
+def _create_custom_schedule_cached(config_cls, market: tuple, after: tuple, priority: tuple) -> Mapping:
+    """Build a read-only schedule mapping; shared by every caller asking for the same schedule"""
+    return MappingProxyType({
+        'market_hours_schedule': market,
+        'after_hours_schedule': after,
+        'priority_minutes': priority,
+        'market_open': MappingProxyType({'hour': config_cls.MARKET_OPEN_HOUR, 'minute': config_cls.MARKET_OPEN_MINUTE}),
+        'market_close': MappingProxyType({'hour': config_cls.MARKET_CLOSE_HOUR, 'minute': 0})
+    })
+
 class SchedulerConfig:
     """Configuration for the smart scheduler"""
     
     # Default schedule: Run 4 times per hour during market hours
-    MARKET_HOURS_SCHEDULE = [2, 17, 32, 47]  # Minutes past the hour
+    MARKET_HOURS_SCHEDULE = (2, 17, 32, 47)  # Minutes past the hour
     
     # After hours: Only run twice per hour (at priority times)
-    AFTER_HOURS_SCHEDULE = [2, 32]  # Minutes past the hour
+    AFTER_HOURS_SCHEDULE = (2, 32)  # Minutes past the hour
     
     # Market hours (EST)
     MARKET_OPEN_HOUR = 9    # 9:30 AM
@@ -232,32 +352,32 @@ class SchedulerConfig:
     MARKET_CLOSE_HOUR = 16  # 4:00 PM
     
     # Priority run times (align with hourly candle closes)
-    PRIORITY_MINUTES = [2, 32]  # 2 minutes after hourly closes
+    PRIORITY_MINUTES = (2, 32)  # 2 minutes after hourly closes
     
     @classmethod
     def create_custom_schedule(cls, 
                              market_minutes: List[int] = None,
                              after_hours_minutes: List[int] = None,
-                             priority_minutes: List[int] = None) -> dict:
-        """Create a custom schedule configuration"""
-        return {
-            'market_hours_schedule': market_minutes or cls.MARKET_HOURS_SCHEDULE,
-            'after_hours_schedule': after_hours_minutes or cls.AFTER_HOURS_SCHEDULE,
-            'priority_minutes': priority_minutes or cls.PRIORITY_MINUTES,
-            'market_open': {'hour': cls.MARKET_OPEN_HOUR, 'minute': cls.MARKET_OPEN_MINUTE},
-            'market_close': {'hour': cls.MARKET_CLOSE_HOUR, 'minute': 0}
-        }
+                             priority_minutes: List[int] = None) -> Mapping:
+        """Create a custom schedule configuration (cached and read-only)"""
+        return _create_custom_schedule_cached(
+            cls,
+            tuple(market_minutes or cls.MARKET_HOURS_SCHEDULE),
+            tuple(after_hours_minutes or cls.AFTER_HOURS_SCHEDULE),
+            tuple(priority_minutes or cls.PRIORITY_MINUTES)
+        )
 
 # Convenience function for integration
 def create_smart_scheduler(signal_check_function: Callable, 
-                          custom_config: dict = None,
+                          custom_config: Optional[Mapping] = None,
                           logger: Optional[logging.Logger] = None) -> SmartScheduler:
     """Create a configured smart scheduler"""
     scheduler = SmartScheduler(signal_check_function, logger)
     
     if custom_config:
-        scheduler.run_at_minutes = custom_config.get('market_hours_schedule', scheduler.run_at_minutes)
-        scheduler.priority_run_minutes = custom_config.get('after_hours_schedule', scheduler.priority_run_minutes)
-        scheduler.priority_run_minutes = custom_config.get('priority_minutes', scheduler.priority_run_minutes)
+        scheduler.run_at_minutes = tuple(custom_config.get('market_hours_schedule', scheduler.run_at_minutes))
+        scheduler.after_hours_run_minutes = tuple(custom_config.get('after_hours_schedule', scheduler.after_hours_run_minutes))
+        scheduler.priority_run_minutes = frozenset(custom_config.get('priority_minutes', scheduler.priority_run_minutes))
+        scheduler.build_schedule()
     
     return scheduler 
\ No newline at end of file
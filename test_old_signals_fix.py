@@ -14,37 +14,42 @@ load_dotenv()
 
 async def test_old_signals_fix():
     """Test that old signals are properly blocked"""
+    # main() shares its pool; a standalone call sets one up itself and closes it
+    owns_pool = not db_manager.pool
     try:
-        await db_manager.initialize()
-        
         print("🧪 Testing Old Signals Fix")
         print("=" * 40)
         
+        if owns_pool and not await db_manager.initialize():
+            print("❌ Could not connect to the database")
+            return False
+        
         # Test cases with different signal ages
+        now = datetime.now()
         test_cases = [
             {
                 'name': 'Recent signal (30 minutes ago)',
-                'signal_date': (datetime.now() - timedelta(minutes=30)).strftime('%Y-%m-%d %H:%M:%S'),
+                'signal_date': (now - timedelta(minutes=30)).strftime('%Y-%m-%d %H:%M:%S'),
                 'should_be_blocked': False
             },
             {
                 'name': 'Old signal (2 days ago)',
-                'signal_date': (datetime.now() - timedelta(days=2)).strftime('%Y-%m-%d %H:%M:%S'),
+                'signal_date': (now - timedelta(days=2)).strftime('%Y-%m-%d %H:%M:%S'),
                 'should_be_blocked': True
             },
             {
                 'name': 'Very old signal (1 week ago)',
-                'signal_date': (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d %H:%M:%S'),
+                'signal_date': (now - timedelta(days=7)).strftime('%Y-%m-%d %H:%M:%S'),
                 'should_be_blocked': True
             },
             {
                 'name': 'Edge case signal (23 hours ago)',
-                'signal_date': (datetime.now() - timedelta(hours=23)).strftime('%Y-%m-%d %H:%M:%S'),
+                'signal_date': (now - timedelta(hours=23)).strftime('%Y-%m-%d %H:%M:%S'),
                 'should_be_blocked': False
             },
             {
                 'name': 'Edge case signal (25 hours ago)',
-                'signal_date': (datetime.now() - timedelta(hours=25)).strftime('%Y-%m-%d %H:%M:%S'),
+                'signal_date': (now - timedelta(hours=25)).strftime('%Y-%m-%d %H:%M:%S'),
                 'should_be_blocked': True
             }
         ]
@@ -90,7 +95,7 @@ async def test_old_signals_fix():
         traceback.print_exc()
         return False
     finally:
-        if hasattr(db_manager, 'pool') and db_manager.pool:
+        if owns_pool and db_manager.pool:
             await db_manager.pool.close()
 
 async def test_new_timeframe_scenario():
@@ -103,12 +108,13 @@ async def test_new_timeframe_scenario():
     print()
     
     # Simulate historical signals that might be returned
+    now = datetime.now()
     historical_signals = [
-        {'date': (datetime.now() - timedelta(days=5)).strftime('%Y-%m-%d %H:%M:%S'), 'type': 'WT Buy Signal'},
-        {'date': (datetime.now() - timedelta(days=3)).strftime('%Y-%m-%d %H:%M:%S'), 'type': 'RSI3M3 Bullish Entry'},
-        {'date': (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d %H:%M:%S'), 'type': 'Bullish Divergence'},
-        {'date': (datetime.now() - timedelta(hours=12)).strftime('%Y-%m-%d %H:%M:%S'), 'type': 'Fast Money Buy'},
-        {'date': (datetime.now() - timedelta(hours=2)).strftime('%Y-%m-%d %H:%M:%S'), 'type': 'WT Gold Buy Signal'},
+        {'date': (now - timedelta(days=5)).strftime('%Y-%m-%d %H:%M:%S'), 'type': 'WT Buy Signal'},
+        {'date': (now - timedelta(days=3)).strftime('%Y-%m-%d %H:%M:%S'), 'type': 'RSI3M3 Bullish Entry'},
+        {'date': (now - timedelta(days=1)).strftime('%Y-%m-%d %H:%M:%S'), 'type': 'Bullish Divergence'},
+        {'date': (now - timedelta(hours=12)).strftime('%Y-%m-%d %H:%M:%S'), 'type': 'Fast Money Buy'},
+        {'date': (now - timedelta(hours=2)).strftime('%Y-%m-%d %H:%M:%S'), 'type': 'WT Gold Buy Signal'},
     ]
     
     print("Historical signals found:")
@@ -117,7 +123,7 @@ async def test_new_timeframe_scenario():
     
     for i, signal in enumerate(historical_signals, 1):
         signal_datetime = datetime.strptime(signal['date'], '%Y-%m-%d %H:%M:%S')
-        age_hours = (datetime.now() - signal_datetime).total_seconds() / 3600
+        age_hours = (now - signal_datetime).total_seconds() / 3600
         
         # Test if this signal would be blocked
         is_blocked = await db_manager.check_duplicate_notification(
@@ -150,11 +156,20 @@ async def main():
     print("Testing the simple date check fix...")
     print()
     
-    # Test 1: Basic functionality
-    test1_passed = await test_old_signals_fix()
-    
-    # Test 2: New timeframe scenario
-    await test_new_timeframe_scenario()
+    # One pool shared by both tests
+    test1_passed = False
+    try:
+        if not await db_manager.initialize():
+            print("❌ Could not connect to the database - skipping tests")
+        else:
+            # Test 1: Basic functionality
+            test1_passed = await test_old_signals_fix()
+            
+            # Test 2: New timeframe scenario
+            await test_new_timeframe_scenario()
+    finally:
+        if hasattr(db_manager, 'pool') and db_manager.pool:
+            await db_manager.pool.close()
     
     print("\n" + "=" * 50)
     if test1_passed:
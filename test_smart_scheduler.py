@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the smart scheduler's upcoming run times
+==============================================================
+
+The scheduler looks run times up from precomputed day tables. This script
+checks get_next_run_times against the original hour-by-hour walk for a few
+fixed EST instants: market open, the 9:30 bell, the 4:00 close, a weekend
+and both DST transitions.
+"""
+
+import sys
+import os
+from datetime import datetime, timedelta, timezone
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import smart_scheduler
+from smart_scheduler import SmartScheduler, SchedulerConfig, EST
+
+UTC = timezone.utc
+
+def reference_next_run_times(now: datetime, count: int) -> list:
+    """The original scheduler walk: step through the next 24 real hours, picking
+    every configured minute in market hours and the after-hours minutes otherwise"""
+    current_hour = now.replace(minute=0, second=0, microsecond=0)
+    run_times = []
+
+    for hour_offset in range(24):
+        check_time = (current_hour.astimezone(UTC) + timedelta(hours=hour_offset)).astimezone(EST)
+        is_market = (check_time.weekday() < 5
+                     and not (check_time.hour < 9 or (check_time.hour == 9 and check_time.minute < 30))
+                     and check_time.hour < 16)
+        minutes_to_run = SchedulerConfig.MARKET_HOURS_SCHEDULE if is_market else SchedulerConfig.AFTER_HOURS_SCHEDULE
+
+        for minute in minutes_to_run:
+            run_time = check_time.replace(minute=minute)
+            if run_time.timestamp() > now.timestamp():
+                run_times.append(run_time)
+            if len(run_times) >= count:
+                return run_times
+
+    return run_times
+
+def scheduled_run_times_at(now: datetime, count: int) -> list:
+    """get_next_run_times on a fresh scheduler with the clock frozen at now"""
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return now.astimezone(tz) if tz else now
+
+    real_datetime = smart_scheduler.datetime
+    smart_scheduler.datetime = FrozenDatetime
+    try:
+        return SmartScheduler(lambda *args: None).get_next_run_times(count)
+    finally:
+        smart_scheduler.datetime = real_datetime
+
+def test_next_run_times_match_reference():
+    """Test upcoming runs against the original walk at fixed instants"""
+    print("🧪 Testing Smart Scheduler Run Times")
+    print("=" * 40)
+
+    # Wall times are EST; fold=1 picks the second pass of the fall-back hour
+    test_cases = [
+        ("Monday 9:00 (pre-open)", datetime(2025, 3, 10, 9, 0, tzinfo=EST)),
+        ("Monday 9:30 (open)", datetime(2025, 3, 10, 9, 30, tzinfo=EST)),
+        ("Monday 16:00 (close)", datetime(2025, 3, 10, 16, 0, tzinfo=EST)),
+        ("Friday 15:50 into the weekend", datetime(2025, 3, 7, 15, 50, tzinfo=EST)),
+        ("Saturday noon", datetime(2025, 3, 8, 12, 0, tzinfo=EST)),
+        ("Spring forward 1:40", datetime(2025, 3, 9, 1, 40, tzinfo=EST)),
+        ("Fall back 0:50", datetime(2025, 11, 2, 0, 50, tzinfo=EST)),
+        ("Fall back 1:10 (second pass)", datetime(2025, 11, 2, 1, 10, fold=1, tzinfo=EST)),
+    ]
+
+    all_passed = True
+    for name, now in test_cases:
+        expected = [run.timestamp() for run in reference_next_run_times(now, 8)]
+        actual = [run.timestamp() for run in scheduled_run_times_at(now, 8)]
+
+        if actual == expected:
+            print(f"✅ {name}")
+        else:
+            print(f"❌ {name}")
+            print(f"   Expected: {[datetime.fromtimestamp(ts, UTC).strftime('%a %H:%M UTC') for ts in expected]}")
+            print(f"   Got:      {[datetime.fromtimestamp(ts, UTC).strftime('%a %H:%M UTC') for ts in actual]}")
+            all_passed = False
+
+    return all_passed
+
+def main():
+    """Run all tests"""
+    all_passed = test_next_run_times_match_reference()
+
+    print("\n" + "=" * 40)
+    if all_passed:
+        print("🎉 ALL TESTS PASSED!")
+    else:
+        print("❌ SOME TESTS FAILED!")
+
+    return all_passed
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
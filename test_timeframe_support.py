@@ -116,6 +116,84 @@ def test_priority_manager():
         print(f"❌ Error testing priority manager: {e}")
         return False
 
+def test_signal_cache_copies():
+    """Test that cached signal timelines are handed out as copies"""
+    print("\n🧪 Testing Signal Cache Copies")
+    print("=" * 30)
+    
+    try:
+        import time
+        from signal_notifier import SignalNotifier, _signal_cache, clear_signal_cache, SIGNAL_CACHE_TTL
+        
+        # Mock bot object
+        class MockBot:
+            pass
+        
+        notifier = SignalNotifier(MockBot())
+        
+        clear_signal_cache()
+        cached = [{'type': 'WT Buy Signal', 'date': '2024-01-02 10:00:00'}]
+        _signal_cache[('AAPL', '1d', int(time.time() // SIGNAL_CACHE_TTL))] = cached
+        
+        first = notifier.fetch_signal_timeline('AAPL', '1d')
+        first[0]['age_hours'] = 1.0
+        second = notifier.fetch_signal_timeline('AAPL', '1d')
+        clear_signal_cache()
+        
+        if first[0] is cached[0] or second[0] is cached[0]:
+            print("❌ Cache hit returned the cached signal dicts themselves")
+            return False
+        if 'age_hours' in cached[0] or 'age_hours' in second[0]:
+            print("❌ A caller's age_hours leaked into the cached signals")
+            return False
+        
+        print("✅ Cache hits return independent copies of the cached signals!")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error testing signal cache copies: {e}")
+        return False
+
+async def test_prefetch_survives_failed_pair():
+    """Test that one failing prefetch doesn't stop the other pairs"""
+    print("\n🧪 Testing Prefetch Failure Isolation")
+    print("=" * 30)
+    
+    try:
+        import signal_notifier
+        from signal_notifier import SignalNotifier
+        
+        # Mock bot object
+        class MockBot:
+            pass
+        
+        notifier = SignalNotifier(MockBot())
+        
+        # One pair fails with a non-requests error, the others return a stand-in response
+        def fake_get(url, params=None, timeout=None):
+            if params['ticker'] == 'FAIL':
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            return ('response', params['ticker'], params['interval'])
+        
+        signal_notifier.api_session.get = fake_get
+        try:
+            await notifier.prefetch_signal_timelines([('AAPL', '1d'), ('FAIL', '1d'), ('TSLA', '1h')])
+        finally:
+            del signal_notifier.api_session.get
+        
+        prefetched = set(notifier._prefetched)
+        notifier.clear_prefetched()
+        if prefetched != {('AAPL', '1d'), ('TSLA', '1h')}:
+            print(f"❌ Expected AAPL and TSLA to be prefetched, got: {sorted(prefetched)}")
+            return False
+        
+        print("✅ A failing pair is skipped and the other pairs are still prefetched!")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error testing prefetch failure isolation: {e}")
+        return False
+
 async def main():
     """Run all tests"""
     print("🚀 Discord Bot Timeframe Support Verification")
@@ -124,7 +202,9 @@ async def main():
     tests = [
         ("Discord Bot Config", test_timeframe_support()),
         ("Period Mapping", test_period_mapping()),
-        ("Priority Manager", test_priority_manager())
+        ("Priority Manager", test_priority_manager()),
+        ("Signal Cache Copies", test_signal_cache_copies()),
+        ("Prefetch Failure Isolation", test_prefetch_survives_failed_pair())
     ]
     
     all_passed = True